@@ -1,12 +1,12 @@
 # import libs
 import asyncio
-import os
 import logging
 from mozichem_ai.agents import create_agent
+from mozichem_ai._env import load_env_once
 from mozichem_ai.memory import generate_thread
+from mozichem_ai.utils import install_uvloop
 from langchain_core.runnables import RunnableConfig
-# python dot env
-from dotenv import load_dotenv
+from langchain_core.messages import AIMessage, ToolMessage
 from rich.console import Console
 from rich.panel import Panel
 
@@ -14,20 +14,7 @@ from rich.panel import Panel
 logger = logging.getLogger(__name__)
 
 # SECTION: load environment variables
-load_dotenv()
-
-# langchain
-env_val = os.getenv('LANGCHAIN_API_KEY')
-if env_val is not None:
-    os.environ['LANGCHAIN_API_KEY'] = env_val
-env_val = os.getenv('LANGCHAIN_TRACING_V2')
-if env_val is not None:
-    os.environ['LANGCHAIN_TRACING_V2'] = env_val
-
-# open ai
-env_val = os.getenv('OPENAI_API_KEY')
-if env_val is not None:
-    os.environ['OPENAI_API_KEY'] = env_val
+load_env_once()
 
 # SECTION: inputs
 # NOTE: model provider
@@ -90,18 +77,30 @@ async def run_agent():
                 )
                 break
 
-            agent_response = await agent.ainvoke(
+            # NOTE: stream tokens as they arrive
+            response_text = ""
+            async for chunk, metadata in agent.astream(
                 {"messages": user_input},
                 config=RunnableConfig(
                     configurable={
                         "thread_id": thread_id
                     }
-                )
-            )
+                ),
+                stream_mode="messages"
+            ):
+                # tool results start a new assistant reply
+                if isinstance(chunk, ToolMessage):
+                    response_text = ""
+                    console.print()
+                    continue
+                if isinstance(chunk, AIMessage) and isinstance(chunk.content, str):
+                    response_text += chunk.content
+                    console.print(chunk.content, end="")
+            console.print()
 
             console.print(
                 Panel(
-                    agent_response['messages'][-1].content,
+                    response_text,
                     title="Agent Response",
                     style="white"
                 )
@@ -110,4 +109,6 @@ async def run_agent():
         logger.error(f"Error running agent: {e}")
 
 if __name__ == "__main__":
+    # NOTE: run on uvloop when installed (pip install mozichem-ai[speed])
+    install_uvloop()
     asyncio.run(run_agent())
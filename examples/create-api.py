@@ -1,31 +1,16 @@
 # import libs
 import uvicorn
 import asyncio
-import os
 import logging
-# python dot env
-from dotenv import load_dotenv
 # local
 from mozichem_ai.api import create_api
+from mozichem_ai._env import load_env_once
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
 
 # SECTION: load environment variables
-load_dotenv()
-
-# langchain
-env_val = os.getenv('LANGCHAIN_API_KEY')
-if env_val is not None:
-    os.environ['LANGCHAIN_API_KEY'] = env_val
-env_val = os.getenv('LANGCHAIN_TRACING_V2')
-if env_val is not None:
-    os.environ['LANGCHAIN_TRACING_V2'] = env_val
-
-# open ai
-env_val = os.getenv('OPENAI_API_KEY')
-if env_val is not None:
-    os.environ['OPENAI_API_KEY'] = env_val
+load_env_once()
 
 # SECTION: inputs
 # NOTE: model provider
@@ -1,34 +1,14 @@
 # import libs
-import os
 import logging
-# python dot env
-from dotenv import load_dotenv
 # local
 from mozichem_ai import mozichem_chat
+from mozichem_ai._env import load_env_once
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
 
 # SECTION: load environment variables
-load_dotenv()
-
-# langchain
-env_val = os.getenv('LANGCHAIN_API_KEY')
-if env_val is not None:
-    os.environ['LANGCHAIN_API_KEY'] = env_val
-env_val = os.getenv('LANGCHAIN_TRACING_V2')
-if env_val is not None:
-    os.environ['LANGCHAIN_TRACING_V2'] = env_val
-
-# open ai
-env_val = os.getenv('OPENAI_API_KEY')
-if env_val is not None:
-    os.environ['OPENAI_API_KEY'] = env_val
-
-# tavily
-env_val = os.getenv('TAVILY_API_KEY')
-if env_val is not None:
-    os.environ['TAVILY_API_KEY'] = env_val
+ENV = load_env_once()
 
 # SECTION: inputs
 # NOTE: model provider
@@ -62,7 +42,7 @@ mcp_source = {
         "args": [
             "-y",
             "mcp-remote",
-            f"https://mcp.tavily.com/mcp/?tavilyApiKey={os.getenv('TAVILY_API_KEY')}"
+            f"https://mcp.tavily.com/mcp/?tavilyApiKey={ENV.get('TAVILY_API_KEY')}"
         ],
         "transport": "stdio",
         "env": {}
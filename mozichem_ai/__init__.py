@@ -1,9 +1,20 @@
 from .config import __author__, __version__, __author_email__
-from .app import mozichem_chat
 
 __all__ = [
     "__author__",
     "__version__",
     "__author_email__",
-    "mozichem_chat"
+    "mozichem_chat",
+    "run_api"
 ]
+
+
+def __getattr__(name):
+    # NOTE: lazy import, the api stack is loaded on first use
+    if name == "mozichem_chat":
+        from .app import mozichem_chat
+        return mozichem_chat
+    if name == "run_api":
+        from .app import run_api
+        return run_api
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,32 @@
+# import libs
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+# python dot env
+from dotenv import load_dotenv
+
+# NOTE: environment variables used by the agents and MCP servers
+ENV_KEYS = (
+    "LANGCHAIN_API_KEY",
+    "LANGCHAIN_TRACING_V2",
+    "OPENAI_API_KEY",
+    "TAVILY_API_KEY",
+)
+
+
+@lru_cache(maxsize=1)
+def load_env_once() -> Mapping[str, str]:
+    """
+    Load the `.env` file once per process.
+
+    Returns
+    -------
+    Mapping[str, str]
+        A read-only snapshot of the known environment variables found after
+        loading the `.env` file.
+    """
+    load_dotenv()
+    return MappingProxyType(
+        {k: os.environ[k] for k in ENV_KEYS if k in os.environ}
+    )
@@ -1,9 +1,20 @@
-from .mozichem_agent import MoziChemAgent
-from .mcp_manager import MCPManager
-from .main import create_agent
-
 __all__ = [
     "MoziChemAgent",
     "MCPManager",
     "create_agent"
 ]
+
+
+def __getattr__(name):
+    # NOTE: lazy imports, langchain/langgraph are loaded on first use
+    if name == "MoziChemAgent":
+        from .mozichem_agent import MoziChemAgent
+        return MoziChemAgent
+    if name == "MCPManager":
+        from .mcp_manager import MCPManager
+        return MCPManager
+    if name == "create_agent":
+        from .main import create_agent
+        return create_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -0,0 +1,112 @@
+# import libs
+import os
+import asyncio
+import logging
+import weakref
+from typing import Optional
+import httpx
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: connection pool settings
+HTTP2_ENV = "MOZICHEM_HTTP2"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_SSE_READ_TIMEOUT = 300.0
+POOL_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=30
+)
+
+# NOTE: shared transports (connection pools), one per event loop since
+# pooled connections cannot move between loops
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# NOTE: shared client for LLM providers
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    '''
+    Transport proxy that sends requests through the shared connection pool
+    of the running event loop, and keeps it open when a client using it is
+    closed.
+    '''
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request
+    ) -> httpx.Response:
+        return await get_shared_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # NOTE: the shared pool lives as long as its event loop
+        pass
+
+
+def get_shared_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Return the pooled transport of the running event loop, created on first
+    use.
+    """
+    loop = asyncio.get_running_loop()
+    transport = _transports.get(loop)
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=POOL_LIMITS,
+            http2=os.getenv(HTTP2_ENV, "0") == "1"
+        )
+        _transports[loop] = transport
+    return transport
+
+
+def shared_httpx_client_factory(
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None
+) -> httpx.AsyncClient:
+    """
+    Create an httpx client for a streamable-HTTP MCP session that uses the
+    shared connection pool.
+
+    Parameters
+    ----------
+    headers : dict[str, str], optional
+        Headers sent with every request.
+    timeout : httpx.Timeout, optional
+        Request timeout, by default 30s (300s read for SSE streams).
+    auth : httpx.Auth, optional
+        Authentication handler.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        The client, closing it leaves the shared pool open.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(
+            DEFAULT_TIMEOUT,
+            read=DEFAULT_SSE_READ_TIMEOUT
+        ),
+        auth=auth,
+        follow_redirects=True,
+        transport=_SharedTransport()
+    )
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide httpx client for LLM provider SDKs, backed by the
+    shared connection pool.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            follow_redirects=True,
+            transport=_SharedTransport()
+        )
+    return _async_client
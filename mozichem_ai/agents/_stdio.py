@@ -0,0 +1,171 @@
+# import libs
+import os
+import asyncio
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING
+)
+import orjson
+from langchain_core.tools import BaseTool
+
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: keep stdio MCP servers running between agent builds
+PERSISTENT_STDIO_ENV = "MOZICHEM_PERSISTENT_STDIO"
+
+
+def persistent_stdio_enabled() -> bool:
+    """
+    Check whether persistent stdio MCP sessions are enabled through the
+    environment (`MOZICHEM_PERSISTENT_STDIO=1`).
+    """
+    return os.getenv(PERSISTENT_STDIO_ENV, "0") == "1"
+
+
+class PersistentStdioSession:
+    '''
+    A stdio MCP session kept open by a background task, so the server
+    process is spawned once and its tools reuse the same session.
+    '''
+
+    def __init__(
+        self,
+        client: "MultiServerMCPClient",
+        server_name: str
+    ):
+        # NOTE: set attributes
+        self.client = client
+        self.server_name = server_name
+        self.tools: List[BaseTool] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Future] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the session is open on the running event loop."""
+        return (
+            self._task is not None and
+            not self._task.done() and
+            self._loop is asyncio.get_running_loop()
+        )
+
+    async def start(self) -> List[BaseTool]:
+        """Open the session and load its tools."""
+        self._loop = asyncio.get_running_loop()
+        self._ready = self._loop.create_future()
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        await self._ready
+        return self.tools
+
+    async def _run(self) -> None:
+        # NOTE: the session is entered and exited in this task
+        from langchain_mcp_adapters.tools import load_mcp_tools
+
+        try:
+            async with self.client.session(self.server_name) as session:
+                self.tools = await load_mcp_tools(session)
+                self._ready.set_result(None)
+                logger.info(
+                    "Persistent stdio MCP session started: %s", self.server_name)
+                await self._stop.wait()
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            else:
+                logger.error(
+                    "Persistent stdio MCP session %s closed: %s", self.server_name, e)
+
+    async def close(self) -> None:
+        """Close the session and stop the server process."""
+        if self._task is None or self._task.done():
+            return
+        self._stop.set()
+        await self._task
+
+
+# NOTE: persistent sessions, keyed by the stdio connection
+_STDIO_POOL: Dict[str, PersistentStdioSession] = {}
+# NOTE: session starts in flight, concurrent builds for a server share one
+_STDIO_STARTS: Dict[str, "asyncio.Future[PersistentStdioSession]"] = {}
+
+
+async def _start_session(
+    key: str,
+    client: "MultiServerMCPClient",
+    server_name: str
+) -> PersistentStdioSession:
+    """
+    Start a persistent session and add it to the pool under key.
+    """
+    session = PersistentStdioSession(client, server_name)
+    await session.start()
+    _STDIO_POOL[key] = session
+    return session
+
+
+async def get_stdio_tools(
+    client: "MultiServerMCPClient",
+    server_name: str,
+    connection: Dict[str, Any]
+) -> List[BaseTool]:
+    """
+    Return the tools of a stdio MCP server from its persistent session,
+    starting the session if needed.
+
+    Parameters
+    ----------
+    client : MultiServerMCPClient
+        The client holding the server connection.
+    server_name : str
+        The name of the server in the client.
+    connection : Dict[str, Any]
+        The stdio connection config, used as the pool key.
+
+    Returns
+    -------
+    List[BaseTool]
+        The server tools.
+    """
+    key = orjson.dumps(connection, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    session = _STDIO_POOL.get(key)
+    if session is not None and session.alive:
+        return session.tools
+
+    # NOTE: single-flight, join the start in flight for the same server
+    start = _STDIO_STARTS.get(key)
+    if start is None or start.get_loop() is not asyncio.get_running_loop():
+        start = asyncio.ensure_future(
+            _start_session(key, client, server_name))
+        _STDIO_STARTS[key] = start
+        start.add_done_callback(
+            lambda f: _STDIO_STARTS.pop(key, None)
+            if _STDIO_STARTS.get(key) is f else None
+        )
+    # NOTE: a cancelled build does not cancel the shared start
+    session = await asyncio.shield(start)
+    return session.tools
+
+
+async def close_stdio_sessions() -> None:
+    """
+    Close all persistent stdio MCP sessions (call on application shutdown).
+    """
+    sessions = list(_STDIO_POOL.values())
+    _STDIO_POOL.clear()
+    for session in sessions:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.error(
+                "Failed to close stdio MCP session %s: %s", session.server_name, e)
@@ -1,16 +1,20 @@
 # import libs
+from __future__ import annotations
 import logging
 from typing import (
     Dict,
     List,
     Union,
-    Optional
+    Optional,
+    TYPE_CHECKING
 )
 from pathlib import Path
-from langgraph.graph.state import CompiledStateGraph
 # local
 from .mozichem_agent import MoziChemAgent
 
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
 # NOTE: logger
 logger = logging.getLogger(__name__)
 
@@ -51,28 +55,27 @@ async def create_agent(
         Whether to enable memory mode for the agent, by default False.
     kwargs : dict
         Additional keyword arguments for future extensions.
+        - arithmetic_shortcut: bool, optional
+            Answer pure `a + b` / `a * b` messages without the LLM (the agent
+            prompt and tools are skipped), by default False.
 
     Returns
     -------
     agent: CompiledStateGraph
         The compiled state graph of the agent.
     """
-    try:
-        # SECTION: create MoziChemAgent
-        MoziChemAgent_ = MoziChemAgent(
-            model_provider,
-            model_name,
-            agent_name,
-            agent_prompt,
-            mcp_source,
-            memory_mode,
-            **kwargs
-        )
+    # SECTION: create MoziChemAgent
+    MoziChemAgent_ = MoziChemAgent(
+        model_provider,
+        model_name,
+        agent_name,
+        agent_prompt,
+        mcp_source,
+        memory_mode,
+        **kwargs
+    )
 
-        # SECTION: initialize the agent
-        agent = await MoziChemAgent_.build_agent()
+    # SECTION: initialize the agent
+    agent = await MoziChemAgent_.build_agent()
 
-        return agent
-    except Exception as e:
-        logger.error(f"Failed to create agent: {e}")
-        raise RuntimeError(f"Failed to create agent: {e}") from e
+    return agent
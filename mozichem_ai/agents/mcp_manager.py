@@ -1,25 +1,96 @@
 # import libs
+import copy
 import logging
+from functools import lru_cache
 from typing import (
     Dict,
     Union,
-    Any
+    Any,
+    Tuple
 )
 from pathlib import Path
+import orjson
 # local
-from ..models import stdioMCP, streamableHttpMCP
+from ..models import stdioMCP, streamableHttpMCP, MCP_CONFIG_ADAPTER
 from mozichem_ai.utils import load_yaml_file
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
 
+# NOTE: validated mcp configurations as (name, config) pairs
+MCPConfigs = Tuple[Tuple[str, Union[stdioMCP, streamableHttpMCP]], ...]
+# NOTE: (stdio, streamable_http) connection dicts for MultiServerMCPClient
+MCPDicts = Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]
+
+
+def _dumps_mcp(mcp: Dict[str, Any]) -> bytes:
+    '''
+    Serialize MCP configurations to canonical (sorted keys) JSON bytes.
+    '''
+    return orjson.dumps(
+        mcp,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+
+
+@lru_cache(maxsize=32)
+def _config_mcp_from_payload(payload: bytes) -> MCPConfigs:
+    '''
+    Validate the MCP configurations serialized in payload (cached).
+    '''
+    return tuple(MCP_CONFIG_ADAPTER.validate_json(payload).items())
+
+
+@lru_cache(maxsize=32)
+def _config_mcp_from_file(path: str, mtime_ns: int, size: int) -> MCPConfigs:
+    '''
+    Load and validate the MCP configurations of a YAML file (cached on
+    path, modification time and size).
+    '''
+    mcp = load_yaml_file(path)
+    return _config_mcp_from_payload(_dumps_mcp(mcp))
+
+
+def _split_mcp_configs(mcp_configs: MCPConfigs) -> MCPDicts:
+    '''
+    Dump the MCP configurations into stdio and streamable http dicts in a
+    single pass.
+    '''
+    stdio_dict: Dict[str, Dict[str, Any]] = {}
+    streamable_http_dict: Dict[str, Dict[str, Any]] = {}
+    targets = {
+        stdioMCP: stdio_dict,
+        streamableHttpMCP: streamable_http_dict
+    }
+    for mcp_name, mcp_config in mcp_configs:
+        targets[type(mcp_config)][mcp_name] = mcp_config.model_dump()
+    return stdio_dict, streamable_http_dict
+
+
+@lru_cache(maxsize=32)
+def _mcp_dicts_from_payload(payload: bytes) -> MCPDicts:
+    '''
+    Return the connection dicts of the MCP configurations in payload (cached).
+    '''
+    return _split_mcp_configs(_config_mcp_from_payload(payload))
+
+
+@lru_cache(maxsize=32)
+def _mcp_dicts_from_file(path: str, mtime_ns: int, size: int) -> MCPDicts:
+    '''
+    Return the connection dicts of the MCP configurations of a YAML file
+    (cached on path, modification time and size).
+    '''
+    return _split_mcp_configs(_config_mcp_from_file(path, mtime_ns, size))
+
 
 class MCPManager:
     '''
     MCPManager class for managing MCP configurations.
     '''
 
-    def __init__(self, mcp: dict | str | Path):
+    def __init__(self, mcp: dict | str | Path, trusted: bool = False):
         '''
         Initialize the MCPManager with a configuration.
 
@@ -27,9 +98,14 @@ class MCPManager:
         ----------
         mcp : dict
             The configuration dictionary for the MCPs.
+        trusted : bool, optional
+            Whether a dict configuration was already validated (e.g., dumped
+            from stdioMCP/streamableHttpMCP), so it is used as is, by default
+            False.
         '''
         # NOTE: set attributes
         self.mcp = mcp
+        self.trusted = trusted
 
     def _load_mcp_from_yaml(
         self,
@@ -48,13 +124,7 @@ class MCPManager:
         dict
             A dictionary containing the MCP configurations.
         """
-        try:
-            return load_yaml_file(mcp_source)
-        except Exception as e:
-            logger.error(
-                f"Failed to load MCP configurations from {mcp_source}: {e}")
-            raise RuntimeError(
-                f"Failed to load MCP configurations: {e}") from e
+        return load_yaml_file(mcp_source)
 
     def config_mcp(
         self
@@ -74,25 +144,73 @@ class MCPManager:
                 logger.warning("No MCP configurations provided.")
                 return {}
 
+            # SECTION: create MCP configurations (memoized)
             # check if mcp is a string or Path
             if isinstance(self.mcp, (str, Path)):
                 # load MCP configurations from YAML file
-                self.mcp = self._load_mcp_from_yaml(self.mcp)
-
-            # SECTION: create MCP configurations
-            # initialize an empty dictionary to hold MCP configurations
-            mcp_dict = {}
-
-            # iterate through the MCP configurations
-            for mcp_name, mcp_config in self.mcp.items():
-                if mcp_config['transport'] == 'stdio':
-                    mcp_dict[mcp_name] = stdioMCP(**mcp_config)
-                elif mcp_config['transport'] == 'streamable_http':
-                    mcp_dict[mcp_name] = streamableHttpMCP(**mcp_config)
-                else:
-                    raise ValueError(
-                        f"Unsupported transport type: {mcp_config['transport']}")
-            return mcp_dict
-        except Exception as e:
-            logger.error(f"Failed to get MCP configurations: {e}")
+                path = Path(self.mcp).resolve()
+                stat = path.stat()
+                mcp_configs = _config_mcp_from_file(
+                    str(path),
+                    stat.st_mtime_ns,
+                    stat.st_size
+                )
+            else:
+                mcp_configs = _config_mcp_from_payload(
+                    _dumps_mcp(self.mcp)
+                )
+
+            # NOTE: copy the cached models
+            return {
+                mcp_name: mcp_config.model_copy(deep=True)
+                for mcp_name, mcp_config in mcp_configs
+            }
+        except (KeyError, ValueError) as e:
+            logger.error("Failed to get MCP configurations: %s", e)
+            raise RuntimeError(f"Failed to get MCP configurations: {e}") from e
+
+    def config_mcp_dicts(self) -> MCPDicts:
+        '''
+        Configure and return the MCP connection dicts for MultiServerMCPClient.
+
+        Returns
+        -------
+        Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]
+            The stdio and streamable http connection dicts.
+        '''
+        try:
+            # SECTION: checking inputs
+            if not self.mcp:
+                logger.warning("No MCP configurations provided.")
+                return {}, {}
+
+            # SECTION: trusted configurations, split by transport
+            if self.trusted and isinstance(self.mcp, dict):
+                stdio_dict: Dict[str, Dict[str, Any]] = {}
+                streamable_http_dict: Dict[str, Dict[str, Any]] = {}
+                targets = {
+                    'stdio': stdio_dict,
+                    'streamable_http': streamable_http_dict
+                }
+                for mcp_name, mcp_config in self.mcp.items():
+                    targets[mcp_config['transport']][mcp_name] = copy.deepcopy(
+                        mcp_config)
+                return stdio_dict, streamable_http_dict
+
+            # SECTION: dump MCP configurations (memoized)
+            if isinstance(self.mcp, (str, Path)):
+                path = Path(self.mcp).resolve()
+                stat = path.stat()
+                mcp_dicts = _mcp_dicts_from_file(
+                    str(path),
+                    stat.st_mtime_ns,
+                    stat.st_size
+                )
+            else:
+                mcp_dicts = _mcp_dicts_from_payload(_dumps_mcp(self.mcp))
+
+            # NOTE: copy the cached dicts
+            return copy.deepcopy(mcp_dicts)
+        except (KeyError, ValueError) as e:
+            logger.error("Failed to get MCP configurations: %s", e)
             raise RuntimeError(f"Failed to get MCP configurations: {e}") from e
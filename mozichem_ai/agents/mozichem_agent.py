@@ -1,25 +1,55 @@
 # import libs
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import (
     Dict,
     Union,
     List,
     Any,
-    Optional
+    Optional,
+    Tuple,
+    TYPE_CHECKING
 )
 from pathlib import Path
-from langchain.chat_models import init_chat_model
-from langgraph.prebuilt import create_react_agent
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.tools import tool
+import orjson
+from langchain_core.caches import BaseCache
+from langchain_core.tools import tool, BaseTool
+from langchain_core.runnables import RunnableConfig
 # local
-from mozichem_ai.models import stdioMCP, streamableHttpMCP
 from mozichem_ai.agents.mcp_manager import MCPManager
+from mozichem_ai.agents._http import (
+    shared_httpx_client_factory,
+    get_shared_async_client
+)
+from mozichem_ai.agents._stdio import get_stdio_tools, persistent_stdio_enabled
+from mozichem_ai.llms import get_llm_cache, llm_cache_enabled
+from mozichem_ai.llms.llm_models import get_chat_model
+from mozichem_ai.memory import generate_thread_id
+
+# NOTE: heavy imports are deferred to the methods that use them
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from langgraph.graph.state import CompiledStateGraph
+    from langchain_core.language_models import BaseChatModel
+    from mozichem_ai.memory.bounded_saver import BoundedMemorySaver
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
 
+# NOTE: shared mcp clients and their tools, keyed by the mcp feed signature
+_CLIENT_CACHE: Dict[
+    str,
+    Tuple["MultiServerMCPClient", Optional[List[BaseTool]]]
+] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# NOTE: compiled agent graphs (without checkpointer), keyed by signature
+_GRAPH_CACHE: "OrderedDict[str, CompiledStateGraph]" = OrderedDict()
+_GRAPH_CACHE_SIZE = 16
+
 # SECTION: tools
 
 
@@ -52,8 +82,18 @@ class MoziChemAgent:
     mcp_stdio_dict: Dict[str, Any] = {}
     # mcp streamable http dict
     mcp_streamable_http_dict: Dict[str, Any] = {}
+    # chat model
+    llm: Optional["BaseChatModel"] = None
     # client
-    client: Optional[MultiServerMCPClient] = None
+    client: Optional["MultiServerMCPClient"] = None
+    # client cache key
+    _client_key: Optional[str] = None
+    # client tools of this instance
+    _tools_cache: Optional[List[BaseTool]] = None
+    # compiled agent
+    _compiled: Optional["CompiledStateGraph"] = None
+    # agent memory (checkpointer)
+    _memory: Optional["BoundedMemorySaver"] = None
 
     def __init__(
         self,
@@ -92,6 +132,30 @@ class MoziChemAgent:
             Whether to enable memory mode for the agent.
         kwargs : dict
             Additional keyword arguments for future extensions.
+            - cache_backend: str, optional
+                The llm cache backend ("memory", "redis" or "none"), by default
+                no cache unless `MOZICHEM_LLM_CACHE=1` (then redis when
+                `MOZICHEM_CACHE_URL` is set, otherwise in-memory). The cache
+                is only used at temperature 0.
+            - max_concurrent_tools: int, optional
+                The max number of tool calls run concurrently in a step, by
+                default `MOZICHEM_MAX_CONCURRENT_TOOLS` or 8.
+            - memory_turns: int, optional
+                The number of user turns of a thread history sent to the LLM
+                in memory mode, 0 sends all of it, by default
+                `MOZICHEM_MEMORY_TURNS` or 8.
+            - arithmetic_shortcut: bool, optional
+                Answer pure `a + b` / `a * b` messages without the LLM (the
+                agent prompt and tools are skipped), by default False.
+            - persistent_stdio: bool, optional
+                Keep stdio MCP servers running in long-lived sessions, by
+                default `MOZICHEM_PERSISTENT_STDIO=1`.
+            - trusted_mcp: bool, optional
+                The mcp_source dict is already validated and is used without
+                pydantic validation, by default False.
+            - lazy_llm: bool, optional
+                Defer the LLM setup to `build_agent`, where it overlaps the
+                MCP tool discovery, by default False.
         '''
         # NOTE: set attributes
         self._model_provider = model_provider
@@ -106,165 +170,418 @@ class MoziChemAgent:
         self._temperature = kwargs.get('temperature', 0.0)
         # max tokens
         self._max_tokens = kwargs.get('max_tokens', 2048)
+        # cache backend
+        self._cache_backend = kwargs.get('cache_backend', None)
+        # max concurrent tool calls
+        self._max_concurrent_tools = kwargs.get('max_concurrent_tools', None)
+        # history window sent to the llm
+        self._memory_turns = kwargs.get('memory_turns', None)
+        # keep stdio mcp servers running between builds
+        self._persistent_stdio = kwargs.get(
+            'persistent_stdio', persistent_stdio_enabled())
+        # answer pure arithmetic messages locally
+        self._arithmetic_shortcut = kwargs.get('arithmetic_shortcut', False)
+        # skip validation of an already validated mcp source
+        self._trusted_mcp = kwargs.get('trusted_mcp', False)
 
-        # SECTION: initialize LLM
-        try:
+        # SECTION: initialize LLM (deferred to build_agent in lazy mode)
+        if not kwargs.get('lazy_llm', False):
             self.init_llm()
-        except Exception as e:
-            logger.error(f"Failed to initialize LLM: {e}")
-            raise RuntimeError(f"Failed to initialize LLM: {e}") from e
+
+        # NOTE: no mcp source, no client
+        if not self._mcp_source:
+            self.client = None
+            logger.info("No MCP source provided. Client will not be created.")
+            return
 
         # SECTION: adapt MCP
-        try:
-            self.adapt_mcp()
-        except Exception as e:
-            logger.error(f"Failed to adapt MCP: {e}")
-            raise RuntimeError(f"Failed to adapt MCP: {e}") from e
+        self.adapt_mcp()
 
         # SECTION: create client
-        try:
-            self.create_client()
-        except Exception as e:
-            logger.error(f"Failed to create MCP client: {e}")
-            raise RuntimeError(f"Failed to create MCP client: {e}") from e
+        self.create_client()
 
     def init_llm(self):
         '''
         This method sets up the language model for the agent using the model name provided during initialization.
         It uses the `init_chat_model` function from langchain to create the model instance.
+        The llm cache, when enabled, is set on the model itself (`cache=`).
+        Models are pooled per process, so agents with the same settings share
+        the provider client and its connections.
         '''
-        try:
-            # SECTION: initialize the LLM
-            self.llm = init_chat_model(
-                self._model_name,
-                model_provider=self._model_provider,
-                temperature=self._temperature,
-                max_tokens=self._max_tokens
-            )
-        except Exception as e:
-            logger.error(f"Failed to initialize LLM: {e}")
-            raise RuntimeError(f"Failed to initialize LLM: {e}") from e
+        # SECTION: llm settings
+        kwargs: Dict[str, Any] = {
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens,
+            "cache": self._llm_cache()
+        }
+        if self._model_provider == "openai":
+            # NOTE: share the pooled http client
+            kwargs["http_async_client"] = get_shared_async_client()
+
+        # SECTION: reuse a pooled model with the same settings
+        self.llm = get_chat_model(
+            self._model_provider,
+            self._model_name,
+            **kwargs
+        )
+
+    def _llm_cache(self) -> Optional[BaseCache]:
+        '''
+        Return the llm cache of the agent model, None when caching is off.
+        Sampled replies (temperature above 0) are never cached.
+        '''
+        if self._temperature != 0:
+            return None
+        if self._cache_backend is None and not llm_cache_enabled():
+            return None
+        return get_llm_cache(self._cache_backend)
 
     def adapt_mcp(self):
         '''
         This method adapts the MCP configurations based on the provided mcp_source.
         '''
-        try:
-            # SECTION: mcp setup
-            if self._mcp_source:
-                # NOTE: init MCPManager
-                MCPManager_ = MCPManager(self._mcp_source)
-
-                # NOTE: mcp config
-                mcp_ = MCPManager_.config_mcp()
-
-                # NOTE: convert to MCP dict for MultiServerMCPClient
-                if isinstance(mcp_, dict):
-                    # stdio mcp dict
-                    self.mcp_stdio_dict = {
-                        name: config.model_dump()
-                        for name, config in mcp_.items()
-                        if (
-                            isinstance(config, stdioMCP) and
-                            config.transport == 'stdio'
-                        )
-                    }
-
-                    # streamable http mcp dict
-                    self.mcp_streamable_http_dict = {
-                        name: config.model_dump()
-                        for name, config in mcp_.items()
-                        if (
-                            isinstance(config, streamableHttpMCP) and
-                            config.transport == 'streamable_http'
-                        )
-                    }
-        except Exception as e:
-            logger.error(f"Failed to adapt MCP: {e}")
-            raise RuntimeError(f"Failed to adapt MCP: {e}") from e
+        # SECTION: mcp setup
+        if self._mcp_source:
+            # NOTE: init MCPManager
+            MCPManager_ = MCPManager(
+                self._mcp_source,
+                trusted=self._trusted_mcp
+            )
+
+            # NOTE: MCP dicts for MultiServerMCPClient (validated and
+            # dumped once per source)
+            (
+                self.mcp_stdio_dict,
+                self.mcp_streamable_http_dict
+            ) = MCPManager_.config_mcp_dicts()
 
     def create_client(self):
         '''
         Create and return a MultiServerMCPClient instance with the MCP configurations.
         '''
-        try:
-            # log
-            logger.info(
-                "Creating MCP client with the provided configurations.")
-            # a = self.mcp_stdio_dict
-            # b = self.mcp_streamable_http_dict
-
-            # SECTION: mcp feed
-            # combine stdio and streamable http mcp dicts
-            mcp_feed: Dict[str, Any] = {
-                **self.mcp_stdio_dict,
-                **self.mcp_streamable_http_dict
+        from langchain_mcp_adapters.client import MultiServerMCPClient
+
+        # log
+        logger.info(
+            "Creating MCP client with the provided configurations.")
+
+        # SECTION: mcp feed
+        # combine stdio and streamable http mcp dicts
+        mcp_feed: Dict[str, Any] = {
+            **self.mcp_stdio_dict,
+            **self.mcp_streamable_http_dict
+        }
+
+        # SECTION: create MCP client
+        # check if mcp is empty
+        if not mcp_feed:
+            self.client = None
+            self._client_key = None
+            logger.warning(
+                "No valid MCP configurations found. Client will not be created.")
+            return
+
+        # NOTE: reuse the shared client for the same mcp feed
+        self._client_key = orjson.dumps(
+            mcp_feed,
+            option=orjson.OPT_SORT_KEYS
+        ).decode("utf-8")
+        with _CLIENT_CACHE_LOCK:
+            cached = _CLIENT_CACHE.get(self._client_key)
+            if cached is not None:
+                self.client = cached[0]
+                logger.info("Reusing shared MCP client.")
+                return
+
+            # NOTE: streamable http sessions share one connection pool
+            connections: Dict[str, Any] = {
+                name: (
+                    {**config, "httpx_client_factory": shared_httpx_client_factory}
+                    if config.get("transport") == "streamable_http"
+                    else config
+                )
+                for name, config in mcp_feed.items()
             }
+            self.client = MultiServerMCPClient(
+                connections
+            )
+            _CLIENT_CACHE[self._client_key] = (self.client, None)
+        logger.info("MCP client created successfully.")
+
+    async def _get_server_tools(self, server_name: str) -> List[BaseTool]:
+        '''
+        Return the tools of a single MCP server, stdio servers use their
+        long-lived session in persistent mode.
+        '''
+        if self._persistent_stdio and server_name in self.mcp_stdio_dict:
+            return await get_stdio_tools(
+                self.client,
+                server_name,
+                self.mcp_stdio_dict[server_name]
+            )
+        return await self.client.get_tools(server_name=server_name)
 
-            # SECTION: create MCP client
-            # check if mcp is empty
-            if not mcp_feed:
-                self.client = None
-                logger.warning(
-                    "No valid MCP configurations found. Client will not be created.")
+    async def _collect_tools(
+        self,
+        server_names: List[str]
+    ) -> Tuple[List[BaseTool], bool]:
+        '''
+        Retrieve the tools of the MCP servers concurrently, a failing server
+        is logged and skipped.
+
+        Parameters
+        ----------
+        server_names : List[str]
+            The names of the MCP servers.
+
+        Returns
+        -------
+        Tuple[List[BaseTool], bool]
+            The tools and whether every server answered.
+        '''
+        results = await asyncio.gather(
+            *(self._get_server_tools(name) for name in server_names),
+            return_exceptions=True
+        )
+
+        tools: List[BaseTool] = []
+        complete = True
+        for name, result in zip(server_names, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to retrieve tools from MCP server %s: %s", name, result)
+                complete = False
+            elif isinstance(result, BaseException):
+                raise result
             else:
-                self.client = MultiServerMCPClient(
-                    mcp_feed
-                )
-                logger.info("MCP client created successfully.")
+                tools.extend(result)
+        return tools, complete
+
+    async def get_client_tools(self) -> List[BaseTool]:
+        '''
+        Return the MCP client tools, retrieved once per mcp feed and shared
+        across agents. With persistent stdio sessions, stdio server tools come
+        from the long-lived sessions instead.
+        '''
+        # NOTE: check cache (stdio tools are not cached in persistent mode)
+        tools_key = self._client_key
+        if tools_key and self._persistent_stdio:
+            tools_key = f"{tools_key}|persistent_stdio"
+        cached = _CLIENT_CACHE.get(tools_key) if tools_key else None
+        if cached is not None and cached[1] is not None:
+            tools = cached[1]
+        else:
+            # NOTE: retrieve tools, one task per server
+            if self._persistent_stdio:
+                server_names = list(self.mcp_streamable_http_dict)
+            else:
+                server_names = list(self.client.connections)
+            tools, complete = await self._collect_tools(server_names)
 
-        except Exception as e:
-            logger.error(f"Failed to create MCP client: {e}")
-            raise RuntimeError(f"Failed to create MCP client: {e}") from e
+            # NOTE: store in cache (retry failed servers on the next build)
+            if tools_key and complete:
+                with _CLIENT_CACHE_LOCK:
+                    _CLIENT_CACHE[tools_key] = (self.client, tools)
+
+        # NOTE: stdio tools from persistent sessions
+        if self._persistent_stdio:
+            stdio_tools, _ = await self._collect_tools(
+                list(self.mcp_stdio_dict))
+            tools = [*tools, *stdio_tools]
+
+        return tools
+
+    def graph_signature(self, tools: List[BaseTool]) -> str:
+        '''
+        Return the signature of the agent graph built from the current
+        configuration, LLM and tools (the checkpointer is not part of it).
+        '''
+        signature = orjson.dumps(
+            {
+                # NOTE: pooled per settings and cache, cached graphs keep it alive
+                "llm": id(self.llm),
+                "model_provider": self._model_provider,
+                "model_name": self._model_name,
+                "temperature": self._temperature,
+                "max_tokens": self._max_tokens,
+                "prompt": hashlib.sha256(
+                    (self._agent_prompt or "").encode("utf-8")
+                ).hexdigest(),
+                "client": self._client_key,
+                "tools": sorted((t.name, id(t)) for t in tools),
+                "max_concurrent_tools": self._max_concurrent_tools,
+                "memory_turns": self._memory_turns,
+                "arithmetic_shortcut": self._arithmetic_shortcut,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str
+        )
+        return hashlib.sha256(signature).hexdigest()
 
     async def build_agent(self):
         '''
         build and return a langgraph agent using the initialized LLM and MCP client.
         '''
-        try:
-            # SECTION: client tools retrieval
-            # check
-            try:
-                if self.client:
-                    # get tools
-                    tools = await self.client.get_tools()
-                    # append custom tools
-                    tools.extend([multiply, add])
-                    # log
-                    logger.info(
-                        f"Retrieved {len(tools)} tools from MCP client and added custom tools.")
-                else:
-                    logger.warning(
-                        "MCP client is not initialized. No tools will be available.")
-                    tools = [multiply, add]
-            except Exception as e:
-                logger.error(f"Failed to retrieve tools from MCP client: {e}")
-                tools = [multiply, add]
-
-            # SECTION: memory saver
-            try:
-                if self._memory_mode:
-                    memory = MemorySaver()
-                else:
-                    memory = None
-            except Exception as e:
-                logger.error(f"Failed to initialize memory saver: {e}")
-                memory = None
-
-            # SECTION: create agent
-            try:
-                agent = create_react_agent(
-                    model=self.llm,
-                    tools=tools,
-                    prompt=self._agent_prompt,
-                    checkpointer=memory
+        from mozichem_ai.agents.react_graph import build_react_graph
+        from mozichem_ai.memory.bounded_saver import BoundedMemorySaver
+
+        # SECTION: deferred LLM setup, overlapped with the tool retrieval
+        llm_task = (
+            asyncio.ensure_future(asyncio.to_thread(self.init_llm))
+            if self.llm is None else None
+        )
+
+        # SECTION: client tools retrieval
+        # NOTE: a failing server is logged and skipped (see _collect_tools)
+        if self.client:
+            # get tools (cached per instance and per mcp feed)
+            if self._tools_cache is None:
+                try:
+                    self._tools_cache = await self.get_client_tools()
+                except BaseException:
+                    # NOTE: collect the deferred LLM setup (its error is not
+                    # lost), the next build sets the LLM up again
+                    if llm_task is not None:
+                        await asyncio.gather(llm_task, return_exceptions=True)
+                        self.llm = None
+                    raise
+            tools = self._tools_cache
+            # append custom tools
+            tools = [*tools, multiply, add]
+            # log
+            logger.info(
+                "Retrieved %s tools from MCP client and added custom tools.", len(tools))
+        else:
+            logger.warning(
+                "MCP client is not initialized. No tools will be available.")
+            tools = [multiply, add]
+
+        # NOTE: deterministic tool order keeps the provider prompt cache warm
+        tools = sorted(tools, key=lambda t: t.name)
+
+        # NOTE: wait for the deferred LLM setup
+        if llm_task is not None:
+            await llm_task
+
+        # SECTION: memory saver (kept across rebuilds of this instance)
+        if self._memory_mode and self._memory is None:
+            self._memory = BoundedMemorySaver()
+        memory = self._memory
+
+        # SECTION: create agent
+        # NOTE: reuse the compiled graph for the same signature
+        graph_key = self.graph_signature(tools)
+        graph = _GRAPH_CACHE.get(graph_key)
+        if graph is None:
+            graph = build_react_graph(
+                llm=self.llm,
+                tools=tools,
+                prompt=self._agent_prompt,
+                checkpointer=None,
+                max_concurrency=self._max_concurrent_tools,
+                arithmetic_shortcut=self._arithmetic_shortcut,
+                cache_prompt=self._model_provider == "anthropic",
+                max_turns=self._memory_turns
+            )
+            _GRAPH_CACHE[graph_key] = graph
+            if len(_GRAPH_CACHE) > _GRAPH_CACHE_SIZE:
+                _GRAPH_CACHE.popitem(last=False)
+        else:
+            _GRAPH_CACHE.move_to_end(graph_key)
+            logger.info("Reusing compiled agent graph.")
+
+        # NOTE: each agent gets its own checkpointer
+        agent = graph.copy(update={"checkpointer": memory})
+        self._compiled = agent
+
+        # return agent
+        return agent
+
+    @property
+    def agent(self) -> Optional["CompiledStateGraph"]:
+        """The compiled agent, None before `build_agent` is called."""
+        return self._compiled
+
+    async def rebind_llm(
+        self,
+        model_provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> "CompiledStateGraph":
+        '''
+        Swap the LLM of the agent and rebuild it, reusing the MCP client,
+        its tools and the agent memory.
+
+        Parameters
+        ----------
+        model_provider : str, optional
+            The new model provider, by default unchanged.
+        model_name : str, optional
+            The new model name, by default unchanged.
+        temperature : float, optional
+            The new temperature, by default unchanged.
+        max_tokens : int, optional
+            The new max tokens, by default unchanged.
+
+        Returns
+        -------
+        agent: CompiledStateGraph
+            The rebuilt agent.
+        '''
+        # NOTE: update llm settings
+        if model_provider is not None:
+            self._model_provider = model_provider
+        if model_name is not None:
+            self._model_name = model_name
+        if temperature is not None:
+            self._temperature = temperature
+        if max_tokens is not None:
+            self._max_tokens = max_tokens
+
+        # SECTION: initialize LLM
+        self.init_llm()
+
+        # SECTION: rebuild agent (no MCP work, tools are cached)
+        return await self.build_agent()
+
+    async def run_batch_async(
+        self,
+        prompts: List[str],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        '''
+        Run the agent on a batch of prompts concurrently, each in its own thread.
+
+        Parameters
+        ----------
+        prompts : List[str]
+            The user prompts.
+        max_concurrency : int, optional
+            The max number of concurrent agent runs, by default 8.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The agent final states (with `messages`), in the order of prompts.
+        '''
+        # SECTION: build agent if needed
+        if self._compiled is None:
+            await self.build_agent()
+        agent = self._compiled
+
+        # SECTION: run prompts
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await agent.ainvoke(
+                    {"messages": prompt},
+                    config=RunnableConfig(
+                        configurable={
+                            "thread_id": generate_thread_id()
+                        }
+                    )
                 )
-            except Exception as e:
-                logger.error(f"Failed to create agent: {e}")
-                raise RuntimeError(f"Failed to create agent: {e}") from e
-
-            # return agent
-            return agent
-        except Exception as e:
-            logger.error(f"Failed to initialize agent: {e}")
-            raise RuntimeError(f"Failed to initialize agent: {e}") from e
+
+        return await asyncio.gather(*(_one(p) for p in prompts))
@@ -0,0 +1,349 @@
+# import libs
+import os
+import re
+import asyncio
+import logging
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    BaseMessage,
+    SystemMessage,
+    ToolMessage,
+    AIMessage,
+    HumanMessage
+)
+from langchain_core.tools import BaseTool
+from langgraph.graph import StateGraph, MessagesState, START, END
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: max concurrent tool calls per agent step
+MAX_CONCURRENT_TOOLS_ENV = "MOZICHEM_MAX_CONCURRENT_TOOLS"
+DEFAULT_MAX_CONCURRENT_TOOLS = 8
+
+# NOTE: user turns of the thread history sent to the LLM (sliding window)
+MEMORY_TURNS_ENV = "MOZICHEM_MEMORY_TURNS"
+DEFAULT_MEMORY_TURNS = 8
+
+# NOTE: pure arithmetic user messages (e.g., "12 * 7") answered locally,
+# longer operands go to the LLM (int parsing is limited to 4300 digits)
+ARITHMETIC_PATTERN = re.compile(
+    r"^\s*(-?\d{1,18})\s*([+*])\s*(-?\d{1,18})\s*$")
+
+# NOTE: identical consecutive tool call steps that abort the run
+TOOL_LOOP_WINDOW = 3
+TOOL_LOOP_ERROR = "Error: the agent repeated the same tool calls, the run was stopped."
+
+# NOTE: provider prompt cache counters (input tokens read from the cache)
+_PROMPT_CACHE_TOKENS = {"input_tokens": 0, "cached_tokens": 0}
+
+
+def max_concurrent_tools() -> int:
+    """
+    Return the max number of tool calls run concurrently in a single step.
+    """
+    return int(
+        os.getenv(MAX_CONCURRENT_TOOLS_ENV, DEFAULT_MAX_CONCURRENT_TOOLS)
+    )
+
+
+def memory_turns() -> int:
+    """
+    Return the number of user turns of the thread history sent to the LLM,
+    0 sends the whole history.
+    """
+    return int(os.getenv(MEMORY_TURNS_ENV, DEFAULT_MEMORY_TURNS))
+
+
+def window_messages(
+    messages: Sequence[BaseMessage],
+    turns: int
+) -> Sequence[BaseMessage]:
+    """
+    Return the messages of the last `turns` user turns (each turn starts at
+    a user message, so tool calls and their replies stay together).
+
+    Parameters
+    ----------
+    messages : Sequence[BaseMessage]
+        The messages of the thread.
+    turns : int
+        The number of user turns kept, 0 keeps all messages.
+
+    Returns
+    -------
+    Sequence[BaseMessage]
+        The messages of the window.
+    """
+    if turns <= 0:
+        return messages
+    count = 0
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            count += 1
+            if count == turns:
+                return messages[i:]
+    return messages
+
+
+def record_prompt_cache(message: BaseMessage) -> None:
+    """
+    Add the input and cache-read token counts of a model response to the
+    prompt cache counters.
+    """
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return
+    _PROMPT_CACHE_TOKENS["input_tokens"] += usage.get("input_tokens", 0)
+    details = usage.get("input_token_details") or {}
+    _PROMPT_CACHE_TOKENS["cached_tokens"] += details.get("cache_read", 0)
+
+
+def prompt_cache_stats() -> Dict[str, float]:
+    """
+    Return the prompt cache counters and the hit ratio (share of input
+    tokens read from the provider prompt cache).
+    """
+    input_tokens = _PROMPT_CACHE_TOKENS["input_tokens"]
+    cached_tokens = _PROMPT_CACHE_TOKENS["cached_tokens"]
+    return {
+        "input_tokens": input_tokens,
+        "cached_tokens": cached_tokens,
+        "prompt_cache_hit_ratio": (
+            cached_tokens / input_tokens if input_tokens else 0.0
+        )
+    }
+
+
+def evaluate_arithmetic(text: str) -> Optional[int]:
+    """
+    Evaluate a pure `a + b` or `a * b` integer expression.
+
+    Parameters
+    ----------
+    text : str
+        The user message.
+
+    Returns
+    -------
+    int | None
+        The result, or None if the text is not a pure arithmetic expression
+        of operands up to 18 digits.
+    """
+    match = ARITHMETIC_PATTERN.match(text)
+    if match is None:
+        return None
+    a, op, b = int(match.group(1)), match.group(2), int(match.group(3))
+    return a + b if op == "+" else a * b
+
+
+def is_tool_loop(
+    messages: Sequence[BaseMessage],
+    window: int = TOOL_LOOP_WINDOW
+) -> bool:
+    """
+    Check whether the last `window` assistant messages of the current turn
+    request the same tool calls.
+
+    Parameters
+    ----------
+    messages : Sequence[BaseMessage]
+        The messages of the thread.
+    window : int, optional
+        The number of identical tool call steps considered a loop, by default 3.
+
+    Returns
+    -------
+    bool
+        True if the agent is looping on the same tool calls.
+    """
+    signatures = []
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            break
+        if isinstance(message, AIMessage):
+            if not message.tool_calls:
+                break
+            signatures.append(sorted(
+                (tc["name"], repr(tc["args"])) for tc in message.tool_calls
+            ))
+            if len(signatures) == window:
+                break
+    return (
+        len(signatures) == window and
+        all(s == signatures[0] for s in signatures)
+    )
+
+
+def build_react_graph(
+    llm: BaseChatModel,
+    tools: List[BaseTool],
+    prompt: Optional[str] = None,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    max_concurrency: Optional[int] = None,
+    arithmetic_shortcut: bool = False,
+    cache_prompt: bool = False,
+    max_turns: Optional[int] = None
+) -> CompiledStateGraph:
+    """
+    Build a ReAct agent graph whose tool node runs the tool calls of a step
+    concurrently.
+
+    Parameters
+    ----------
+    llm : BaseChatModel
+        The chat model used by the agent.
+    tools : List[BaseTool]
+        The tools available to the agent.
+    prompt : str, optional
+        The system prompt of the agent.
+    checkpointer : BaseCheckpointSaver, optional
+        The checkpointer used to persist the agent memory.
+    max_concurrency : int, optional
+        The max number of concurrent tool calls, by default
+        `MOZICHEM_MAX_CONCURRENT_TOOLS` or 8.
+    arithmetic_shortcut : bool, optional
+        Answer pure `a + b` / `a * b` user messages without calling the LLM
+        (the system prompt and tools are skipped too), by default False.
+    cache_prompt : bool, optional
+        Mark the system prompt block as cacheable (Anthropic
+        `cache_control`), by default False.
+    max_turns : int, optional
+        The number of user turns of the thread history sent to the LLM (the
+        checkpointed history is kept whole), 0 sends all of it, by default
+        `MOZICHEM_MEMORY_TURNS` or 8.
+
+    Returns
+    -------
+    CompiledStateGraph
+        The compiled agent graph.
+    """
+    # SECTION: prepare
+    # tool dispatch table (bound ainvoke), built once per graph
+    dispatch: Dict[str, Callable[..., Awaitable[ToolMessage]]] = {
+        t.name: t.ainvoke for t in tools
+    }
+    # model with tools
+    model = llm.bind_tools(tools) if tools else llm
+    # system message, kept as the stable prefix of every request (never
+    # templated with per-request data, so provider prompt caches keep hitting)
+    if not prompt:
+        system_message = None
+    elif cache_prompt:
+        system_message = SystemMessage(content=[{
+            "type": "text",
+            "text": prompt,
+            "cache_control": {"type": "ephemeral"}
+        }])
+    else:
+        system_message = SystemMessage(content=prompt)
+    # concurrency limit
+    max_concurrency = max_concurrency or max_concurrent_tools()
+    # history window
+    max_turns = memory_turns() if max_turns is None else max_turns
+
+    # SECTION: nodes
+    def call_arithmetic(state: MessagesState):
+        result = evaluate_arithmetic(state["messages"][-1].content)
+        return {"messages": [AIMessage(content=str(result))]}
+
+    async def call_model(state: MessagesState):
+        messages = window_messages(state["messages"], max_turns)
+        if system_message is not None:
+            messages = [system_message, *messages]
+        response = await model.ainvoke(messages)
+        record_prompt_cache(response)
+        return {"messages": [response]}
+
+    async def call_tools(state: MessagesState):
+        tool_calls = state["messages"][-1].tool_calls
+
+        # NOTE: stop error loops, every tool call still gets a reply
+        if is_tool_loop(state["messages"]):
+            logger.warning("Tool call loop detected, stopping the run.")
+            return {"messages": [
+                ToolMessage(
+                    content=TOOL_LOOP_ERROR,
+                    name=tc["name"],
+                    tool_call_id=tc["id"],
+                    status="error"
+                )
+                for tc in tool_calls
+            ]}
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(tool_call: dict) -> ToolMessage:
+            async with semaphore:
+                ainvoke = dispatch.get(tool_call["name"])
+                if ainvoke is None:
+                    return ToolMessage(
+                        content=f"Error: tool {tool_call['name']} is not available.",
+                        name=tool_call["name"],
+                        tool_call_id=tool_call["id"],
+                        status="error"
+                    )
+                try:
+                    return await ainvoke(tool_call)
+                except Exception as e:
+                    logger.error("Tool %s failed: %s", tool_call['name'], e)
+                    return ToolMessage(
+                        content=f"Error: {e}",
+                        name=tool_call["name"],
+                        tool_call_id=tool_call["id"],
+                        status="error"
+                    )
+
+        results = await asyncio.gather(*(_one(tc) for tc in tool_calls))
+        return {"messages": list(results)}
+
+    # SECTION: edges
+    def route_input(state: MessagesState):
+        last_message = state["messages"][-1]
+        if (
+            isinstance(last_message, HumanMessage) and
+            isinstance(last_message.content, str) and
+            evaluate_arithmetic(last_message.content) is not None
+        ):
+            return "arithmetic"
+        return "agent"
+
+    def should_continue(state: MessagesState):
+        last_message = state["messages"][-1]
+        if isinstance(last_message, AIMessage) and last_message.tool_calls:
+            return "tools"
+        return END
+
+    def after_tools(state: MessagesState):
+        last_message = state["messages"][-1]
+        if (
+            isinstance(last_message, ToolMessage) and
+            last_message.content == TOOL_LOOP_ERROR
+        ):
+            return END
+        return "agent"
+
+    # SECTION: graph
+    graph = StateGraph(MessagesState)
+    graph.add_node("agent", call_model)
+    graph.add_node("tools", call_tools)
+    if arithmetic_shortcut:
+        graph.add_node("arithmetic", call_arithmetic)
+        graph.add_conditional_edges(START, route_input, ["arithmetic", "agent"])
+        graph.add_edge("arithmetic", END)
+    else:
+        graph.add_edge(START, "agent")
+    graph.add_conditional_edges("agent", should_continue, ["tools", END])
+    graph.add_conditional_edges("tools", after_tools, ["agent", END])
+
+    return graph.compile(checkpointer=checkpointer)
@@ -1,3 +1,3 @@
-from .main import create_api
+from .main import create_api, create_api_sync
 
-__all__ = ["create_api"]
+__all__ = ["create_api", "create_api_sync"]
@@ -0,0 +1,97 @@
+# import libs
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncIterator,
+    Dict,
+    Optional
+)
+from fastapi import HTTPException
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: admission settings
+MAX_INFLIGHT_ENV = "MOZICHEM_CHAT_MAX_INFLIGHT"
+MAX_QUEUE_ENV = "MOZICHEM_CHAT_MAX_QUEUE"
+DEFAULT_MAX_INFLIGHT = 64
+DEFAULT_MAX_QUEUE = 256
+RETRY_AFTER = "1"
+
+
+class ChatAdmission:
+    '''
+    Admission control for chat requests, at most `max_inflight` agent runs
+    at a time and `max_queue` waiting, further requests are rejected with
+    503 (Retry-After).
+    '''
+
+    def __init__(
+        self,
+        max_inflight: Optional[int] = None,
+        max_queue: Optional[int] = None
+    ):
+        '''
+        Initialize the admission control.
+
+        Parameters
+        ----------
+        max_inflight : int, optional
+            The max number of concurrent agent runs, by default
+            `MOZICHEM_CHAT_MAX_INFLIGHT` or 64.
+        max_queue : int, optional
+            The max number of requests waiting for a run slot, by default
+            `MOZICHEM_CHAT_MAX_QUEUE` or 256.
+        '''
+        # NOTE: set attributes
+        self.max_inflight = max_inflight or int(
+            os.getenv(MAX_INFLIGHT_ENV, DEFAULT_MAX_INFLIGHT))
+        self.max_queue = max_queue if max_queue is not None else int(
+            os.getenv(MAX_QUEUE_ENV, DEFAULT_MAX_QUEUE))
+        self._semaphore = asyncio.Semaphore(self.max_inflight)
+        # admitted requests, running or waiting
+        self._pending = 0
+
+    @property
+    def inflight(self) -> int:
+        """The number of running agent runs."""
+        return self.max_inflight - self._semaphore._value
+
+    @property
+    def waiting(self) -> int:
+        """The number of requests waiting for a run slot."""
+        return self._pending - self.inflight
+
+    def check(self) -> None:
+        """
+        Reject the request with 503 when the queue is full, call before the
+        response starts.
+        """
+        if self._pending >= self.max_inflight + self.max_queue:
+            logger.warning("Chat queue is full, request rejected.")
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, retry later.",
+                headers={"Retry-After": RETRY_AFTER}
+            )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a run slot, waiting in the queue if none is free."""
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                yield
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the admission counters."""
+        return {
+            "inflight": self.inflight,
+            "waiting": self.waiting,
+            "max_inflight": self.max_inflight,
+            "max_queue": self.max_queue
+        }
@@ -1,11 +1,14 @@
 # import libs
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional, List
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, Request
 # local imports
 from .llm import llm_router
 from .config_api import config_router
+from .responses import ORJSONResponse
+from .errors import server_error_response
+from ..utils import MessageAnalysisError
 
 
 # NOTE: logger
@@ -17,8 +20,12 @@ class MoziChemAIAPI:
     MoziChem AI API class that initializes a FastAPI application and sets up the necessary middleware.
     This class is designed to handle the initialization of the FastAPI app and the setup of CORS middleware.
     '''
+    # NOTE: constants
+    # default to allow all origins
+    DEFAULT_CORS_ORIGINS: List[str] = ["*"]
+
     # NOTE: attributes
-    _cors_origins: Optional[List[str]] = ["*"]  # Default to allow all origins
+    _cors_origins: Optional[List[str]] = None
     _name: Optional[str] = None
     _version: Optional[str] = None
     _description: Optional[str] = None
@@ -47,9 +54,12 @@ class MoziChemAIAPI:
 
         # SECTION: Initialize FastAPI application
         try:
-            self.app = FastAPI()
+            self.app = FastAPI(
+                default_response_class=ORJSONResponse,
+                lifespan=self._lifespan
+            )
         except Exception as e:
-            logger.error(f"Failed to initialize FastAPI app: {e}")
+            logger.error("Failed to initialize FastAPI app: %s", e)
             raise HTTPException(
                 status_code=500, detail="Failed to initialize API") from e
 
@@ -57,7 +67,7 @@ class MoziChemAIAPI:
         try:
             self._setup_middleware()
         except Exception as e:
-            logger.error(f"Failed to setup middleware: {e}")
+            logger.error("Failed to setup middleware: %s", e)
             raise HTTPException(
                 status_code=500, detail="Middleware setup failed")
 
@@ -65,15 +75,18 @@ class MoziChemAIAPI:
         try:
             self._register_routers()
         except Exception as e:
-            logger.error(f"Failed to register routers: {e}")
+            logger.error("Failed to register routers: %s", e)
             raise HTTPException(
                 status_code=500, detail="Router registration failed") from e
 
+        # SECTION: Register exception handlers
+        self._register_exception_handlers()
+
     @property
     def cors_origins(self) -> List[str]:
         """Returns the list of allowed CORS origins."""
         if self._cors_origins is None:
-            return ["*"]
+            return self.DEFAULT_CORS_ORIGINS
         return self._cors_origins
 
     @property
@@ -97,8 +110,25 @@ class MoziChemAIAPI:
             return "No description set"
         return self._description
 
+    @staticmethod
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI):
+        """
+        Run the startup hook of the application (`app.state.on_startup`)
+        before serving, and release shared resources on shutdown.
+        """
+        on_startup = getattr(app.state, "on_startup", None)
+        if on_startup is not None:
+            await on_startup()
+        yield
+        # NOTE: stop persistent stdio MCP server processes
+        from ..agents._stdio import close_stdio_sessions
+        await close_stdio_sessions()
+
     def _setup_middleware(self):
         """Setup middleware for the FastAPI application."""
+        from fastapi.middleware.cors import CORSMiddleware
+
         self.app.add_middleware(
             CORSMiddleware,
             allow_origins=self.cors_origins,
@@ -107,6 +137,18 @@ class MoziChemAIAPI:
             allow_headers=["*"],  # Allow all headers
         )
 
+    def _register_exception_handlers(self):
+        """Map errors of the library layers to HTTP responses."""
+        @self.app.exception_handler(MessageAnalysisError)
+        async def message_analysis_error(
+            request: Request,
+            exc: MessageAnalysisError
+        ):
+            return server_error_response(
+                "message_analysis_failed",
+                str(exc)
+            )
+
     def _register_routers(self):
         """Register API routers to the FastAPI application."""
         # Register the llm router
@@ -0,0 +1,130 @@
+# import libs
+import os
+import time
+import logging
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: cache settings
+CACHE_SIZE_ENV = "MOZICHEM_CHAT_CACHE_SIZE"
+CACHE_TTL_ENV = "MOZICHEM_CHAT_CACHE_TTL"
+DEFAULT_CACHE_SIZE = 0
+DEFAULT_CACHE_TTL = 600
+
+
+class ChatResponseCache:
+    '''
+    Exact-match cache of chat replies, opt-in (`MOZICHEM_CHAT_CACHE_SIZE`).
+    It only applies to deterministic agents, without memory, at temperature
+    0 and without MCP tools, a reply then only depends on the settings and
+    the user message. Entries expire after `ttl` seconds and are dropped
+    when the agent settings change.
+    '''
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        '''
+        Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The max number of cached replies, 0 disables the cache, by
+            default `MOZICHEM_CHAT_CACHE_SIZE` or 0.
+        ttl : float, optional
+            The time to live of a reply in seconds, by default
+            `MOZICHEM_CHAT_CACHE_TTL` or 600.
+        '''
+        # NOTE: set attributes
+        self.maxsize = maxsize if maxsize is not None else int(
+            os.getenv(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+        self.ttl = ttl if ttl is not None else float(
+            os.getenv(CACHE_TTL_ENV, DEFAULT_CACHE_TTL))
+        # settings the entries belong to
+        self._settings: Any = None
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def _enabled(self, settings: Any) -> bool:
+        """Check the cache applies, and reset it on a settings change."""
+        if (
+            self.maxsize <= 0 or
+            settings.memory_mode or
+            settings.temperature != 0 or
+            settings.mcp_source
+        ):
+            return False
+        if settings is not self._settings:
+            self._settings = settings
+            self._entries.clear()
+        return True
+
+    def get(
+        self,
+        settings: Any,
+        content: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached reply fields of a user message, None on a miss.
+
+        Parameters
+        ----------
+        settings : AgentSettings
+            The current agent settings snapshot.
+        content : str
+            The user message.
+
+        Returns
+        -------
+        Dict[str, Any] | None
+            The reply fields (role, content, messages, input_tokens,
+            output_tokens).
+        """
+        if not self._enabled(settings):
+            return None
+        entry = self._entries.get(content)
+        if entry is None:
+            return None
+        expires, reply = entry
+        if expires < time.monotonic():
+            del self._entries[content]
+            return None
+        self._entries.move_to_end(content)
+        return reply
+
+    def put(
+        self,
+        settings: Any,
+        content: str,
+        reply: Dict[str, Any]
+    ) -> None:
+        """
+        Cache the reply fields of a user message.
+
+        Parameters
+        ----------
+        settings : AgentSettings
+            The agent settings snapshot the reply was produced with.
+        content : str
+            The user message.
+        reply : Dict[str, Any]
+            The reply fields.
+        """
+        if not self._enabled(settings):
+            return
+        self._entries[content] = (time.monotonic() + self.ttl, reply)
+        self._entries.move_to_end(content)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
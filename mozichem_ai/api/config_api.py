@@ -1,16 +1,20 @@
 # import libs
+import os
+import signal
 import logging
 import asyncio
-import threading
 from fastapi import HTTPException, APIRouter, Request
-from fastapi.responses import JSONResponse
 # local
+from .responses import ORJSONResponse
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
 # set logging level
 logger.setLevel(logging.INFO)
 
+# NOTE: number of worker processes serving the app, set by `run_api`
+WORKERS_ENV = "MOZICHEM_API_WORKERS"
+
 # SECTION: api router
 config_router = APIRouter()
 
@@ -30,12 +34,20 @@ async def shutdown(request: Request):
             raise HTTPException(
                 status_code=400, detail="Server is not running.")
 
-        # NOTE: stop the server
-        def stop():
-            loop = asyncio.get_event_loop()
-            loop.call_soon_threadsafe(loop.stop)
-
-        threading.Thread(target=stop).start()
+        # NOTE: stop the server gracefully (this response is still sent)
+        server = getattr(request.app.state, "uvicorn_server", None)
+        if server is not None:
+            # server run by mozichem_chat
+            server.should_exit = True
+        else:
+            # NOTE: SIGTERM runs uvicorn's graceful shutdown, worker
+            # processes are stopped through their supervisor (the parent
+            # process), which stops all of them
+            workers = int(os.getenv(WORKERS_ENV, "1"))
+            pid = os.getppid() if workers > 1 else os.getpid()
+            # scheduled after this handler returns
+            loop = asyncio.get_running_loop()
+            loop.call_soon(os.kill, pid, signal.SIGTERM)
 
         # NOTE: update the server state
         request.app.state.is_running = False
@@ -43,11 +55,10 @@ async def shutdown(request: Request):
 
         # SECTION: return response
         # NOTE: return a JSON response indicating the server is shutting down
-        return JSONResponse(
-            content={"message": "Server is shutting down."},
-            status_code=200
-        )
+        return ORJSONResponse({"message": "Server is shutting down."})
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
+        logger.error("Error during shutdown: %s", e)
         raise HTTPException(
             status_code=500, detail="Failed to shut down the server.")
@@ -0,0 +1,85 @@
+# import libs
+import uuid
+import logging
+import orjson
+from fastapi import HTTPException, Response
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+def _log_error(message: str) -> str:
+    """
+    Log the exception being handled with a new error id and return the id.
+    """
+    error_id = uuid.uuid4().hex[:12]
+    logger.exception("%s (error id: %s)", message, error_id)
+    return error_id
+
+
+def server_error(
+    code: str,
+    message: str,
+    status_code: int = 500
+) -> HTTPException:
+    """
+    Log the exception being handled with an error id and build the HTTP
+    error returned to the client, which carries the id but no exception
+    details.
+
+    Parameters
+    ----------
+    code : str
+        The error code (e.g., "agent_config_failed").
+    message : str
+        A short description of the failure.
+    status_code : int, optional
+        The HTTP status code, by default 500.
+
+    Returns
+    -------
+    HTTPException
+        The exception to raise, its detail is `{"code", "message", "id"}`.
+    """
+    error_id = _log_error(message)
+    return HTTPException(
+        status_code=status_code,
+        detail={
+            "code": code,
+            "message": message,
+            "id": error_id
+        }
+    )
+
+
+def server_error_response(
+    code: str,
+    message: str,
+    status_code: int = 500
+) -> Response:
+    """
+    Log the exception being handled as `server_error` does and return the
+    error response directly (no exception handler on the error path).
+
+    Parameters
+    ----------
+    code : str
+        The error code (e.g., "app_info_failed").
+    message : str
+        A short description of the failure.
+    status_code : int, optional
+        The HTTP status code, by default 500.
+
+    Returns
+    -------
+    Response
+        The JSON response, its body is `{"detail": {"code", "message", "id"}}`.
+    """
+    error_id = _log_error(message)
+    return Response(
+        content=orjson.dumps({
+            "detail": {"code": code, "message": message, "id": error_id}
+        }),
+        status_code=status_code,
+        media_type="application/json"
+    )
@@ -1,10 +1,12 @@
 # import libs
 import logging
+from functools import lru_cache
 from fastapi import HTTPException, APIRouter
-from fastapi.responses import JSONResponse
 # local imports
+from .responses import ORJSONResponse
+from .errors import server_error
 from ..llms import LlmManager
-from ..config import llm_providers
+from ..config import llm_providers_set, llm_providers_str
 from ..models import LlmConfig
 
 
@@ -14,6 +16,23 @@ logger = logging.getLogger(__name__)
 # SECTION: api router
 llm_router = APIRouter()
 
+# SECTION: llm managers
+
+
+@lru_cache(maxsize=64)
+def get_llm_manager(model_provider: str, model_name: str) -> LlmManager:
+    """
+    Return the LLM manager of a provider and model, reused across pings so
+    the provider client and its connections are kept. Its model bypasses the
+    llm cache, so every ping reaches the provider.
+    """
+    return LlmManager(
+        model_provider=model_provider,
+        model_name=model_name,
+        cache=False
+    )
+
+
 # SECTION: routes
 
 
@@ -45,13 +64,11 @@ async def ping_llm(
         max_tokens = request.max_tokens
 
         logger.info(
-            f"Initializing LLM with provider: {model_provider}, model: {model_name}, temperature: {temperature}, max_tokens: {max_tokens}")
-
-        # NOTE: add kwargs for LLM manager
-        kwargs = {
-            "temperature": temperature,
-            "max_tokens": max_tokens
-        }
+            "Initializing LLM with provider: %s, model: %s, temperature: %s, max_tokens: %s",
+            model_provider,
+            model_name,
+            temperature,
+            max_tokens)
 
         # SECTION: validate inputs
         if not model_provider or not model_name:
@@ -59,20 +76,18 @@ async def ping_llm(
                 status_code=400, detail="Model provider and name must be provided.")
 
         # NOTE: check if model provider is supported
-        if model_provider not in llm_providers:
+        if model_provider not in llm_providers_set:
             raise HTTPException(
-                status_code=400, detail=f"Unsupported model provider: {model_provider}. Supported providers are: {', '.join(llm_providers)}.")
+                status_code=400, detail=f"Unsupported model provider: {model_provider}. Supported providers are: {llm_providers_str}.")
 
-        # SECTION: init llm manager
-        llm_manager = LlmManager(
-            model_provider=model_provider,
-            model_name=model_name
-        )
+        # SECTION: get llm manager (cached)
+        llm_manager = get_llm_manager(model_provider, model_name)
 
         # SECTION: ping the model
-        response = llm_manager.ping()
+        response = await llm_manager.aping()
 
-        return JSONResponse(content=response)
+        return ORJSONResponse(content=response)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error initializing LLM: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise server_error("llm_ping_failed", "Failed to initialize LLM") from e
@@ -1,28 +1,49 @@
 # import libs
+import copy
 import logging
 import time
-import json
+import asyncio
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import replace
+import orjson
 from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
+    Tuple,
     Union,
     List,
-    Optional
+    Optional,
+    Set
 )
 from fastapi import (
+    BackgroundTasks,
     FastAPI,
-    HTTPException,
+    Request,
     WebSocket
 )
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
 from pathlib import Path
 # langchain
 from langchain_core.runnables import RunnableConfig
 from langchain_core.messages import (
     HumanMessage,
+    AIMessage,
+    ToolMessage
 )
 # locals
 from .ai_api import MoziChemAIAPI
-from ..agents import create_agent
+from .responses import ORJSONResponse, dumps
+from .admission import ChatAdmission
+from .chat_cache import ChatResponseCache
+from .errors import server_error, server_error_response
+from .state import AgentSettings, DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS
+from ..agents import MoziChemAgent
 from ..models import (
     ChatMessage,
     AgentConfig,
@@ -33,11 +54,16 @@ from ..models import (
     AgentDetails,
     LlmDetails,
     AgentMessage,
-    stdioMCP,
-    streamableHttpMCP
+    TokenMetadata,
+    MCP,
+    MCP_CONFIG_ADAPTER,
+    CHAT_MSG_ADAPTER,
+    AGENT_MSG_ADAPTER
 )
-from ..memory import generate_thread
-from ..utils import agent_message_analyzer, message_token_counter
+from pydantic import ValidationError
+from ..memory import generate_thread_id
+from ..llms.llm_models import warm_provider_modules
+from ..utils import agent_messages_analyzer, message_token_counter
 from ..config import default_token_metadata
 
 # NOTE: logger
@@ -48,19 +74,265 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # NOTE: constants
-# temperature and max_tokens for the LLM
-DEFAULT_TEMPERATURE = 0.0
-DEFAULT_MAX_TOKENS = 2048
-
 # input tokens and output tokens
 DEFAULT_INPUT_TOKENS = default_token_metadata['input_tokens']
 DEFAULT_OUTPUT_TOKENS = default_token_metadata['output_tokens']
+# NOTE: websocket room of the clients following all chat threads
+ALL_THREADS_ROOM = ""
+# NOTE: max wait of chat requests for an agent update, in seconds
+AGENT_READY_TIMEOUT = 30
+# NOTE: agent warmup at startup
+WARMUP_PROMPT = "warmup"
+WARMUP_THREAD_ID = "__warmup__"
+# NOTE: server-sent events headers (no proxy buffering or caching)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+# static response bodies, serialized once
+ROOT_BODY = orjson.dumps({
+    "message": "MoziChem AI API is running",
+    "success": True
+})
+AGENT_INITIALIZED_BODY = orjson.dumps({
+    "message": "Agent initialized successfully",
+    "success": True
+})
+
+# NOTE: built agents keyed by their configuration
+_AGENT_CACHE: "OrderedDict[Tuple, MoziChemAgent]" = OrderedDict()
+_AGENT_CACHE_SIZE = 8
+# NOTE: agent builds in flight, concurrent requests for a config share one
+_AGENT_BUILDS: Dict[Tuple, "asyncio.Future[MoziChemAgent]"] = {}
+# NOTE: per-thread locks, runs of the same thread are serialized (LRU)
+_THREAD_LOCKS: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+_THREAD_LOCKS_SIZE = 8192
+
+
+def thread_lock(thread_id: str) -> asyncio.Lock:
+    """
+    Return the lock of a chat thread, so concurrent requests of the same
+    thread run in order while different threads run in parallel.
+
+    Parameters
+    ----------
+    thread_id : str
+        The chat thread id.
+
+    Returns
+    -------
+    asyncio.Lock
+        The thread lock.
+    """
+    lock = _THREAD_LOCKS.get(thread_id)
+    if lock is None:
+        lock = _THREAD_LOCKS[thread_id] = asyncio.Lock()
+        # NOTE: evict the least recently used idle lock
+        if len(_THREAD_LOCKS) > _THREAD_LOCKS_SIZE:
+            for key, old in _THREAD_LOCKS.items():
+                if not old.locked() and key != thread_id:
+                    del _THREAD_LOCKS[key]
+                    break
+    else:
+        _THREAD_LOCKS.move_to_end(thread_id)
+    return lock
+
+
+def sse_event(
+    data: Union[bytes, Dict[str, Any]],
+    event: Optional[str] = None
+) -> bytes:
+    """
+    Encode a server-sent event.
+
+    Parameters
+    ----------
+    data : bytes | Dict[str, Any]
+        The event data, dicts are serialized to JSON (keeps multi-line
+        tokens in a single data field).
+    event : str, optional
+        The event name, by default the unnamed `message` event.
+
+    Returns
+    -------
+    bytes
+        The encoded event.
+    """
+    if not isinstance(data, bytes):
+        data = orjson.dumps(data)
+    payload = b"data: " + data + b"\n\n"
+    return b"event: " + event.encode() + b"\n" + payload if event else payload
+
+
+def _mcp_source_fingerprint(
+    mcp_source: Optional[Union[Dict[str, Any], str, Path]]
+) -> Optional[Union[bytes, Tuple]]:
+    """
+    Return a hashable fingerprint of an MCP source, for a YAML file its
+    path, mtime and size so edits to the file are picked up.
+    """
+    if mcp_source is None:
+        return None
+    if isinstance(mcp_source, (str, Path)):
+        path = Path(mcp_source).resolve()
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+    return orjson.dumps(
+        mcp_source,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _agent_options_fingerprint(options: Dict[str, Any]) -> bytes:
+    """
+    Return a canonical fingerprint of the agent options (sorted keys).
+    """
+    return orjson.dumps(
+        options,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+
+
+async def get_or_create_agent(
+    model_provider: str,
+    model_name: str,
+    agent_name: str,
+    agent_prompt: str,
+    mcp_source: Optional[Union[Dict[str, Any], str, Path]] = None,
+    memory_mode: bool = True,
+    temperature: float = DEFAULT_TEMPERATURE,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    scope: Optional[str] = None,
+    **kwargs
+) -> MoziChemAgent:
+    """
+    Return the cached agent for the configuration, creating and building it
+    on a miss.
+
+    Parameters
+    ----------
+    model_provider : str
+        The provider of the model.
+    model_name : str
+        The name of the model.
+    agent_name : str
+        The name of the agent.
+    agent_prompt : str
+        The prompt of the agent.
+    mcp_source : Optional[Union[Dict[str, Any], str, Path]]
+        The MCP configurations or a path to a YAML file.
+    memory_mode : bool, optional
+        Whether to enable memory mode for the agent, by default True.
+    temperature : float, optional
+        The temperature of the LLM, by default 0.0.
+    max_tokens : int, optional
+        The max tokens of the LLM, by default 2048.
+    scope : str, optional
+        The cache scope, agents are only reused within it (e.g., one app,
+        so agents with memory do not share conversations), by default
+        shared.
+    kwargs : dict
+        Additional keyword arguments passed to `MoziChemAgent`.
+
+    Returns
+    -------
+    MoziChemAgent
+        The built agent, its compiled graph is `MoziChemAgent.agent`.
+    """
+    key = (
+        model_provider,
+        model_name,
+        agent_name,
+        agent_prompt,
+        _mcp_source_fingerprint(mcp_source),
+        memory_mode,
+        temperature,
+        max_tokens,
+        _agent_options_fingerprint(kwargs),
+        scope
+    )
+
+    mozichem_agent = _AGENT_CACHE.get(key)
+    if mozichem_agent is not None:
+        _AGENT_CACHE.move_to_end(key)
+        logger.info("Reusing cached agent: %s (%s)", agent_name, model_name)
+        return mozichem_agent
+
+    # NOTE: single-flight, join the build in flight for the same config
+    build = _AGENT_BUILDS.get(key)
+    if build is None:
+        build = asyncio.ensure_future(_build_agent(
+            key,
+            model_provider,
+            model_name,
+            agent_name,
+            agent_prompt,
+            mcp_source,
+            memory_mode,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        ))
+        _AGENT_BUILDS[key] = build
+        build.add_done_callback(lambda _: _AGENT_BUILDS.pop(key, None))
+    # NOTE: a cancelled request does not cancel the shared build
+    return await asyncio.shield(build)
+
+
+async def _build_agent(key: Tuple, *args, **kwargs) -> MoziChemAgent:
+    """
+    Create and build an agent, then cache it under key.
+    """
+    try:
+        # NOTE: the constructor does blocking work (YAML read, client
+        # setup), run it off the event loop; the LLM setup is deferred to
+        # build_agent where it overlaps the MCP tool discovery
+        mozichem_agent = await asyncio.to_thread(
+            MoziChemAgent, *args, lazy_llm=True, **kwargs
+        )
+        await mozichem_agent.build_agent()
+    except Exception as e:
+        logger.error("Failed to create agent: %s", e)
+        raise RuntimeError(f"Failed to create agent: {e}") from e
+    _AGENT_CACHE[key] = mozichem_agent
+    # NOTE: bounded, the least recently used agent is dropped
+    if len(_AGENT_CACHE) > _AGENT_CACHE_SIZE:
+        _AGENT_CACHE.popitem(last=False)
+    return mozichem_agent
+
+
+async def rebind_agent_llm(
+    mozichem_agent: MoziChemAgent,
+    **llm_kwargs
+) -> MoziChemAgent:
+    """
+    Return a copy of an agent with its LLM swapped (no MCP work), see
+    `MoziChemAgent.rebind_llm`. The copy keeps the MCP client, the tools
+    and the memory, the agent itself (possibly cached) is left unchanged.
+
+    Parameters
+    ----------
+    mozichem_agent : MoziChemAgent
+        The agent to copy.
+    llm_kwargs : dict
+        model_provider, model_name, temperature and max_tokens.
+
+    Returns
+    -------
+    MoziChemAgent
+        The updated copy.
+    """
+    rebound = copy.copy(mozichem_agent)
+    await rebound.rebind_llm(**llm_kwargs)
+    return rebound
 
 
 # SECTION: create_api function
 
 
-async def create_api(
+def create_api_sync(
     model_provider: str,
     model_name: str,
     agent_name: str,
@@ -78,48 +350,34 @@ async def create_api(
     **kwargs
 ) -> FastAPI:
     """
-    Create and return a FastAPI application instance with the MoziChem AI API.
+    Create and return a FastAPI application instance with the MoziChem AI
+    API, from synchronous code (no event loop needed). The parameters are
+    those of `create_api`.
 
-    Parameters
-    ----------
-    model_provider : str
-        The provider of the model to be used (e.g., "openai", "google").
-    model_name : str
-        The name of the model to be used for the agent.
-    agent_name : str
-        The name of the agent.
-    agent_prompt : str
-        The prompt to be used for the agent.
-    mcp_source : Optional[Union[Dict[str, Dict[str, str]],
-        Dict[str, Dict[str, str | List[str]]], str, Path]]
-        A dictionary containing the MCP configurations or a path to a YAML file containing the MCP configurations.
-    memory_mode : bool, optional
-        Whether to enable memory mode for the agent, by default False.
-    kwargs : dict
-        Additional keyword arguments for future extensions.
-        - temperature: float, optional
-            The temperature for the LLM, by default 0.0.
-        - max_tokens: int, optional
-            The maximum number of tokens for the LLM, by default 2048.
-        - cors_origins: List[str], optional
-            A list of allowed CORS origins. If None, defaults to allowing all origins.
-        - name: str, optional
-            The name of the API, by default "MoziChem AI API".
-        - version: str, optional
-            The version of the API, by default "No version set".
-        - description: str, optional
-            A description of the API, by default "No description set".
+    The agent is created in the application lifespan, on the event loop
+    that serves the app, before requests are accepted. Build the app with
+    this function at import in a module served by uvicorn (also with
+    worker processes), or pass it directly to `uvicorn.run`.
 
     Returns
     -------
     FastAPI
         The FastAPI application instance.
     """
-    # NOTE: inputs
-    cors_origins = kwargs.get('cors_origins', None)
-    name = kwargs.get('name', None)
-    version = kwargs.get('version', None)
-    description = kwargs.get('description', None)
+    # NOTE: inputs, resolved once
+    cors_origins = kwargs.pop('cors_origins', None)
+    name = kwargs.pop('name', None)
+    version = kwargs.pop('version', None)
+    description = kwargs.pop('description', None)
+    warmup = kwargs.pop('warmup', False)
+    temperature = float(kwargs.pop('temperature', DEFAULT_TEMPERATURE))
+    max_tokens = int(kwargs.pop('max_tokens', DEFAULT_MAX_TOKENS))
+    # remaining kwargs are agent options (e.g., cache_backend)
+    agent_options = kwargs
+
+    # NOTE: import the provider SDK in the background, overlapped with the
+    # app setup (the agent is built at startup)
+    warm_provider_modules(model_provider)
 
     # SECTION: Initialize the MoziChem AI API
     MoziChemAIAPI_ = MoziChemAIAPI(
@@ -135,73 +393,327 @@ async def create_api(
     # NOTE: set running state
     app.state.is_running = True
 
+    # NOTE: chat admission control and reply cache
+    app.state.chat_admission = ChatAdmission()
+    app.state.chat_cache = ChatResponseCache()
+
     # SECTION: app state configurations
-    # set initial llm configurations in app.state
-    app.state.temperature = kwargs.get(
-        'temperature', DEFAULT_TEMPERATURE)
-    app.state.max_tokens = kwargs.get(
-        'max_tokens', DEFAULT_MAX_TOKENS)
-
-    # model provider
-    app.state.model_provider = model_provider
-    # model name
-    app.state.model_name = model_name
-    # agent name
-    app.state.agent_name = agent_name
-    # agent prompt
-    app.state.agent_prompt = agent_prompt
-    # mcp source
-    app.state.mcp_source = mcp_source
-    # memory mode
-    app.state.memory_mode = memory_mode
+    # NOTE: agent settings snapshot, replaced under the lock on updates
+    app.state.agent_settings = AgentSettings(
+        model_provider=model_provider,
+        model_name=model_name,
+        agent_name=agent_name,
+        agent_prompt=agent_prompt,
+        mcp_source=mcp_source,
+        memory_mode=memory_mode,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    app.state.agent_settings_lock = asyncio.Lock()
+    # NOTE: agent cache scope of this app
+    app.state.agent_scope = uuid.uuid4().hex
+    # NOTE: cleared while the agent is updated, chat requests wait on it
+    app.state.agent_ready = asyncio.Event()
+
+    @asynccontextmanager
+    async def updating_agent() -> AsyncIterator[None]:
+        """
+        Hold `agent_settings_lock` and the agent ready-gate closed while the
+        agent is updated, the gate reopens even if the update fails.
+        """
+        async with app.state.agent_settings_lock:
+            app.state.agent_ready.clear()
+            try:
+                yield
+            finally:
+                app.state.agent_ready.set()
 
-    # SECTION: agent initialization if app.state.agent does not exist
-    if not hasattr(app.state, "agent"):
-        app.state.agent = await create_agent(
-            model_provider=model_provider,
-            model_name=model_name,
-            agent_name=agent_name,
-            agent_prompt=agent_prompt,
-            mcp_source=mcp_source,
-            memory_mode=memory_mode,
-            **kwargs
+    async def ready_agent():
+        """
+        Return the current agent once no update is running, None if it does
+        not exist or the update takes longer than `AGENT_READY_TIMEOUT`.
+        """
+        agent_ready = app.state.agent_ready
+        if not agent_ready.is_set():
+            try:
+                await asyncio.wait_for(
+                    agent_ready.wait(),
+                    timeout=AGENT_READY_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                return None
+        return getattr(app.state, "agent", None)
+
+    def agent_exists() -> bool:
+        """Check the agent of the current settings is created."""
+        return getattr(app.state, "mozichem_agent", None) is not None
+
+    async def apply_agent_settings(
+        settings: AgentSettings,
+        **options
+    ) -> None:
+        """
+        Create (or reuse) the agent of the settings, then make the settings
+        and the agent current. Call with `agent_settings_lock` held.
+        """
+        # NOTE: agents with memory are not shared with other apps
+        mozichem_agent = await get_or_create_agent(
+            **{**agent_options, **options, **settings.as_kwargs()},
+            scope=app.state.agent_scope if settings.memory_mode else None
+        )
+        app.state.agent_settings = settings
+        app.state.mozichem_agent = mozichem_agent
+        app.state.agent = mozichem_agent.agent
+
+    async def apply_llm_settings(settings: AgentSettings) -> None:
+        """
+        Apply settings that differ from the current ones in LLM fields only,
+        by swapping the LLM of the current agent (no MCP work, memory kept).
+        Call with `agent_settings_lock` held.
+        """
+        mozichem_agent = getattr(app.state, "mozichem_agent", None)
+        if mozichem_agent is None:
+            await apply_agent_settings(settings)
+            return
+        mozichem_agent = await rebind_agent_llm(
+            mozichem_agent,
+            model_provider=settings.model_provider,
+            model_name=settings.model_name,
+            temperature=settings.temperature,
+            max_tokens=settings.max_tokens
+        )
+        app.state.agent_settings = settings
+        app.state.mozichem_agent = mozichem_agent
+        app.state.agent = mozichem_agent.agent
+
+    # NOTE: background agent updates (config POSTs with `background=true`)
+    app.state.agent_updates_pending = 0
+    app.state.agent_last_update = "ready"
+
+    async def run_agent_update(
+        update: Callable[[], Awaitable[AgentSettings]]
+    ) -> None:
+        """
+        Run an accepted agent update in the background and record its
+        outcome for `/agent-status`.
+        """
+        try:
+            async with updating_agent():
+                await update()
+            app.state.agent_last_update = "ready"
+        except Exception as e:
+            logger.error("Background agent update failed: %s", e)
+            app.state.agent_last_update = "failed"
+        finally:
+            app.state.agent_updates_pending -= 1
+
+    def accept_agent_update(
+        background_tasks: BackgroundTasks,
+        update: Callable[[], Awaitable[AgentSettings]]
+    ) -> ORJSONResponse:
+        """
+        Queue an agent update to run after the response is sent, and
+        return `202 Accepted` (poll `/agent-status` for its outcome).
+        """
+        app.state.agent_updates_pending += 1
+        background_tasks.add_task(run_agent_update, update)
+        return ORJSONResponse(
+            {
+                "message": "Agent update accepted",
+                "success": True,
+                "status": "updating"
+            },
+            status_code=202
         )
+
+    # SECTION: agent initialization if app.state.agent does not exist
+    async def ensure_agent() -> None:
+        """
+        Create the agent of the initial settings if it does not exist yet.
+        """
+        if hasattr(app.state, "agent"):
+            return
+        async with updating_agent():
+            await apply_agent_settings(app.state.agent_settings)
         # log
         logger.info(
-            f"MoziChem agent created successfully with model: {model_name}, agent: {agent_name}")
+            "MoziChem agent created successfully with model: %s, agent: %s", model_name, agent_name)
+
+    app.state.ensure_agent = ensure_agent
+
+    async def warm_up_agent() -> None:
+        """
+        Send a warmup prompt through the agent (LLM connection, model load),
+        its thread is removed from the agent memory afterwards.
+        """
+        agent = getattr(app.state, "agent", None)
+        if agent is None:
+            return
+        try:
+            await agent.ainvoke(
+                {"messages": WARMUP_PROMPT},
+                config=RunnableConfig(
+                    configurable={"thread_id": WARMUP_THREAD_ID}
+                )
+            )
+            logger.info("MoziChem agent warmed up.")
+        except Exception as e:
+            logger.warning("Agent warmup failed: %s", e)
+        finally:
+            if agent.checkpointer is not None:
+                agent.checkpointer.delete_thread(WARMUP_THREAD_ID)
+
+    async def start_agent() -> None:
+        """
+        Create the agent (if needed) and warm it up when enabled, run in the
+        lifespan before the server accepts requests.
+        """
+        await ensure_agent()
+        if warmup:
+            await warm_up_agent()
+
+    app.state.on_startup = start_agent
 
     # SECTION: websockets configurations
     # set client
-    websocket_clients = set()
+    # NOTE: clients by room (thread_id), the "" room receives all threads,
+    # kept as immutable snapshots (replaced on connect/disconnect) so
+    # broadcasts iterate them without copying
+    websocket_rooms: Dict[str, Tuple[WebSocket, ...]] = {}
+    # clients receiving binary frames (raw UTF-8 JSON, no per-client encoding)
+    binary_clients: Set[WebSocket] = set()
+
+    def drop_client(room: str, websocket: WebSocket) -> None:
+        """Remove a client from its room and the binary clients."""
+        binary_clients.discard(websocket)
+        clients = tuple(
+            ws for ws in websocket_rooms.get(room, ()) if ws is not websocket
+        )
+        if clients:
+            websocket_rooms[room] = clients
+        else:
+            websocket_rooms.pop(room, None)
 
     @app.websocket("/ws")
-    async def websocket_endpoint(websocket: WebSocket):
+    async def websocket_endpoint(
+        websocket: WebSocket,
+        thread_id: Optional[str] = None,
+        binary: bool = False
+    ):
+        room = thread_id or ALL_THREADS_ROOM
         await websocket.accept()
-        websocket_clients.add(websocket)
+        websocket_rooms[room] = websocket_rooms.get(room, ()) + (websocket,)
+        if binary:
+            binary_clients.add(websocket)
         try:
             while True:
                 await websocket.receive_text()  # Ignore incoming messages
         except Exception:
             pass
         finally:
-            websocket_clients.remove(websocket)
+            drop_client(room, websocket)
 
-    async def broadcast_log(log: str):
-        for ws in list(websocket_clients):
-            try:
-                # not empty log
-                if log and len(log.strip()) > 0:
-                    # send log to websocket
-                    await ws.send_text(log)
-            except Exception:
-                websocket_clients.remove(ws)
-
-    async def broadcast_agent_log(log: AgentMessage):
-        for ws in list(websocket_clients):
-            try:
-                await ws.send_text(json.dumps(log.model_dump()))
-            except Exception:
-                websocket_clients.remove(ws)
+    async def broadcast(
+        payload: Union[str, bytes],
+        thread_id: Optional[str] = None
+    ):
+        """
+        Send a payload concurrently to the clients of a thread and to the
+        clients of all threads, clients that fail are dropped. The payload is
+        encoded (or decoded) at most once for all clients.
+        """
+        rooms = (ALL_THREADS_ROOM, thread_id) if thread_id else (
+            ALL_THREADS_ROOM,)
+        targets = [
+            (room, ws)
+            for room in rooms
+            for ws in websocket_rooms.get(room, ())
+        ]
+        if not targets:
+            return
+
+        # NOTE: text frames for the default clients, bytes for binary ones
+        text = payload if isinstance(payload, str) else None
+        data = payload if isinstance(payload, bytes) else None
+        sends = []
+        for _, ws in targets:
+            if ws in binary_clients:
+                if data is None:
+                    data = text.encode("utf-8")
+                sends.append(ws.send_bytes(data))
+            else:
+                if text is None:
+                    text = data.decode("utf-8")
+                sends.append(ws.send_text(text))
+
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for (room, ws), result in zip(targets, results):
+            if isinstance(result, Exception):
+                drop_client(room, ws)
+
+    async def broadcast_log(log: str, thread_id: Optional[str] = None):
+        # NOTE: skip empty logs (isspace allocates no stripped copy)
+        if not log or log.isspace():
+            return
+        await broadcast(log, thread_id)
+
+    async def broadcast_agent_log(
+        log: AgentMessage,
+        thread_id: Optional[str] = None
+    ):
+        # NOTE: serialize once for all clients
+        await broadcast(AGENT_MSG_ADAPTER.dump_json(log), thread_id)
+
+    def chat_response(
+        role: str,
+        content: str,
+        thread_id: Optional[str] = None,
+        response_time: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        messages: Optional[list] = None,
+        input_tokens: int = DEFAULT_INPUT_TOKENS,
+        output_tokens: int = DEFAULT_OUTPUT_TOKENS
+    ) -> ORJSONResponse:
+        """
+        Build a ChatMessage response as a plain dict serialized directly with
+        orjson (no model construction or re-validation). The agent response
+        time is also reported as a Server-Timing header.
+        """
+        headers = (
+            {"Server-Timing": f"agent;dur={response_time * 1000:.1f}"}
+            if response_time is not None else None
+        )
+        return ORJSONResponse(
+            {
+                "role": role,
+                "content": content,
+                "messages": messages or [],
+                "thread_id": thread_id,
+                "response_time": response_time,
+                "timestamp": timestamp if timestamp is not None else time.time(),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens
+            },
+            headers=headers
+        )
+
+    def error_chat_response(
+        content: str,
+        thread_id: Optional[str],
+        timestamp: Optional[float],
+        response_time: Optional[float] = None
+    ) -> ORJSONResponse:
+        """
+        Build the fallback assistant reply of a failed chat (no messages,
+        default token counts).
+        """
+        return chat_response(
+            role="assistant",
+            content=content,
+            thread_id=thread_id,
+            response_time=response_time,
+            timestamp=timestamp
+        )
 
     # SECTION: Register the API routes
 
@@ -210,40 +722,26 @@ async def create_api(
         Initialize the agent with the provided parameters.
         """
         try:
-            app.state.agent = await create_agent(
-                model_provider=model_provider,
-                model_name=model_name,
-                agent_name=agent_name,
-                agent_prompt=agent_prompt,
-                mcp_source=mcp_source,
-                memory_mode=memory_mode,
-                **kwargs
-            )
-            return JSONResponse(
-                content={
-                    "message": "Agent initialized successfully",
-                    "success": True
-                },
-                status_code=200
+            async with updating_agent():
+                await apply_agent_settings(app.state.agent_settings)
+            return Response(
+                content=AGENT_INITIALIZED_BODY,
+                media_type="application/json"
             )
         except Exception as e:
-            logger.error(f"Error initializing agent: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to initialize agent: {e}"
-            )
+            raise server_error(
+                "agent_initialization_failed",
+                "Failed to initialize agent"
+            ) from e
 
     @app.get("/mozichem-ai")
     async def root():
         """
         Root endpoint to check if the API is running.
         """
-        return JSONResponse(
-            content={
-                "message": "MoziChem AI API is running",
-                "success": True
-            },
-            status_code=200
+        return Response(
+            content=ROOT_BODY,
+            media_type="application/json"
         )
 
     @app.get("/agent-initialization")
@@ -253,282 +751,351 @@ async def create_api(
         """
         return await agent_initialization()
 
+    # NOTE: serialized config GET bodies, rebuilt when the settings snapshot
+    # changes (every config write replaces it)
+    config_bodies: Dict[str, Tuple[AgentSettings, bytes]] = {}
+
+    def config_body(
+        name: str,
+        build: Callable[[AgentSettings], Dict[str, Any]]
+    ) -> Response:
+        """
+        Return the cached JSON body of a config GET endpoint, serialized once
+        per settings snapshot.
+        """
+        settings = app.state.agent_settings
+        cached = config_bodies.get(name)
+        if cached is None or cached[0] is not settings:
+            cached = (settings, dumps(build(settings)))
+            config_bodies[name] = cached
+        return Response(content=cached[1], media_type="application/json")
+
     @app.get("/mcp-source")
     async def get_mcp_source():
         """
         Endpoint to get the current MCP source configuration.
         """
-        return JSONResponse(
-            content={
-                "message": "MCP source configuration retrieved successfully",
-                "success": True,
-                "data": app.state.mcp_source,
-            },
-            status_code=200
-        )
+        return config_body("mcp-source", lambda settings: {
+            "message": "MCP source configuration retrieved successfully",
+            "success": True,
+            "data": settings.mcp_source,
+        })
 
     @app.get("/agent-config")
     async def get_agent_config():
         """
         Endpoint to get the current agent configuration.
         """
-        return JSONResponse(
-            content={
-                "message": "Agent configuration retrieved successfully",
-                "success": True,
-                "data": {
-                    "model_provider": app.state.model_provider,
-                    "model_name": app.state.model_name,
-                    "agent_name": app.state.agent_name,
-                    "agent_prompt": app.state.agent_prompt,
-                    "mcp_source": app.state.mcp_source,
-                    "memory_mode": app.state.memory_mode
-                },
+        return config_body("agent-config", lambda settings: {
+            "message": "Agent configuration retrieved successfully",
+            "success": True,
+            "data": {
+                "model_provider": settings.model_provider,
+                "model_name": settings.model_name,
+                "agent_name": settings.agent_name,
+                "agent_prompt": settings.agent_prompt,
+                "mcp_source": settings.mcp_source,
+                "memory_mode": settings.memory_mode
             },
-            status_code=200
-        )
+        })
 
     @app.get("/llm-config")
     async def get_llm_config():
         """
         Endpoint to get the current LLM configuration.
         """
-        return JSONResponse(
-            content={
-                "model_provider": app.state.model_provider,
-                "model_name": app.state.model_name,
-                "temperature": app.state.temperature,
-                "max_tokens": app.state.max_tokens,
-                "success": True
-            },
-            status_code=200
+        return config_body("llm-config", lambda settings: {
+            "model_provider": settings.model_provider,
+            "model_name": settings.model_name,
+            "temperature": settings.temperature,
+            "max_tokens": settings.max_tokens,
+            "success": True
+        })
+
+    @app.get("/agent-status")
+    async def get_agent_status():
+        """
+        Endpoint to get the status of the agent updates, "updating" while
+        background updates are pending, otherwise the outcome of the last
+        one ("ready" or "failed").
+        """
+        status = (
+            "updating" if app.state.agent_updates_pending
+            else app.state.agent_last_update
         )
+        return ORJSONResponse({"status": status, "success": True})
 
     @app.post("/agent-config")
     async def set_agent_config(
-        agent_config: AgentConfig
+        agent_config: AgentConfig,
+        background_tasks: BackgroundTasks,
+        background: bool = False
     ):
         """
-        Config the agent with the necessary parameters.
+        Config the agent with the necessary parameters, with
+        `background=true` the agent is updated after a `202` response.
         """
         try:
-            # SECTION: extract parameters from the agent_config
-            model_provider_ = agent_config.model_provider
-            model_name_ = agent_config.model_name
-            agent_name_ = agent_config.agent_name
-            agent_prompt_ = agent_config.agent_prompt
-            mcp_source_ = agent_config.mcp_source
-            memory_mode_ = agent_config.memory_mode
-
-            # SECTION: validate the agent configuration
-            # NOTE: update the initial arguments
-            nonlocal model_provider, model_name, agent_name, agent_prompt, mcp_source, memory_mode
-
-            # update the initial arguments
-            if model_provider_ is not None:
-                model_provider = model_provider_
-            if model_name_ is not None:
-                model_name = model_name_
-            if agent_name_ is not None:
-                agent_name = agent_name_
-            if agent_prompt_ is not None:
-                agent_prompt = agent_prompt_
-            if mcp_source_ is not None:
-                mcp_source = mcp_source_
-            if memory_mode_ is not None:
-                memory_mode = memory_mode_
-
-            # SECTION: llm configuration
-            app.state.temperature = kwargs.get(
-                'temperature',
-                DEFAULT_TEMPERATURE
-            )
-            app.state.max_tokens = kwargs.get(
-                'max_tokens',
-                DEFAULT_MAX_TOKENS
-            )
-
-            # update kwargs with the new values
-            kwargs['temperature'] = app.state.temperature
-            kwargs['max_tokens'] = app.state.max_tokens
+            # SECTION: new settings from the provided fields
+            updates = {
+                key: value
+                for key, value in agent_config.model_dump().items()
+                if value is not None
+            }
+
+            async def update() -> AgentSettings:
+                current = app.state.agent_settings
+                settings = replace(current, **updates)
+                # NOTE: unchanged settings keep the current agent
+                if settings == current and agent_exists():
+                    return current
+                # NOTE: a model change alone keeps the agent and its tools
+                if replace(
+                    settings,
+                    model_provider=current.model_provider,
+                    model_name=current.model_name
+                ) == current:
+                    await apply_llm_settings(settings)
+                else:
+                    await apply_agent_settings(settings)
+                return settings
 
-            # NOTE: update the app state
-            app.state.model_provider = model_provider
-            app.state.model_name = model_name
-            app.state.agent_name = agent_name
-            app.state.agent_prompt = agent_prompt
-            app.state.mcp_source = mcp_source
-            app.state.memory_mode = memory_mode
+            if background:
+                return accept_agent_update(background_tasks, update)
 
             # NOTE: create or update the agent in app.state
-            app.state.agent = await create_agent(
-                model_provider=model_provider,
-                model_name=model_name,
-                agent_name=agent_name,
-                agent_prompt=agent_prompt,
-                mcp_source=mcp_source,
-                memory_mode=memory_mode,
-                **kwargs
-            )
+            async with updating_agent():
+                settings = await update()
 
             # return
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
-                    "message": f"Agent configured successfully with model: {model_provider} - {model_name}, agent: {agent_name}, prompt: {agent_prompt}, mcp_source: {mcp_source}, memory_mode: {memory_mode}",
+                    "message": f"Agent configured successfully with model: {settings.model_provider} - {settings.model_name}, agent: {settings.agent_name}, prompt: {settings.agent_prompt}, mcp_source: {settings.mcp_source}, memory_mode: {settings.memory_mode}",
                     "success": True
                 },
                 status_code=200
             )
         except Exception as e:
-            logger.error(f"Error configuring agent: {e}")
-            raise HTTPException(
-                status_code=500, detail=f"Failed to configure agent: {e}")
+            raise server_error(
+                "agent_config_failed",
+                "Failed to configure agent"
+            ) from e
 
     @app.post("/mcp-config")
     async def set_mcp_config(
-        mcp_config: Dict[str, dict]  # Accept raw dicts
+        mcp_config: Dict[str, MCP],
+        background_tasks: BackgroundTasks,
+        background: bool = False
     ):
         """
-        Config the MCP source with the necessary parameters.
+        Config the MCP source with the necessary parameters, with
+        `background=true` the agent is updated after a `202` response.
         """
         try:
             # NOTE: log the received MCP configuration
-            logger.info(f"Received MCP configuration: {mcp_config}")
-
-            # SECTION: Validate each config using discriminated union
-            validated_config = {}
-            for key, value in mcp_config.items():
-                transport = value.get("transport")
-                if transport == "stdio":
-                    # Validate using stdioMCP model and convert to dict
-                    validated_config[key] = stdioMCP(**value).model_dump()
-                elif transport == "streamable_http":
-                    validated_config[key] = streamableHttpMCP(
-                        **value).model_dump()
-                else:
-                    raise ValueError(f"Unknown transport: {transport}")
+            logger.info("Received MCP configuration: %s", mcp_config)
+
+            # SECTION: the configs, validated with the request body
+            # (dispatched on the transport)
+            validated_config = MCP_CONFIG_ADAPTER.dump_python(mcp_config)
 
-            # SECTION: update the mcp_source in app.state
-            app.state.mcp_source = validated_config
             # log
             logger.info(
-                f"Updated MCP source validated_config: {validated_config}")
-            logger.info(f"Updated MCP source: {app.state.mcp_source}")
+                "Updated MCP source validated_config: %s", validated_config)
 
             # SECTION: reinitialize the agent with the new MCP configuration
-            app.state.agent = await create_agent(
-                model_provider=app.state.model_provider,
-                model_name=app.state.model_name,
-                agent_name=app.state.agent_name,
-                agent_prompt=app.state.agent_prompt,
-                mcp_source=app.state.mcp_source,
-                memory_mode=app.state.memory_mode,
-                **kwargs
-            )
+            async def update() -> AgentSettings:
+                settings = replace(
+                    app.state.agent_settings,
+                    mcp_source=validated_config
+                )
+                # NOTE: validated above, used without re-validation
+                await apply_agent_settings(settings, trusted_mcp=True)
+                return settings
+
+            if background:
+                return accept_agent_update(background_tasks, update)
+
+            async with updating_agent():
+                settings = await update()
 
             # NOTE: return success message
             logger.info("MCP source configured successfully")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "message": "MCP source configured successfully",
                     "success": True,
-                    "data": app.state.mcp_source
+                    "data": settings.mcp_source
                 },
                 status_code=200
             )
         except Exception as e:
-            logger.error(f"Error configuring MCP source: {e}")
-            raise HTTPException(
-                status_code=500, detail=f"Failed to configure MCP source: {e}")
+            raise server_error(
+                "mcp_config_failed",
+                "Failed to configure MCP source"
+            ) from e
 
     @app.post("/llm-config")
     async def set_llm_config(
-        llm_config: LlmConfig
+        llm_config: LlmConfig,
+        background_tasks: BackgroundTasks,
+        background: bool = False
     ):
         """
-        Config the LLM with the necessary parameters.
+        Config the LLM with the necessary parameters, with `background=true`
+        the LLM is swapped after a `202` response.
         """
         try:
-            # SECTION: extract parameters from the llm_config
-            model_provider_ = llm_config.model_provider
-            model_name_ = llm_config.model_name
-            temperature_ = llm_config.temperature
-            max_tokens_ = llm_config.max_tokens
-
-            # NOTE: update the agent's LLM configuration
-            if model_provider_ is not None:
-                model_provider = model_provider_
-                # set the app state
-                app.state.model_provider = model_provider_
-            else:
-                model_provider = app.state.model_provider
-
-            # NOTE: update the model_name
-            if model_name_ is not None:
-                model_name = model_name_
-                # set the app state
-                app.state.model_name = model_name_
-            else:
-                model_name = app.state.model_name
-
-            # NOTE: update the temperature
-            if temperature_ is not None:
-                # update the kwargs for temperature
-                kwargs['temperature'] = temperature_
-                # app sate
-                app.state.temperature = temperature_
-
-            # NOTE: update the max_tokens
-            if max_tokens_ is not None:
-                # update the kwargs for max_tokens
-                kwargs['max_tokens'] = max_tokens_
-                # app state
-                app.state.max_tokens = max_tokens_
-
-            # SECTION: reinitialize the agent with the new LLM configuration
-            app.state.agent = await create_agent(
-                model_provider=model_provider,
-                model_name=model_name,
-                agent_name=agent_name,
-                agent_prompt=agent_prompt,
-                mcp_source=mcp_source,
-                memory_mode=memory_mode,
-                **kwargs
-            )
+            # SECTION: new settings from the llm_config
+            updates = {
+                key: value
+                for key, value in llm_config.model_dump().items()
+                if value is not None
+            }
+
+            # SECTION: swap the LLM of the current agent (no MCP work)
+            async def update() -> AgentSettings:
+                current = app.state.agent_settings
+                settings = replace(current, **updates)
+                # NOTE: unchanged settings keep the current agent
+                if settings == current and agent_exists():
+                    return current
+                await apply_llm_settings(settings)
+                return settings
+
+            if background:
+                return accept_agent_update(background_tasks, update)
+
+            async with updating_agent():
+                settings = await update()
 
             # NOTE: return success message
             logger.info("LLM configured successfully")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
-                    "message": f"LLM configured successfully with model: {model_provider} - {model_name}, temperature: {app.state.temperature}, max_tokens: {app.state.max_tokens}",
+                    "message": f"LLM configured successfully with model: {settings.model_provider} - {settings.model_name}, temperature: {settings.temperature}, max_tokens: {settings.max_tokens}",
                     "success": True
                 },
                 status_code=200
             )
         except Exception as e:
-            logger.error(f"Error configuring LLM: {e}")
-            raise HTTPException(
-                status_code=500, detail=f"Failed to configure LLM: {e}")
+            raise server_error(
+                "llm_config_failed",
+                "Failed to configure LLM"
+            ) from e
+
+    async def agent_token_stream(
+        thread_id: str,
+        user_content: str,
+        timestamp: float
+    ) -> AsyncIterator[bytes]:
+        """
+        Run the agent on a user message and yield the reply tokens as
+        server-sent events as soon as they are produced.
+        """
+        # SECTION: Ensure the agent is created
+        agent = await ready_agent()
+        if agent is None:
+            logger.error("MoziChem agent is not created yet.")
+            yield sse_event(
+                {"content": "MoziChem agent is not created yet."},
+                event="error"
+            )
+            return
 
-    @app.post("/chat", response_model=ChatMessage)
+        try:
+            # NOTE: Measure computation time
+            start_time = time.perf_counter()
+
+            # NOTE: same-thread requests run in order, within the run slots
+            async with thread_lock(thread_id), app.state.chat_admission.slot():
+                # SECTION: stream the reply tokens
+                async for chunk, _ in agent.astream(
+                    {"messages": [
+                        HumanMessage(content=user_content),
+                    ]},
+                    config=RunnableConfig(
+                        configurable={
+                            "thread_id": thread_id
+                        }
+                    ),
+                    stream_mode="messages"
+                ):
+                    if isinstance(chunk, ToolMessage):
+                        continue
+                    if (
+                        isinstance(chunk, AIMessage) and
+                        isinstance(chunk.content, str) and
+                        chunk.content
+                    ):
+                        yield sse_event({"content": chunk.content})
+
+            # NOTE: final event
+            yield sse_event(
+                {
+                    "thread_id": thread_id,
+                    "timestamp": timestamp,
+                    "response_time": time.perf_counter() - start_time
+                },
+                event="done"
+            )
+        except Exception as e:
+            logger.error("Error in user_agent_chat: %s", e)
+            yield sse_event(
+                {"content": f"Failed to process user message: {e}"},
+                event="error"
+            )
+
+    @app.post(
+        "/chat",
+        response_model=None,
+        responses={200: {"model": ChatMessage}},
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": ChatMessage.model_json_schema()
+                    }
+                }
+            }
+        }
+    )
     async def user_agent_chat(
-        user_message: ChatMessage
+        request: Request
     ):
         """
         Handle user-agent chat interaction.
 
         Parameters
         ----------
-        user_message : ChatMessage
-            The message from the user to the agent.
+        request : Request
+            The request, its body is the ChatMessage from the user to the
+            agent (validated directly from the raw JSON).
+            `Accept: text/event-stream` streams the reply tokens.
 
         Returns
         -------
-        ChatMessage
-            The response from the agent to the user.
+        ChatMessage | StreamingResponse
+            The response from the agent to the user, or the reply tokens as
+            server-sent events (`data` events with `{"content": ...}`, then a
+            `done` event with the thread_id, timestamp and response_time, or
+            an `error` event).
         """
+        # NOTE: parse and validate the body in one pass
+        try:
+            user_message = CHAT_MSG_ADAPTER.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ])
+
+        # NOTE: reject when the chat queue is full
+        app.state.chat_admission.check()
+
         # NOTE: log
-        logger.info(f"Received user message: {user_message}")
+        logger.info("Received user message: %s", user_message)
         # SECTION: Extract the thread_id from the user message
         thread_id = user_message.thread_id
         user_content = user_message.content
@@ -537,47 +1104,64 @@ async def create_api(
 
         # NOTE: Generate a new thread if thread_id is not provided
         if not thread_id:
-            _, new_thread_id = generate_thread()
-            thread_id = new_thread_id
-            user_message.thread_id = new_thread_id
+            thread_id = generate_thread_id()
 
         # timestamp
         if not timestamp:
             timestamp = time.time()
-            user_message.timestamp = timestamp
+
+        # NOTE: opt-in streaming of the reply tokens
+        if "text/event-stream" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                agent_token_stream(thread_id, user_content, timestamp),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
+            )
 
         try:
             # SECTION: Ensure the agent is created
-            agent = getattr(app.state, "agent", None)
+            agent = await ready_agent()
             if agent is None:
                 logger.error("MoziChem agent is not created yet.")
-                return ChatMessage(
-                    role="assistant",
-                    content="MoziChem agent is not created yet.",
+                return error_chat_response(
+                    "MoziChem agent is not created yet.",
+                    thread_id,
+                    timestamp
+                )
+
+            # NOTE: repeated message of an agent without memory
+            settings = app.state.agent_settings
+            cached = app.state.chat_cache.get(settings, user_content)
+            if cached is not None:
+                tokens_saved = max(cached["input_tokens"], 0) + \
+                    max(cached["output_tokens"], 0)
+                logger.info("Chat cache hit, tokens saved: %s", tokens_saved)
+                return chat_response(
                     thread_id=thread_id,
-                    response_time=None,
+                    response_time=0.0,
                     timestamp=timestamp,
-                    input_tokens=DEFAULT_INPUT_TOKENS,
-                    output_tokens=DEFAULT_OUTPUT_TOKENS
+                    **cached
                 )
 
             # NOTE: Measure computation time
-            start_time = time.time()
-
-            # NOTE: Invoke the agent with the user message
-            response = await agent.ainvoke(
-                {
-                    "messages": user_content
-                },
-                config=RunnableConfig(
-                    configurable={
-                        "thread_id": thread_id,
-                    }
+            start_time = time.perf_counter()
+
+            # NOTE: Invoke the agent with the user message,
+            # same-thread requests run in order, within the run slots
+            async with thread_lock(thread_id), app.state.chat_admission.slot():
+                response = await agent.ainvoke(
+                    {
+                        "messages": user_content
+                    },
+                    config=RunnableConfig(
+                        configurable={
+                            "thread_id": thread_id,
+                        }
+                    )
                 )
-            )
 
             # NOTE: Measure end time and calculate response time
-            end_time = time.time()
+            end_time = time.perf_counter()
             response_time = end_time - start_time
 
             # SECTION: Check response and return the last message
@@ -589,64 +1173,130 @@ async def create_api(
 
                     # NOTE: token metadata
                     token_metadata = message_token_counter(response_message)
-                    # set default values if not present
-                    input_tokens = token_metadata.input_tokens if hasattr(
-                        token_metadata, 'input_tokens') else DEFAULT_INPUT_TOKENS
-                    output_tokens = token_metadata.output_tokens if hasattr(
-                        token_metadata, 'output_tokens') else DEFAULT_OUTPUT_TOKENS
+                    input_tokens = token_metadata.input_tokens
+                    output_tokens = token_metadata.output_tokens
 
                     # NOTE: main response
-                    return ChatMessage(
-                        role="assistant",
-                        content=getattr(response_message,
-                                        "content", str(response_message)),
+                    reply = {
+                        "role": "assistant",
+                        "content": getattr(response_message,
+                                           "content", str(response_message)),
+                        "messages": messages,
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens
+                    }
+                    app.state.chat_cache.put(settings, user_content, reply)
+                    return chat_response(
                         thread_id=thread_id,
                         response_time=response_time,
                         timestamp=timestamp,
-                        messages=messages,
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens
+                        **reply
                     )
                 else:
                     logger.error("Agent did not return any messages.")
-                    return ChatMessage(
-                        role="assistant",
-                        content="Agent did not return any messages.",
-                        thread_id=thread_id,
-                        response_time=response_time,
-                        timestamp=timestamp,
-                        messages=[],
-                        input_tokens=DEFAULT_INPUT_TOKENS,
-                        output_tokens=DEFAULT_OUTPUT_TOKENS
+                    return error_chat_response(
+                        "Agent did not return any messages.",
+                        thread_id,
+                        timestamp,
+                        response_time=response_time
                     )
             else:
                 logger.error("Agent response is not a valid dictionary.")
-                return ChatMessage(
-                    role="assistant",
-                    content="Agent response is not a valid dictionary.",
-                    thread_id=thread_id,
-                    response_time=response_time,
-                    timestamp=timestamp,
-                    messages=[],
-                    input_tokens=DEFAULT_INPUT_TOKENS,
-                    output_tokens=DEFAULT_OUTPUT_TOKENS
+                return error_chat_response(
+                    "Agent response is not a valid dictionary.",
+                    thread_id,
+                    timestamp,
+                    response_time=response_time
                 )
         except Exception as e:
-            logger.error(f"Error in user_agent_chat: {e}")
-            return ChatMessage(
-                role="assistant",
-                content=f"Failed to process user message: {e}",
-                thread_id=thread_id,
-                response_time=None,
-                timestamp=timestamp,
-                messages=[],
-                input_tokens=DEFAULT_INPUT_TOKENS,
-                output_tokens=DEFAULT_OUTPUT_TOKENS
+            logger.error("Error in user_agent_chat: %s", e)
+            return error_chat_response(
+                f"Failed to process user message: {e}",
+                thread_id,
+                timestamp
+            )
+
+    async def agent_step_stream(
+        thread_id: str,
+        user_content: str,
+        timestamp: float
+    ) -> AsyncIterator[bytes]:
+        """
+        Run the agent on a user message and yield each agent step as a
+        server-sent event as soon as it is produced, the steps are also
+        broadcast to the websocket clients of the thread.
+        """
+        # SECTION: Ensure the agent is created
+        agent = await ready_agent()
+        if agent is None:
+            logger.error("MoziChem agent is not created yet.")
+            yield sse_event(
+                {"content": "MoziChem agent is not created yet."},
+                event="error"
+            )
+            return
+
+        try:
+            # NOTE: Measure computation time
+            start_time = time.perf_counter()
+            response_message = None
+
+            # NOTE: same-thread requests run in order, within the run slots
+            async with thread_lock(thread_id), app.state.chat_admission.slot():
+                async for chunk in agent.astream(
+                    {"messages": [
+                        HumanMessage(content=user_content),
+                    ]},
+                    config=RunnableConfig(
+                        configurable={
+                            "thread_id": thread_id
+                        }
+                    ),
+                    stream_mode="updates"
+                ):
+                    if not isinstance(chunk, dict):
+                        logger.error(
+                            "Received non-dictionary chunk: %s", chunk)
+                        continue
+
+                    for value in chunk.values():
+                        messages = value['messages']
+                        if messages:
+                            response_message = messages[-1]
+                        for agent_message in agent_messages_analyzer(messages):
+                            # LINK: websocket side channel
+                            await broadcast_agent_log(agent_message, thread_id)
+                            yield sse_event(
+                                AGENT_MSG_ADAPTER.dump_json(agent_message))
+
+            # NOTE: final event
+            token_metadata = message_token_counter(response_message) \
+                if response_message is not None else TokenMetadata()
+            yield sse_event(
+                {
+                    "thread_id": thread_id,
+                    "timestamp": timestamp,
+                    "response_time": time.perf_counter() - start_time,
+                    "input_tokens": token_metadata.input_tokens,
+                    "output_tokens": token_metadata.output_tokens
+                },
+                event="done"
+            )
+        except Exception as e:
+            logger.error("Error in user_agent_chat_stream: %s", e)
+            yield sse_event(
+                {"content": f"Failed to process user message: {e}"},
+                event="error"
             )
 
-    @app.post("/chat-stream", response_model=ChatMessage)
+    @app.post(
+        "/chat-stream",
+        response_model=None,
+        responses={200: {"model": ChatMessage}}
+    )
     async def user_agent_chat_stream(
-        user_message: ChatMessage
+        user_message: ChatMessage,
+        request: Request
     ):
         """
         Handle user-agent chat interaction.
@@ -655,14 +1305,22 @@ async def create_api(
         ----------
         user_message : ChatMessage
             The message from the user to the agent.
+        request : Request
+            The request, `Accept: text/event-stream` streams the agent steps.
 
         Returns
         -------
-        ChatMessage
-            The response from the agent to the user.
+        ChatMessage | StreamingResponse
+            The response from the agent to the user, or the agent steps as
+            server-sent events (`data` events with the AgentMessage of each
+            step, then a `done` event with the thread_id, timestamp,
+            response_time and tokens, or an `error` event).
         """
+        # NOTE: reject when the chat queue is full
+        app.state.chat_admission.check()
+
         # NOTE: log
-        logger.info(f"Received user message: {user_message}")
+        logger.info("Received user message: %s", user_message)
         # SECTION: Extract the thread_id from the user message
         thread_id = user_message.thread_id
         user_content = user_message.content
@@ -671,75 +1329,84 @@ async def create_api(
 
         # NOTE: Generate a new thread if thread_id is not provided
         if not thread_id:
-            _, new_thread_id = generate_thread()
-            thread_id = new_thread_id
-            user_message.thread_id = new_thread_id
+            thread_id = generate_thread_id()
 
         # timestamp
         if not timestamp:
             timestamp = time.time()
-            user_message.timestamp = timestamp
+
+        # NOTE: opt-in streaming of the agent steps
+        if "text/event-stream" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                agent_step_stream(thread_id, user_content, timestamp),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
+            )
 
         try:
             # SECTION: Ensure the agent is created
-            agent = getattr(app.state, "agent", None)
+            agent = await ready_agent()
             if agent is None:
                 logger.error("MoziChem agent is not created yet.")
-                return ChatMessage(
-                    role="assistant",
-                    content="MoziChem agent is not created yet.",
+                return error_chat_response(
+                    "MoziChem agent is not created yet.",
+                    thread_id,
+                    timestamp
+                )
+
+            # NOTE: repeated message of an agent without memory
+            settings = app.state.agent_settings
+            cached = app.state.chat_cache.get(settings, user_content)
+            if cached is not None:
+                tokens_saved = max(cached["input_tokens"], 0) + \
+                    max(cached["output_tokens"], 0)
+                logger.info("Chat cache hit, tokens saved: %s", tokens_saved)
+                return chat_response(
                     thread_id=thread_id,
-                    response_time=None,
+                    response_time=0.0,
                     timestamp=timestamp,
-                    input_tokens=DEFAULT_INPUT_TOKENS,
-                    output_tokens=DEFAULT_OUTPUT_TOKENS
+                    **cached
                 )
 
             # NOTE: Measure computation time
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # SECTION: Invoke the agent with the user message
-            async for chunk in agent.astream(
-                {"messages": [
-                    HumanMessage(content=user_content),
-                ]},
-                config=RunnableConfig(
-                    configurable={
-                        "thread_id": thread_id
-                    }
-                ),
-                stream_mode="updates"
-            ):
-                # NOTE: Process each chunk
-                if not isinstance(chunk, dict):
-                    logger.error(f"Received non-dictionary chunk: {chunk}")
-                    return ChatMessage(
-                        role="assistant",
-                        content="Agent response is not a valid dictionary.",
-                        thread_id=thread_id,
-                        response_time=None,
-                        timestamp=timestamp,
-                        messages=[],
-                        input_tokens=DEFAULT_INPUT_TOKENS,
-                        output_tokens=DEFAULT_OUTPUT_TOKENS
-                    )
-
-                # NOTE: iterate through the messages in the chunk
-                for value in chunk.values():
-                    # get the messages
-                    messages = value['messages']
-
-                    # iterate through messages
-                    for message in messages:
-                        # agent message analyzer
-                        agent_message = agent_message_analyzer(message)
-
-                        # LINK: broadcast the log to all websocket clients
-                        if agent_message:
-                            await broadcast_agent_log(agent_message)
+            # NOTE: same-thread requests run in order, within the run slots
+            async with thread_lock(thread_id), app.state.chat_admission.slot():
+                async for chunk in agent.astream(
+                    {"messages": [
+                        HumanMessage(content=user_content),
+                    ]},
+                    config=RunnableConfig(
+                        configurable={
+                            "thread_id": thread_id
+                        }
+                    ),
+                    stream_mode="updates"
+                ):
+                    # NOTE: Process each chunk
+                    if not isinstance(chunk, dict):
+                        logger.error(
+                            "Received non-dictionary chunk: %s", chunk)
+                        return error_chat_response(
+                            "Agent response is not a valid dictionary.",
+                            thread_id,
+                            timestamp
+                        )
+
+                    # NOTE: iterate through the messages in the chunk
+                    for value in chunk.values():
+                        # get the messages
+                        messages = value['messages']
+
+                        # analyze the messages
+                        for agent_message in agent_messages_analyzer(messages):
+                            # LINK: broadcast the log to all websocket clients
+                            await broadcast_agent_log(agent_message, thread_id)
 
             # NOTE: Measure end time and calculate response time
-            end_time = time.time()
+            end_time = time.perf_counter()
             # time unit is seconds
             response_time = end_time - start_time
 
@@ -750,118 +1417,213 @@ async def create_api(
                 response_message = messages[-1]
                 # NOTE: token metadata
                 token_metadata = message_token_counter(response_message)
-                # set default values if not present
-                input_tokens = token_metadata.input_tokens if hasattr(
-                    token_metadata, 'input_tokens') else DEFAULT_INPUT_TOKENS
-                output_tokens = token_metadata.output_tokens if hasattr(
-                    token_metadata, 'output_tokens') else DEFAULT_OUTPUT_TOKENS
+                input_tokens = token_metadata.input_tokens
+                output_tokens = token_metadata.output_tokens
 
                 # NOTE: main response
-                return ChatMessage(
-                    role="assistant",
-                    content=getattr(response_message,
-                                    "content", str(response_message)),
+                reply = {
+                    "role": "assistant",
+                    "content": getattr(response_message,
+                                       "content", str(response_message)),
+                    "messages": messages,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens
+                }
+                app.state.chat_cache.put(settings, user_content, reply)
+                return chat_response(
                     thread_id=thread_id,
                     response_time=response_time,
                     timestamp=timestamp,
-                    messages=messages,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens
+                    **reply
                 )
             else:
                 # NOTE: no messages returned
                 logger.error("Agent response is not a list of messages.")
-                return ChatMessage(
-                    role="assistant",
-                    content="Agent response is not a list of messages.",
-                    thread_id=thread_id,
-                    response_time=response_time,
-                    timestamp=timestamp,
-                    messages=[],
-                    input_tokens=DEFAULT_INPUT_TOKENS,
-                    output_tokens=DEFAULT_OUTPUT_TOKENS
+                return error_chat_response(
+                    "Agent response is not a list of messages.",
+                    thread_id,
+                    timestamp,
+                    response_time=response_time
                 )
         except Exception as e:
-            logger.error(f"Error in user_agent_chat_stream: {e}")
-            return ChatMessage(
-                role="assistant",
-                content=f"Failed to process user message: {e}",
-                thread_id=thread_id,
-                response_time=None,
-                timestamp=timestamp,
-                messages=[],
-                input_tokens=DEFAULT_INPUT_TOKENS,
-                output_tokens=DEFAULT_OUTPUT_TOKENS
+            logger.error("Error in user_agent_chat_stream: %s", e)
+            return error_chat_response(
+                f"Failed to process user message: {e}",
+                thread_id,
+                timestamp
             )
 
+    @app.get("/metrics")
+    async def get_metrics():
+        """
+        Return the chat admission counters (running and waiting requests)
+        and the LLM prompt cache counters.
+        """
+        from ..agents.react_graph import prompt_cache_stats
+
+        return ORJSONResponse({
+            "chat": app.state.chat_admission.stats(),
+            "prompt_cache": prompt_cache_stats()
+        })
+
     # SECTION: Return the FastAPI application instance
+    def build_app_info(
+        settings: AgentSettings,
+        agent_exists: bool
+    ) -> bytes:
+        """
+        Build the serialized `/app-info` response body of the settings.
+        """
+        # NOTE: app info
+        app_info = AppInfo(
+            name=MoziChemAIAPI_.name,
+            version=MoziChemAIAPI_.version,
+            description=MoziChemAIAPI_.description,
+        )
+
+        # NOTE: Agent details
+        agent_details = AgentDetails(
+            exists=agent_exists,
+            model_provider=settings.model_provider,
+            model_name=settings.model_name,
+            agent_name=settings.agent_name,
+            agent_prompt=settings.agent_prompt,
+            mcp_source=settings.mcp_source,
+            memory_mode=settings.memory_mode,
+        )
+
+        # NOTE: LLM details
+        llm_details = LlmDetails(
+            temperature=settings.temperature,
+            max_tokens=settings.max_tokens
+        )
+
+        # NOTE: Overall settings
+        overall_settings = OverallSettings(
+            cors_origins=MoziChemAIAPI_.cors_origins
+        )
+
+        # NOTE: the ApiConfigSummary model
+        ApiConfigSummary_ = ApiConfigSummary(
+            app=app_info,
+            agent=agent_details,
+            llm=llm_details,
+            settings=overall_settings
+        )
+
+        # NOTE: the summary is serialized by pydantic in one pass and
+        # embedded as is
+        return orjson.dumps({
+            "message": "App info retrieved successfully",
+            "success": True,
+            "data": orjson.Fragment(ApiConfigSummary_.model_dump_json())
+        })
+
+    # NOTE: serialized app info, rebuilt when the settings snapshot changes
+    app.state.app_info_cache = (None, False, b"")
+
     @app.get("/app-info", response_model=ApiConfigSummary)
     async def get_app_info():
         """
         Return app info, agent details, llm details, and overall settings as an ApiConfigSummary model.
         """
         try:
-            # NOTE: Get the agent details
-            agent_obj = getattr(app.state, "agent", None)
-
-            # NOTE: app info
-            app_info = AppInfo(
-                name=MoziChemAIAPI_.name,
-                version=MoziChemAIAPI_.version,
-                description=MoziChemAIAPI_.description,
-            )
+            # NOTE: the settings snapshot is replaced on every config write
+            settings = app.state.agent_settings
+            agent_exists = getattr(app.state, "agent", None) is not None
+            cached_settings, cached_exists, body = app.state.app_info_cache
+            if cached_settings is not settings or cached_exists != agent_exists:
+                body = build_app_info(settings, agent_exists)
+                app.state.app_info_cache = (settings, agent_exists, body)
 
-            # NOTE: Agent details
-            agent_details = AgentDetails(
-                exists=agent_obj is not None,
-                model_provider=app.state.model_provider,
-                model_name=app.state.model_name,
-                agent_name=app.state.agent_name,
-                agent_prompt=app.state.agent_prompt,
-                mcp_source=app.state.mcp_source,
-                memory_mode=app.state.memory_mode,
+            # NOTE: return json response
+            return Response(content=body, media_type="application/json")
+        except Exception:
+            return server_error_response(
+                "app_info_failed",
+                "Failed to retrieve app info"
             )
 
-            # NOTE: LLM details
-            llm_details = LlmDetails(
-                temperature=getattr(
-                    app.state,
-                    "temperature",
-                    DEFAULT_TEMPERATURE
-                ),
-                max_tokens=getattr(
-                    app.state,
-                    "max_tokens",
-                    DEFAULT_MAX_TOKENS
-                )
-            )
+    return app
 
-            # NOTE: Overall settings
-            overall_settings = OverallSettings(
-                cors_origins=MoziChemAIAPI_.cors_origins
-            )
 
-            # NOTE: the ApiConfigSummary model
-            ApiConfigSummary_ = ApiConfigSummary(
-                app=app_info,
-                agent=agent_details,
-                llm=llm_details,
-                settings=overall_settings
-            )
+async def create_api(
+    model_provider: str,
+    model_name: str,
+    agent_name: str,
+    agent_prompt: str,
+    mcp_source: Optional[
+        Union[
+        Dict[str, Dict[str, str]],
+        Dict[str, Dict[str, str] | Dict[str, str]],
+        Dict[str, Dict[str, str | List[str] | Dict[str, str]]],
+        str,
+        Path
+        ]
+    ] = None,
+    memory_mode: bool = True,
+    **kwargs
+) -> FastAPI:
+    """
+    Create and return a FastAPI application instance with the MoziChem AI API.
 
-            # NOTE: return json response
-            return JSONResponse(
-                content={
-                    "message": "App info retrieved successfully",
-                    "success": True,
-                    "data": ApiConfigSummary_.model_dump()
-                },
-                status_code=200
-            )
-        except Exception as e:
-            logger.error(f"Error in get_app_info: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to retrieve app info: {e}"
-            )
+    Parameters
+    ----------
+    model_provider : str
+        The provider of the model to be used (e.g., "openai", "google").
+    model_name : str
+        The name of the model to be used for the agent.
+    agent_name : str
+        The name of the agent.
+    agent_prompt : str
+        The prompt to be used for the agent.
+    mcp_source : Optional[Union[Dict[str, Dict[str, str]],
+        Dict[str, Dict[str, str | List[str]]], str, Path]]
+        A dictionary containing the MCP configurations or a path to a YAML file containing the MCP configurations.
+    memory_mode : bool, optional
+        Whether to enable memory mode for the agent, by default False.
+    kwargs : dict
+        Additional keyword arguments for future extensions.
+        - temperature: float, optional
+            The temperature for the LLM, by default 0.0.
+        - max_tokens: int, optional
+            The maximum number of tokens for the LLM, by default 2048.
+        - cors_origins: List[str], optional
+            A list of allowed CORS origins. If None, defaults to allowing all origins.
+        - name: str, optional
+            The name of the API, by default "MoziChem AI API".
+        - version: str, optional
+            The version of the API, by default "No version set".
+        - description: str, optional
+            A description of the API, by default "No description set".
+        - warmup: bool, optional
+            Whether to send a warmup prompt through the agent at startup,
+            before serving requests, by default False.
+        - arithmetic_shortcut: bool, optional
+            Answer pure `a + b` / `a * b` messages without the LLM (the agent
+            prompt and tools are skipped), by default False.
+
+    Returns
+    -------
+    FastAPI
+        The FastAPI application instance.
+
+    Notes
+    -----
+    The agent, MCP clients and chat memory live in the process that builds
+    the app. To use several CPU cores, build the app at import in a module
+    (`create_api_sync`) and serve it with worker processes
+    (`run_api("app:app", workers=N)`), each worker then builds its own agent.
+    """
+    app = create_api_sync(
+        model_provider,
+        model_name,
+        agent_name,
+        agent_prompt,
+        mcp_source=mcp_source,
+        memory_mode=memory_mode,
+        **kwargs
+    )
+    # NOTE: the agent is ready when the app is returned
+    await app.state.ensure_agent()
     return app
@@ -0,0 +1,36 @@
+# import libs
+from pathlib import PurePath
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    # NOTE: pydantic models (e.g., langchain messages) and paths
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes with orjson, as `ORJSONResponse` does.
+    """
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    '''
+    JSON response serialized with orjson, pydantic models in the content
+    are dumped on the fly.
+    '''
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
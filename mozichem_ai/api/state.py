@@ -0,0 +1,43 @@
+# import libs
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union
+)
+from pathlib import Path
+
+# NOTE: llm defaults
+DEFAULT_TEMPERATURE = 0.0
+DEFAULT_MAX_TOKENS = 2048
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSettings:
+    '''
+    Snapshot of the agent configuration served by the API. Updates replace
+    the snapshot (`dataclasses.replace`) instead of mutating it, readers
+    take the reference once per request.
+    '''
+    model_provider: str
+    model_name: str
+    agent_name: str
+    agent_prompt: str
+    mcp_source: Optional[Union[Dict[str, Any], str, Path]] = None
+    memory_mode: bool = True
+    temperature: float = DEFAULT_TEMPERATURE
+    max_tokens: int = DEFAULT_MAX_TOKENS
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        """Return the settings as keyword arguments for agent creation."""
+        return {
+            "model_provider": self.model_provider,
+            "model_name": self.model_name,
+            "agent_name": self.agent_name,
+            "agent_prompt": self.agent_prompt,
+            "mcp_source": self.mcp_source,
+            "memory_mode": self.memory_mode,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
@@ -0,0 +1,254 @@
+# import libs
+import re
+import gzip
+import os
+import hashlib
+import logging
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Optional,
+    Union
+)
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+from starlette.websockets import WebSocketClose
+
+# NOTE: brotli is optional (speed extra), gzip is used without it
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: content-hashed bundle files (e.g., main-P4CXXPNI.js) never change
+HASHED_NAME_PATTERN = re.compile(r"-[A-Za-z0-9]{8,}\.[a-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+INDEX_FILE = "index.html"
+# files above this size are streamed from disk instead of held in memory
+MAX_MEMORY_FILE_SIZE = 512 * 1024
+# media types of the bundle file extensions (mimetypes is the fallback)
+STATIC_MEDIA_TYPES = MappingProxyType({
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".json": "application/json",
+    ".txt": "text/plain",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".gif": "image/gif",
+    ".ico": "image/x-icon",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".ttf": "font/ttf",
+    ".eot": "application/vnd.ms-fontobject"
+})
+# compressible media types (images and fonts are already compressed)
+COMPRESSIBLE_TYPES = frozenset({
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+    "image/x-icon",
+    "image/vnd.microsoft.icon"
+})
+
+
+@dataclass(frozen=True, slots=True)
+class StaticFile:
+    '''
+    A bundle file held in memory (or, when large, its path and stat) with its
+    precomputed response metadata.
+    '''
+    data: Optional[bytes]
+    gzip: Optional[bytes]
+    br: Optional[bytes]
+    etag: str
+    media_type: str
+    cache_control: str
+    # large files, streamed from disk
+    path: Optional[Path] = None
+    stat: Optional[os.stat_result] = None
+
+
+def is_compressible(media_type: str) -> bool:
+    """Check whether a media type benefits from compression."""
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+def load_static_file(
+    path: Path,
+    name: str,
+    max_memory_size: int = MAX_MEMORY_FILE_SIZE
+) -> StaticFile:
+    """
+    Read a bundle file and precompute its ETag, compressed bodies (gzip and
+    brotli when installed, kept when smaller) and cache policy. Files
+    larger than `max_memory_size` are not read, they are streamed from disk
+    on request.
+    """
+    media_type = STATIC_MEDIA_TYPES.get(path.suffix.lower()) or (
+        mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    )
+    cache_control = (
+        IMMUTABLE_CACHE_CONTROL
+        if HASHED_NAME_PATTERN.search(name)
+        else REVALIDATE_CACHE_CONTROL
+    )
+
+    # NOTE: large file, only its metadata is kept
+    stat = path.stat()
+    if stat.st_size > max_memory_size:
+        etag_base = f"{stat.st_mtime_ns}-{stat.st_size}".encode("utf-8")
+        return StaticFile(
+            data=None,
+            gzip=None,
+            br=None,
+            etag='"' + hashlib.blake2b(
+                etag_base, digest_size=8).hexdigest() + '"',
+            media_type=media_type,
+            cache_control=cache_control,
+            path=path,
+            stat=stat
+        )
+
+    data = path.read_bytes()
+    gzip_body = br_body = None
+    if is_compressible(media_type):
+        gzip_body = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(gzip_body) >= len(data):
+            gzip_body = None
+        if brotli is not None:
+            br_body = brotli.compress(data, quality=11)
+            if len(br_body) >= len(data):
+                br_body = None
+    return StaticFile(
+        data=data,
+        gzip=gzip_body,
+        br=br_body,
+        etag='"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"',
+        media_type=media_type,
+        cache_control=cache_control
+    )
+
+
+class StaticBundle:
+    '''
+    ASGI app serving a built frontend bundle from memory, the files are
+    read, hashed (ETag) and compressed (gzip, brotli) once at startup.
+    Directory paths serve their `index.html`, as `StaticFiles(html=True)`
+    does. Files above `max_memory_size` are streamed from disk.
+    '''
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_memory_size: int = MAX_MEMORY_FILE_SIZE
+    ):
+        '''
+        Load the bundle.
+
+        Parameters
+        ----------
+        directory : str | Path
+            The directory of the built bundle.
+        max_memory_size : int, optional
+            The max size of a file held in memory in bytes, larger files are
+            streamed from disk, by default 512 KiB.
+        '''
+        root = Path(directory)
+        self.files: Dict[str, StaticFile] = {}
+        for path in root.rglob("*"):
+            if path.is_file():
+                name = path.relative_to(root).as_posix()
+                self.files[name] = load_static_file(
+                    path, name, max_memory_size)
+        logger.info("Static bundle loaded: %s files", len(self.files))
+
+    def lookup(self, path: str) -> Optional[StaticFile]:
+        """Return the file of a request path, None if not found."""
+        name = path.lstrip("/")
+        if not name or name.endswith("/"):
+            return self.files.get(name + INDEX_FILE)
+        static_file = self.files.get(name)
+        if static_file is None:
+            static_file = self.files.get(name + "/" + INDEX_FILE)
+        return static_file
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # NOTE: websocket connections to unknown paths
+        if scope["type"] != "http":
+            await WebSocketClose()(scope, receive, send)
+            return
+
+        # NOTE: route path relative to the mount point
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+
+        if scope["method"] not in ("GET", "HEAD"):
+            response = PlainTextResponse("Method Not Allowed", 405)
+            await response(scope, receive, send)
+            return
+
+        static_file = self.lookup(path)
+        if static_file is None:
+            response = PlainTextResponse("Not Found", 404)
+            await response(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        response_headers = {
+            "ETag": static_file.etag,
+            "Cache-Control": static_file.cache_control,
+            "Vary": "Accept-Encoding"
+        }
+
+        # NOTE: conditional request
+        if static_file.etag in headers.get("if-none-match", ""):
+            response = Response(status_code=304, headers=response_headers)
+            await response(scope, receive, send)
+            return
+
+        # NOTE: large file, streamed in blocks of the filesystem size (or
+        # sent by the server with pathsend, when supported)
+        if static_file.data is None:
+            response = FileResponse(
+                static_file.path,
+                headers=response_headers,
+                media_type=static_file.media_type,
+                stat_result=static_file.stat
+            )
+            response.chunk_size = max(
+                static_file.stat.st_blksize, FileResponse.chunk_size)
+            await response(scope, receive, send)
+            return
+
+        # NOTE: content negotiation, brotli preferred over gzip
+        body = static_file.data
+        if static_file.gzip is not None or static_file.br is not None:
+            accepted = {
+                coding.split(";", 1)[0].strip()
+                for coding in headers.get("accept-encoding", "").split(",")
+            }
+            if static_file.br is not None and "br" in accepted:
+                body = static_file.br
+                response_headers["Content-Encoding"] = "br"
+            elif static_file.gzip is not None and "gzip" in accepted:
+                body = static_file.gzip
+                response_headers["Content-Encoding"] = "gzip"
+
+        response = Response(
+            content=body,
+            media_type=static_file.media_type,
+            headers=response_headers
+        )
+        await response(scope, receive, send)
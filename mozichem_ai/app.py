@@ -1,8 +1,8 @@
 # import libs
 import logging
 import os
-import uvicorn
 import asyncio
+import uvicorn
 from typing import (
     Dict,
     List,
@@ -10,12 +10,12 @@ from typing import (
     Optional
 )
 from pathlib import Path
-import mimetypes
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 import webbrowser
 # local
-from .api import create_api
+from .api import create_api_sync
+from .api.static import StaticBundle
+from .api.config_api import WORKERS_ENV
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -76,8 +76,31 @@ def mozichem_chat(
             The version of the API, by default "No version set".
         - description: str, optional
             A description of the API, by default "No description set".
+        - warmup: bool, optional
+            Whether to send a warmup prompt through the agent at startup,
+            before serving requests, by default False.
+        - arithmetic_shortcut: bool, optional
+            Answer pure `a + b` / `a * b` messages without the LLM (the agent
+            prompt and tools are skipped), by default False.
+        - serve_ui: bool, optional
+            Whether to serve the web UI, by default True (False serves the
+            API only).
         - open_browser: bool, optional
             Whether to open the web UI in a browser, by default True.
+        - loop: str, optional
+            The uvicorn event loop ("auto", "uvloop" or "asyncio"), by default
+            "auto" (uvloop when installed).
+        - http: str, optional
+            The uvicorn HTTP protocol ("auto", "httptools" or "h11"), by
+            default "auto" (httptools when installed).
+        - uvicorn_kwargs: dict, optional
+            Additional `uvicorn.Config` settings (e.g., `timeout_keep_alive`,
+            `backlog`, `proxy_headers`).
+
+    Notes
+    -----
+    The web UI is served by a single process, the chat history lives in its
+    memory. To use several worker processes for the API, see `run_api`.
 
     Returns
     -------
@@ -86,11 +109,18 @@ def mozichem_chat(
     """
     try:
         # SECTION: Validate inputs
+        # web ui
+        serve_ui = kwargs.pop("serve_ui", True)
         # open browser
-        open_browser = kwargs.get("open_browser", True)
+        open_browser = kwargs.pop("open_browser", True) and serve_ui
+        # server settings
+        loop = kwargs.pop("loop", "auto")
+        http = kwargs.pop("http", "auto")
+        uvicorn_kwargs = kwargs.pop("uvicorn_kwargs", None) or {}
 
         # SECTION: Create the FastAPI application instance
-        app_instance: FastAPI = asyncio.run(create_api(
+        # NOTE: the agent is created on the server loop, in the app lifespan
+        app_instance: FastAPI = create_api_sync(
             model_provider=model_provider,
             model_name=model_name,
             agent_name=agent_name,
@@ -99,58 +129,132 @@ def mozichem_chat(
             memory_mode=memory_mode,
             **kwargs
         )
-        )
 
         # log
         logger.info(
-            f"FastAPI application created successfully with model: {model_name}, agent: {agent_name}")
-
-        # SECTION: Set up MIME types for static files
-        mimetypes.add_type("text/css", ".css")
-        mimetypes.add_type("application/javascript", ".js")
-        mimetypes.add_type("image/svg+xml", ".svg")
-        mimetypes.add_type("image/png", ".png")
-        mimetypes.add_type("image/jpeg", ".jpg")
-        mimetypes.add_type("image/gif", ".gif")
-        mimetypes.add_type("application/json", ".json")
-        mimetypes.add_type("font/woff", ".woff")
-        mimetypes.add_type("font/woff2", ".woff2")
-        mimetypes.add_type("application/font-ttf", ".ttf")
-        mimetypes.add_type("application/vnd.ms-fontobject", ".eot")
+            "FastAPI application created successfully with model: %s, agent: %s",
+            model_name,
+            agent_name)
 
         # SECTION: Mount Angular static files
-        # path to the Angular dist directory
-        angular_dist_path = os.path.join(
-            os.path.dirname(__file__),
-            'ui',
-            'browser'
-        )
+        if serve_ui:
+            # path to the Angular dist directory
+            angular_dist_path = os.path.join(
+                os.path.dirname(__file__),
+                'ui',
+                'browser'
+            )
 
-        # mount static files
-        app_instance.mount(
-            "/",
-            StaticFiles(directory=angular_dist_path, html=True),
-            name="static"
-        )
+            # mount static files (served from memory)
+            app_instance.mount(
+                "/",
+                StaticBundle(angular_dist_path),
+                name="static"
+            )
+
+        # SECTION: server
+        server = uvicorn.Server(uvicorn.Config(
+            app_instance,
+            host=host,
+            port=port,
+            log_level=log_level,
+            loop=loop,
+            http=http,
+            **uvicorn_kwargs
+        ))
+        # NOTE: stopped by /config/exit
+        app_instance.state.uvicorn_server = server
 
         # SECTION: frontend and backend settings
-        # NOTE: Open web UI for MoziChem Chat
+        # NOTE: Open web UI for MoziChem Chat, once the server is listening
         if open_browser:
-            # log
-            logger.info(f"Opening web UI at http://{host}:{port}")
-            # open in browser
-            webbrowser.open(f"http://{host}:{port}")
+            url = f"http://{host}:{port}"
+            start_app = app_instance.state.on_startup
+
+            async def open_when_listening():
+                while not server.started:
+                    await asyncio.sleep(0.05)
+                # log
+                logger.info("Opening web UI at %s", url)
+                # open in browser (may block on the browser launch)
+                await asyncio.to_thread(webbrowser.open, url)
+
+            async def start_and_open_browser():
+                await start_app()
+                # NOTE: startup runs before the socket is bound
+                app_instance.state.open_browser_task = asyncio.create_task(
+                    open_when_listening())
+
+            app_instance.state.on_startup = start_and_open_browser
 
         # SECTION: Run the FastAPI application
         # NOTE: Run the FastAPI application
-        uvicorn.run(
-            app_instance,
-            host=host,
-            port=port,
-            log_level=log_level
-        )
+        server.run()
         # log
-        logger.info(f"FastAPI application running at http://{host}:{port}")
+        logger.info("FastAPI application running at http://%s:%s", host, port)
     except Exception as e:
-        logger.error(f"Error creating FastAPI application: {e}")
+        logger.error("Error creating FastAPI application: %s", e)
         raise e
+
+
+def run_api(
+    app: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: Optional[int] = None,
+    log_level: str = "info",
+    **kwargs
+):
+    """
+    Serve a MoziChem AI API application with uvicorn worker processes.
+
+    Parameters
+    ----------
+    app : str
+        The import string of the application (e.g., "app:app"), worker
+        processes import it to build their own app.
+    host : str, optional
+        The host address, by default "127.0.0.1".
+    port : int, optional
+        The port number, by default 8000.
+    workers : int, optional
+        The number of worker processes, by default `WEB_CONCURRENCY` or 1.
+    log_level : str, optional
+        The log level, by default "info".
+    kwargs : dict
+        Additional keyword arguments.
+        - loop: str, optional
+            The uvicorn event loop, by default "auto" (uvloop if installed).
+        - http: str, optional
+            The uvicorn HTTP protocol, by default "auto" (httptools if
+            installed).
+        - factory: bool, optional
+            Treat `app` as an application factory, by default False.
+        - uvicorn_kwargs: dict, optional
+            Additional `uvicorn.run` settings (e.g., `timeout_keep_alive`,
+            `backlog`, `proxy_headers`).
+
+    Notes
+    -----
+    Each worker builds its own agent, MCP clients and in-memory chat
+    history, route a `thread_id` to a single worker (sticky sessions) when
+    `memory_mode` is enabled. Agent runs wait on the LLM provider, one worker
+    per CPU core is usually enough (each runs many requests concurrently).
+
+    `GET /config/exit` stops the whole server, with several workers it
+    signals the supervisor process, which stops every worker.
+    """
+    # NOTE: lets /config/exit stop the supervisor of the workers
+    os.environ[WORKERS_ENV] = str(
+        workers or int(os.getenv("WEB_CONCURRENCY", "1")))
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level=log_level,
+        loop=kwargs.get("loop", "auto"),
+        http=kwargs.get("http", "auto"),
+        factory=kwargs.get("factory", False),
+        **(kwargs.get("uvicorn_kwargs") or {})
+    )
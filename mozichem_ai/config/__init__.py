@@ -6,7 +6,12 @@ from .settings import (
     get_config
 )
 # constants
-from .constants import llm_providers, default_token_metadata
+from .constants import (
+    llm_providers,
+    llm_providers_set,
+    llm_providers_str,
+    default_token_metadata
+)
 
 __all__ = [
     "__author__",
@@ -15,5 +20,7 @@ __all__ = [
     "__description__",
     "get_config",
     "llm_providers",
+    "llm_providers_set",
+    "llm_providers_str",
     "default_token_metadata"
 ]
@@ -4,6 +4,10 @@
 
 # SECTION: available llm providers
 llm_providers = ["openai", "google", "anthropic"]
+# NOTE: membership checks
+llm_providers_set: frozenset[str] = frozenset(llm_providers)
+# error messages (sorted, deterministic)
+llm_providers_str = ", ".join(sorted(llm_providers))
 
 # SECTION: token metadata
 # set default values for input and output tokens
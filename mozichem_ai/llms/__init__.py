@@ -1,5 +1,9 @@
 from .llm_models import LlmManager
+from .llm_cache import RedisCache, get_llm_cache, llm_cache_enabled
 
 __all__ = [
     "LlmManager",
+    "RedisCache",
+    "get_llm_cache",
+    "llm_cache_enabled",
 ]
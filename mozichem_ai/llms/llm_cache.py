@@ -0,0 +1,164 @@
+# import libs
+import os
+import hashlib
+import logging
+from functools import lru_cache
+from typing import (
+    Any,
+    Optional,
+    Sequence
+)
+import orjson
+# langchain
+from langchain_core.caches import BaseCache, InMemoryCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: environment variables
+# enable the llm cache (disabled by default)
+LLM_CACHE_ENV = "MOZICHEM_LLM_CACHE"
+# redis url, when set the redis backend is used
+CACHE_URL_ENV = "MOZICHEM_CACHE_URL"
+# time to live for redis entries (seconds)
+CACHE_TTL_ENV = "MOZICHEM_CACHE_TTL"
+# max entries of the in-memory cache
+CACHE_MAXSIZE_ENV = "MOZICHEM_CACHE_MAXSIZE"
+
+# NOTE: defaults
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_CACHE_MAXSIZE = 1024
+CACHE_KEY_PREFIX = "mozichem:llm:"
+
+
+class RedisCache(BaseCache):
+    """
+    Redis backed LLM cache, entries are stored with a time to live (SETEX).
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl: int = DEFAULT_CACHE_TTL
+    ):
+        '''
+        Initialize the Redis cache.
+
+        Parameters
+        ----------
+        redis_url : str
+            The Redis connection url (e.g., "redis://localhost:6379/0").
+        ttl : int, optional
+            Time to live for cache entries in seconds, by default 3600.
+        '''
+        # NOTE: redis is an optional dependency
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis cache backend requires the `redis` package, install it with `pip install redis`.") from e
+
+        # NOTE: set attributes
+        self.client = redis.Redis.from_url(redis_url)
+        self.ttl = ttl
+
+    def _make_key(self, prompt: str, llm_string: str) -> str:
+        """Make a stable cache key from the prompt and llm string."""
+        digest = hashlib.sha256(
+            (prompt + llm_string).encode("utf-8")
+        ).hexdigest()
+        return f"{CACHE_KEY_PREFIX}{digest}"
+
+    def lookup(
+        self,
+        prompt: str,
+        llm_string: str
+    ) -> Optional[Sequence[Generation]]:
+        """Look up the cached generations for the prompt and llm string."""
+        value = self.client.get(self._make_key(prompt, llm_string))
+        if value is None:
+            return None
+        return [loads(item) for item in orjson.loads(value)]
+
+    def update(
+        self,
+        prompt: str,
+        llm_string: str,
+        return_val: Sequence[Generation]
+    ) -> None:
+        """Store the generations for the prompt and llm string."""
+        value = orjson.dumps([dumps(item) for item in return_val])
+        self.client.setex(
+            self._make_key(prompt, llm_string),
+            self.ttl,
+            value
+        )
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove all mozichem entries from the cache."""
+        for key in self.client.scan_iter(match=f"{CACHE_KEY_PREFIX}*"):
+            self.client.delete(key)
+
+
+def llm_cache_enabled() -> bool:
+    """
+    Check whether the llm cache is enabled through the environment.
+
+    Returns
+    -------
+    bool
+        True if `MOZICHEM_LLM_CACHE` is set to a true value, False otherwise.
+    """
+    value = os.getenv(LLM_CACHE_ENV, "0")
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@lru_cache(maxsize=None)
+def get_llm_cache(
+    cache_backend: Optional[str] = None,
+    cache_url: Optional[str] = None
+) -> Optional[BaseCache]:
+    """
+    Return the llm cache of a backend, shared by the chat models created
+    with it (`cache=`). The global langchain llm cache is left untouched.
+
+    Parameters
+    ----------
+    cache_backend : str, optional
+        The cache backend, "memory", "redis" or "none". If None, redis is used
+        when `MOZICHEM_CACHE_URL` is set, otherwise the in-memory cache.
+    cache_url : str, optional
+        The Redis connection url, by default `MOZICHEM_CACHE_URL`.
+
+    Returns
+    -------
+    BaseCache | None
+        The cache instance, or None if caching is disabled.
+    """
+    # SECTION: resolve backend
+    cache_url = cache_url or os.getenv(CACHE_URL_ENV)
+    if cache_backend is None:
+        cache_backend = "redis" if cache_url else "memory"
+    cache_backend = cache_backend.lower()
+
+    # SECTION: create cache
+    if cache_backend == "none":
+        return None
+    if cache_backend == "memory":
+        # NOTE: bounded, the oldest entries are evicted first
+        maxsize = int(os.getenv(CACHE_MAXSIZE_ENV, DEFAULT_CACHE_MAXSIZE))
+        cache = InMemoryCache(maxsize=maxsize)
+    elif cache_backend == "redis":
+        if not cache_url:
+            raise ValueError(
+                f"Redis cache backend requires a url, set `{CACHE_URL_ENV}`.")
+        ttl = int(os.getenv(CACHE_TTL_ENV, DEFAULT_CACHE_TTL))
+        cache = RedisCache(cache_url, ttl=ttl)
+    else:
+        raise ValueError(
+            f"Unsupported cache backend: {cache_backend}. Supported backends are: memory, redis, none.")
+
+    logger.info("LLM cache backend created: %s", cache_backend)
+    return cache
@@ -1,18 +1,137 @@
 # import libs
 import logging
-from langchain.chat_models import init_chat_model
+import importlib
+import threading
+from collections import OrderedDict
 from typing import (
-    Optional
+    Any,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TYPE_CHECKING
 )
+import orjson
 # langchain
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain.chat_models.base import BaseChatModel
 # local
-from ..config import llm_providers
+from ..config import llm_providers_set, llm_providers_str
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
 
+# NOTE: langchain integration modules imported by each provider
+PROVIDER_MODULES = {
+    "openai": ("langchain_openai",),
+    "google": ("langchain_google_genai",),
+    "anthropic": ("langchain_anthropic",),
+}
+
+# NOTE: chat models (and their provider http clients), keyed by (provider,
+# model name, kwargs), shared by the agents and the LLM managers (LRU)
+_MODEL_POOL: "OrderedDict[Tuple[str, str, Hashable], BaseChatModel]" = (
+    OrderedDict()
+)
+_MODEL_POOL_SIZE = 16
+_MODEL_POOL_LOCK = threading.Lock()
+
+
+def import_provider_modules(model_provider: str) -> None:
+    """
+    Import the langchain integration (and provider SDK) of a provider, so
+    the first model creation does not pay for it. Missing packages are
+    skipped, the model creation reports them.
+    """
+    for module in PROVIDER_MODULES.get(model_provider, ()):
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.debug("Provider module %s not imported: %s", module, e)
+
+
+def warm_provider_modules(model_provider: str) -> threading.Thread:
+    """
+    Import the modules of a provider on a background (daemon) thread, e.g.,
+    while the rest of the application is set up.
+    """
+    thread = threading.Thread(
+        target=import_provider_modules,
+        args=(model_provider,),
+        name="mozichem-warm-imports",
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _model_key(
+    model_provider: str,
+    model_name: str,
+    kwargs: Dict[str, Any]
+) -> Tuple[str, str, Hashable]:
+    """
+    Return the cache key of a model config, unhashable kwargs (e.g., dict
+    values) are keyed by their canonical JSON.
+    """
+    try:
+        params: Hashable = tuple(sorted(kwargs.items()))
+        hash(params)
+    except TypeError:
+        params = orjson.dumps(
+            kwargs,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return (model_provider, model_name, params)
+
+
+def get_chat_model(
+    model_provider: str,
+    model_name: str,
+    **kwargs
+) -> "BaseChatModel":
+    """
+    Return the pooled chat model of a config, created on first use. Identical
+    configs share one instance (and its provider client), the least recently
+    used model is dropped when the pool is full.
+
+    Parameters
+    ----------
+    model_provider : str
+        The provider of the model (e.g., "openai", "google", "anthropic").
+    model_name : str
+        The name of the model.
+    kwargs : dict
+        The model settings passed to `init_chat_model` (e.g., temperature).
+
+    Returns
+    -------
+    model: BaseChatModel
+        The chat model.
+    """
+    key = _model_key(model_provider, model_name, kwargs)
+    with _MODEL_POOL_LOCK:
+        model = _MODEL_POOL.get(key)
+        if model is not None:
+            _MODEL_POOL.move_to_end(key)
+            logger.info("Reusing pooled LLM: %s", model_name)
+            return model
+
+        from langchain.chat_models import init_chat_model
+
+        model = init_chat_model(
+            model=model_name,
+            model_provider=model_provider,
+            **kwargs
+        )
+        _MODEL_POOL[key] = model
+        if len(_MODEL_POOL) > _MODEL_POOL_SIZE:
+            _MODEL_POOL.popitem(last=False)
+    return model
+
 
 class LlmManager:
     """
@@ -36,7 +155,7 @@ class LlmManager:
         self.model_provider: str = model_provider
         self.model_name: str = model_name
         self.kwargs = kwargs
-        self.model: Optional[BaseChatModel] = None
+        self.model: Optional["BaseChatModel"] = None
 
         # SECTION: initialize the model
         self.init()
@@ -51,15 +170,20 @@ class LlmManager:
                 model_name=self.model_name,
                 **self.kwargs
             )
-            logger.info(f"Model {self.model_name} initialized successfully.")
+            logger.info("Model %s initialized successfully.", self.model_name)
         except Exception as e:
-            logger.error(f"Failed to initialize model: {e}")
+            logger.error("Failed to initialize model: %s", e)
             raise
 
     def ping(self) -> bool:
         """
         Ping the model to check if it is responsive.
         Returns True if responsive, False otherwise.
+
+        Notes
+        -----
+        This call blocks on the provider round-trip, use `aping` in async
+        code (e.g., API routes).
         """
         if self.model is None:
             logger.warning("Model not initialized.")
@@ -67,18 +191,38 @@ class LlmManager:
         try:
             # Simple test: invoke the model with a ping message
             response = self.model.invoke(self.ping_messages)
+            return self._check_pong(response.content)
+        except Exception as e:
+            logger.error("Ping failed: %s", e)
+            return False
 
-            # check if response contains 'pong'
-            if "pong" not in response.content.lower():
-                logger.warning("Ping response did not contain 'pong'.")
-                return False
-
-            logger.info("Ping successful.")
-            return True
+    async def aping(self) -> bool:
+        """
+        Ping the model without blocking the event loop.
+        Returns True if responsive, False otherwise.
+        """
+        if self.model is None:
+            logger.warning("Model not initialized.")
+            return False
+        try:
+            response = await self.model.ainvoke(self.ping_messages)
+            return self._check_pong(response.content)
         except Exception as e:
-            logger.error(f"Ping failed: {e}")
+            logger.error("Ping failed: %s", e)
             return False
 
+    @staticmethod
+    def _check_pong(content: str) -> bool:
+        """
+        Check whether a ping response contains 'pong'.
+        """
+        if "pong" not in content.lower():
+            logger.warning("Ping response did not contain 'pong'.")
+            return False
+
+        logger.info("Ping successful.")
+        return True
+
     def get_model(self):
         """
         Return the initialized model instance.
@@ -90,9 +234,10 @@ class LlmManager:
         model_provider: str,
         model_name: str,
         **kwargs
-    ) -> BaseChatModel:
+    ) -> "BaseChatModel":
         """
         Initialize and return a chat model based on the specified model name.
+        Models come from the process-wide pool (`get_chat_model`).
 
         Parameters
         ----------
@@ -110,18 +255,13 @@ class LlmManager:
         """
         try:
             # SECTION: validate model provider
-            if model_provider not in llm_providers:
+            if model_provider not in llm_providers_set:
                 raise ValueError(
-                    f"Invalid model provider: {model_provider}. Supported providers are: {llm_providers}")
+                    f"Invalid model provider: {model_provider}. Supported providers are: {llm_providers_str}")
 
-            # SECTION: initialize model
-            model: BaseChatModel = init_chat_model(
-                model=model_name,
-                model_provider=model_provider,
-                **kwargs
-            )
-            return model
+            # SECTION: reuse a pooled model with the same config
+            return get_chat_model(model_provider, model_name, **kwargs)
         except Exception as e:
             logger.error(
-                f"Error initializing model {model_name} from {model_provider}: {e}")
+                "Error initializing model %s from %s: %s", model_name, model_provider, e)
             raise
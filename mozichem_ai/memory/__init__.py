@@ -2,5 +2,14 @@ from .config_memory import generate_thread, generate_thread_id
 
 __all__ = [
     'generate_thread',
-    'generate_thread_id'
+    'generate_thread_id',
+    'BoundedMemorySaver'
 ]
+
+
+def __getattr__(name):
+    # NOTE: lazy import, langgraph is loaded on first use
+    if name == "BoundedMemorySaver":
+        from .bounded_saver import BoundedMemorySaver
+        return BoundedMemorySaver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,129 @@
+# import libs
+import os
+import logging
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Set,
+    Tuple
+)
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import (
+    Checkpoint,
+    CheckpointMetadata,
+    ChannelVersions
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: max checkpoints kept per thread
+MAX_CHECKPOINTS_ENV = "MOZICHEM_MAX_CHECKPOINTS_PER_THREAD"
+DEFAULT_MAX_CHECKPOINTS = 20
+
+
+class BoundedMemorySaver(MemorySaver):
+    '''
+    In-memory checkpointer that keeps only the latest checkpoints of each
+    thread and drops the channel values no longer referenced by them.
+    '''
+
+    def __init__(
+        self,
+        max_checkpoints: Optional[int] = None,
+        **kwargs: Any
+    ):
+        '''
+        Initialize the bounded memory saver.
+
+        Parameters
+        ----------
+        max_checkpoints : int, optional
+            The max number of checkpoints kept per thread, by default
+            `MOZICHEM_MAX_CHECKPOINTS_PER_THREAD` or 20.
+        kwargs : dict
+            Keyword arguments passed to MemorySaver.
+        '''
+        super().__init__(**kwargs)
+
+        # NOTE: set attributes
+        self.max_checkpoints = max(
+            1,
+            max_checkpoints or int(
+                os.getenv(MAX_CHECKPOINTS_ENV, DEFAULT_MAX_CHECKPOINTS)
+            )
+        )
+        # channel versions of the stored checkpoints
+        self._channel_versions: Dict[
+            Tuple[str, str, str], Dict[str, Any]
+        ] = {}
+        # blob keys per (thread_id, checkpoint_ns)
+        self._blob_keys: Dict[
+            Tuple[str, str], Set[Tuple[str, str, str, Any]]
+        ] = defaultdict(set)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint and evict the oldest ones of the thread."""
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+
+        # NOTE: track versions and blobs of the checkpoint
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        self._channel_versions[(thread_id, checkpoint_ns, checkpoint["id"])] = dict(
+            checkpoint["channel_versions"]
+        )
+        self._blob_keys[(thread_id, checkpoint_ns)].update(
+            (thread_id, checkpoint_ns, k, v) for k, v in new_versions.items()
+        )
+
+        # NOTE: evict
+        self._evict(thread_id, checkpoint_ns)
+        return next_config
+
+    def _evict(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Drop the oldest checkpoints of a thread above the limit."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        excess = len(checkpoints) - self.max_checkpoints
+        if excess <= 0:
+            return
+
+        # SECTION: drop checkpoints (ids are time ordered)
+        for checkpoint_id in sorted(checkpoints)[:excess]:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            self._channel_versions.pop(
+                (thread_id, checkpoint_ns, checkpoint_id), None)
+
+        # SECTION: drop unreferenced channel values
+        referenced = set()
+        for checkpoint_id in checkpoints:
+            versions = self._channel_versions.get(
+                (thread_id, checkpoint_ns, checkpoint_id))
+            if versions is None:
+                # NOTE: untracked checkpoint, keep all blobs
+                return
+            referenced.update(
+                (thread_id, checkpoint_ns, k, v) for k, v in versions.items()
+            )
+
+        blob_keys = self._blob_keys[(thread_id, checkpoint_ns)]
+        for key in blob_keys - referenced:
+            self.blobs.pop(key, None)
+        blob_keys &= referenced
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints, writes and tracking data of a thread."""
+        super().delete_thread(thread_id)
+        for key in [k for k in self._channel_versions if k[0] == thread_id]:
+            del self._channel_versions[key]
+        for key in [k for k in self._blob_keys if k[0] == thread_id]:
+            del self._blob_keys[key]
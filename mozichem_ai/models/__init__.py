@@ -1,10 +1,13 @@
-from .mcp import stdioMCP, streamableHttpMCP, MCP
+from .mcp import stdioMCP, streamableHttpMCP, MCP, MCP_CONFIG_ADAPTER
 from .chat import (
     UserMessage,
     AssistantMessage,
     ChatMessage,
     AgentMessage,
-    TokenMetadata
+    TokenMetadata,
+    USER_MSG_ADAPTER,
+    CHAT_MSG_ADAPTER,
+    AGENT_MSG_ADAPTER
 )
 from .llm import AgentConfig, LlmConfig
 from .api import (
@@ -19,6 +22,7 @@ __all__ = [
     "stdioMCP",
     "streamableHttpMCP",
     "MCP",
+    "MCP_CONFIG_ADAPTER",
     "UserMessage",
     "AssistantMessage",
     "ChatMessage",
@@ -30,5 +34,8 @@ __all__ = [
     "OverallSettings",
     "ApiConfigSummary",
     "AgentMessage",
-    "TokenMetadata"
+    "TokenMetadata",
+    "USER_MSG_ADAPTER",
+    "CHAT_MSG_ADAPTER",
+    "AGENT_MSG_ADAPTER"
 ]
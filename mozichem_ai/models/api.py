@@ -1,15 +1,20 @@
 from typing import Dict, Union, List, Optional
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+# NOTE: response models, built by the api only (unknown fields are a bug)
 
 class AppInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(..., description="App name.")
     version: Union[str, None] = Field(None, description="App version.")
     description: Union[str, None] = Field(None, description="App description.")
 
 
 class AgentDetails(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     exists: bool = Field(..., description="Agent exists.")
     model_provider: str = Field(..., description="Model provider.")
     model_name: str = Field(..., description="Model name.")
@@ -30,11 +35,15 @@ class AgentDetails(BaseModel):
 
 
 class LlmDetails(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     temperature: float = Field(..., description="LLM temperature.")
     max_tokens: int = Field(..., description="LLM max tokens.")
 
 
 class OverallSettings(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     cors_origins: Union[List[str], None] = Field(
         None,
         description="Allowed CORS origins."
@@ -42,6 +51,8 @@ class OverallSettings(BaseModel):
 
 
 class ApiConfigSummary(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     app: AppInfo
     agent: AgentDetails
     llm: LlmDetails
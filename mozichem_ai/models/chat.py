@@ -6,13 +6,17 @@ from typing import (
     Dict
 )
 import time
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+# local
+from ..config import default_token_metadata
 
 
 class UserMessage(BaseModel):
     """
     Model for user messages in the chat.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role: str = Field("user", description="Role of the message sender")
     content: str = Field(..., description="Content of the user message")
 
@@ -21,6 +25,8 @@ class AssistantMessage(BaseModel):
     """
     Model for assistant messages in the chat.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role: str = Field("assistant", description="Role of the message sender")
     content: str = Field(..., description="Content of the assistant message")
 
@@ -29,6 +35,8 @@ class ChatMessage(BaseModel):
     """
     Model for chat messages, which can be either user or assistant messages.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role: str = Field(..., description="Role of the message sender")
     content: str = Field(..., description="Content of the chat message")
     messages: Optional[list] = Field(
@@ -56,6 +64,8 @@ class AgentMessage(BaseModel):
     """
     Model for agent messages in the chat.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     type: Literal["user", "assistant", "system", "tool", "unknown"] = Field(
         ...,
         description="Type of the message, either 'user', 'assistant', 'system', or 'tool'"
@@ -84,5 +94,19 @@ class TokenMetadata(BaseModel):
     """
     Model for metadata related to message tokens.
     """
-    input_tokens: int = Field(0, description="Number of input tokens")
-    output_tokens: int = Field(0, description="Number of output tokens")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    input_tokens: int = Field(
+        default_token_metadata["input_tokens"],
+        description="Number of input tokens"
+    )
+    output_tokens: int = Field(
+        default_token_metadata["output_tokens"],
+        description="Number of output tokens"
+    )
+
+
+# NOTE: adapters built once at import, reused by the chat endpoints
+USER_MSG_ADAPTER = TypeAdapter(UserMessage)
+CHAT_MSG_ADAPTER = TypeAdapter(ChatMessage)
+AGENT_MSG_ADAPTER = TypeAdapter(AgentMessage)
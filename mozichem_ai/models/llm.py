@@ -1,9 +1,11 @@
 # import libs
 from typing import Dict, Union, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     model_provider: Optional[str] = Field(
         default=None,
         description="Provider of the LLM model (e.g., 'openai', 'google')"
@@ -37,6 +39,8 @@ class AgentConfig(BaseModel):
 
 
 class LlmConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     model_provider: str = Field(
         default="openai",
         description="Provider of the LLM model (e.g., 'openai', 'google')"
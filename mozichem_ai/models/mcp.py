@@ -1,13 +1,18 @@
 # import libs
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, List, Literal, Optional, Dict, Union
 
 
 class stdioMCP(BaseModel):
     """
     Model for standard input/output MCP configuration.
     """
-    transport: str = Field("stdio", description="Transport method for the MCP")
+    model_config = ConfigDict(frozen=True)
+
+    transport: Literal["stdio"] = Field(
+        "stdio",
+        description="Transport method for the MCP"
+    )
     command: Optional[str] = Field(None, description="Command to run the MCP")
     args: List[str] = Field(
         default_factory=list,
@@ -23,7 +28,9 @@ class streamableHttpMCP(BaseModel):
     """
     Model for streamable HTTP MCP configuration.
     """
-    transport: str = Field(
+    model_config = ConfigDict(frozen=True)
+
+    transport: Literal["streamable_http"] = Field(
         "streamable_http",
         description="Transport method for the MCP"
     )
@@ -34,5 +41,12 @@ class streamableHttpMCP(BaseModel):
     )
 
 
-MCP = Dict[str, str] | Dict[str, str | Dict[str, str]
-                            ] | Dict[str, str | List[str] | Dict[str, str]]
+# NOTE: an MCP server config, dispatched on the `transport` field (one key
+# lookup instead of trying each model)
+MCP = Annotated[
+    Union[stdioMCP, streamableHttpMCP],
+    Field(discriminator="transport")
+]
+
+# NOTE: MCP server configs keyed by name, validated in one pass
+MCP_CONFIG_ADAPTER = TypeAdapter(Dict[str, MCP])
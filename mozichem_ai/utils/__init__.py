@@ -1,9 +1,20 @@
-from .loader import load_yaml_file
+from .loader import load_yaml_file, load_yaml_file_async
 # message
-from .message_manager import agent_message_analyzer, message_token_counter
+from .message_manager import (
+    agent_message_analyzer,
+    agent_messages_analyzer,
+    message_token_counter,
+    MessageAnalysisError
+)
+# event loop
+from .event_loop import install_uvloop
 
 __all__ = [
     "load_yaml_file",
+    "load_yaml_file_async",
     "agent_message_analyzer",
+    "agent_messages_analyzer",
     "message_token_counter",
+    "MessageAnalysisError",
+    "install_uvloop",
 ]
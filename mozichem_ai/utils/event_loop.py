@@ -0,0 +1,30 @@
+# import libs
+import asyncio
+import logging
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop if it is installed. This replaces
+    the process-wide event loop policy, call it from an application entry
+    point (before `asyncio.run`), never at import. The servers started by
+    `mozichem_chat` and `run_api` already use uvloop through uvicorn
+    (`loop="auto"`).
+
+    Returns
+    -------
+    bool
+        True if uvloop was installed, False otherwise (e.g., on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    # NOTE: the policy is used by asyncio.run and uvicorn
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("uvloop event loop policy installed.")
+    return True
@@ -1,8 +1,15 @@
 # import libs
+import asyncio
 from pathlib import Path
 import yaml
 # local
 
+# NOTE: libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def load_yaml_file(filepath):
     """
@@ -23,6 +30,24 @@ def load_yaml_file(filepath):
         raise FileNotFoundError(f"YAML file not found: {filepath}")
     with path.open('r', encoding='utf-8') as f:
         try:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Error parsing YAML file: {filepath}\n{e}")
+
+
+async def load_yaml_file_async(filepath):
+    """
+    Load a YAML file in a worker thread, so the event loop is not blocked
+    by the file read and parsing.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        The path to the YAML file to be loaded.
+
+    Returns
+    -------
+    dict
+        The contents of the YAML file as a dictionary.
+    """
+    return await asyncio.to_thread(load_yaml_file, filepath)
@@ -1,7 +1,17 @@
 # import libs
 import logging
-from fastapi import HTTPException
-from typing import Union, List
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Tuple,
+    Union
+)
+import langchain_core.messages as lc_messages
 from langchain_core.messages import (
     ToolMessage, AIMessage, HumanMessage, SystemMessage
 )
@@ -12,6 +22,194 @@ from ..models import AgentMessage, TokenMetadata
 logger = logging.getLogger(__name__)
 
 
+class MessageAnalysisError(Exception):
+    '''
+    Raised when a message cannot be processed (e.g., its tokens counted).
+    '''
+
+
+# NOTE: the builders of the langchain message classes read their declared
+# fields directly (name, tool_calls, ...), no per-instance hasattr checks;
+# AgentMessage is validated, so content blocks and token counts are checked
+
+
+def _build_tool(
+    message: ToolMessage,
+    input_tokens: int,
+    output_tokens: int
+) -> AgentMessage:
+    # tool message
+    return AgentMessage(
+        type="tool",
+        content=message.content,
+        tool_calls=None,
+        name=message.name,
+        tool_call_id=message.tool_call_id,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens
+    )
+
+
+def _build_ai(
+    message: AIMessage,
+    input_tokens: int,
+    output_tokens: int
+) -> AgentMessage:
+    # NOTE: AIMessage can contain tool calls
+    # tool calls message or assistant message
+    return AgentMessage(
+        type="assistant",
+        content=message.content,
+        tool_calls=message.tool_calls,
+        name=message.name,
+        tool_call_id=None,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens
+    )
+
+
+def _build_user(
+    message: HumanMessage,
+    input_tokens: int,
+    output_tokens: int
+) -> AgentMessage:
+    # human message
+    return AgentMessage(
+        type="user",
+        content=message.content,
+        tool_calls=None,
+        name=message.name,
+        tool_call_id=None,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens
+    )
+
+
+def _build_system(
+    message: SystemMessage,
+    input_tokens: int,
+    output_tokens: int
+) -> AgentMessage:
+    # system message
+    return AgentMessage(
+        type="system",
+        content=message.content,
+        tool_calls=None,
+        name=message.name,
+        tool_call_id=None,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens
+    )
+
+
+# NOTE: the unknown message without content or token counts (immutable,
+# shared by all such messages)
+UNKNOWN_EMPTY_MESSAGE = AgentMessage(
+    type="unknown",
+    content="",
+    tool_calls=None,
+    name=None,
+    tool_call_id=None,
+    input_tokens=-1,
+    output_tokens=-1
+)
+
+
+def _build_unknown(
+    message: Any,
+    input_tokens: int,
+    output_tokens: int
+) -> AgentMessage:
+    # NOTE: not a langchain message type
+    logger.error("Invalid message type: %s", type(message))
+    content = getattr(message, 'content', "")
+    if content == "" and input_tokens == -1 and output_tokens == -1:
+        return UNKNOWN_EMPTY_MESSAGE
+    return AgentMessage(
+        type="unknown",
+        content=content,
+        tool_calls=None,
+        name=None,
+        tool_call_id=None,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens
+    )
+
+
+# NOTE: AgentMessage builders by message class, subclasses (e.g.,
+# AIMessageChunk) are resolved once on first use and added
+_MESSAGE_BUILDERS: Dict[type, Callable[[Any, int, int], AgentMessage]] = {
+    ToolMessage: _build_tool,
+    AIMessage: _build_ai,
+    HumanMessage: _build_user,
+    SystemMessage: _build_system,
+}
+
+
+def _resolve_builder(
+    message_class: type
+) -> Callable[[Any, int, int], AgentMessage]:
+    """
+    Return the builder of a message class not in the dispatch table (its
+    closest base class builder, or the unknown builder) and cache it.
+    """
+    builder = _build_unknown
+    for base in message_class.__mro__[1:]:
+        if base in _MESSAGE_BUILDERS:
+            builder = _MESSAGE_BUILDERS[base]
+            break
+    _MESSAGE_BUILDERS[message_class] = builder
+    return builder
+
+
+def _analyze_message(message: Any, message_class: type) -> AgentMessage:
+    """
+    Build the AgentMessage of a message, its token counts are read from the
+    response metadata and the builder is dispatched on its class.
+    """
+    # SECTION: extract data from message **response_metadata**
+    # NOTE: set input_tokens and output_tokens
+    try:
+        response_metadata = message.response_metadata
+        output_tokens = response_metadata.get('output_tokens', 0)
+        input_tokens = response_metadata.get('input_tokens', 0)
+    except AttributeError:
+        output_tokens = -1
+        input_tokens = -1
+
+    # SECTION: analyze message content
+    # NOTE: dispatch on the message class
+    builder = _MESSAGE_BUILDERS.get(message_class)
+    if builder is None:
+        builder = _resolve_builder(message_class)
+    return builder(message, input_tokens, output_tokens)
+
+
+# NOTE: message classes skipped by the analyzer by default
+DEFAULT_IGNORE_MESSAGES: FrozenSet[type] = frozenset({
+    HumanMessage,
+    SystemMessage
+})
+
+
+@lru_cache(maxsize=32)
+def _ignore_set(ignore_messages: Tuple[Union[type, str], ...]) -> FrozenSet[type]:
+    """
+    Return the set of ignored message classes, class names (e.g.,
+    'HumanMessage') are resolved from `langchain_core.messages` (cached).
+    """
+    classes = set()
+    for item in ignore_messages:
+        if isinstance(item, str):
+            message_class = getattr(lc_messages, item, None)
+            if not isinstance(message_class, type):
+                logger.warning("Unknown message type to ignore: %s", item)
+                continue
+            item = message_class
+        classes.add(item)
+    return frozenset(classes)
+
+
 def agent_message_analyzer(
     message: Union[
         ToolMessage,
@@ -19,7 +217,7 @@ def agent_message_analyzer(
         HumanMessage,
         SystemMessage
     ],
-    ignore_messages: List[str] = ['HumanMessage', 'SystemMessage']
+    ignore_messages: Iterable[Union[type, str]] = DEFAULT_IGNORE_MESSAGES
 ) -> AgentMessage | None:
     """
     Analyzes a list of messages and returns a summary of the content.
@@ -29,109 +227,71 @@ def agent_message_analyzer(
     message : Union[ToolMessage, AIMessage, HumanMessage, SystemMessage]
         A message object from the LangChain library, which can be of type ToolMessage, AIMessage,
         HumanMessage, or SystemMessage.
-    ignore_messages : List[str], optional
-        A list of message types to ignore during analysis. Default is ['HumanMessage', 'SystemMessage'].
+    ignore_messages : Iterable[type | str], optional
+        The message classes (or class names) to ignore during analysis. Default is
+        `DEFAULT_IGNORE_MESSAGES` (HumanMessage and SystemMessage).
     """
-    try:
-        # SECTION: ignore message types
-        message_type = type(message).__name__
-        if message_type in ignore_messages:
-            return None
-
-        # SECTION: validate message type
-        if not isinstance(
-            message,
-            (
-                ToolMessage,
-                AIMessage,
-                HumanMessage,
-                SystemMessage
-            )
-        ):
-            logger.error(f"Invalid message type: {type(message)}")
-
-        # SECTION: extract data from message **response_metadata**
-        # NOTE: set input_tokens and output_tokens
-        if hasattr(message, 'response_metadata'):
-            response_metadata = message.response_metadata
-            output_tokens = getattr(response_metadata, 'output_tokens', 0)
-            input_tokens = getattr(response_metadata, 'input_tokens', 0)
-        else:
-            output_tokens = -1
-            input_tokens = -1
-
-        # SECTION: analyze message content
-        # NOTE: iterate through messages
-        if isinstance(message, ToolMessage):
-            # tool message
-            return AgentMessage(
-                type="tool",
-                content=message.content,
-                tool_calls=None,
-                name=message.name,
-                tool_call_id=message.tool_call_id,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-        elif isinstance(message, AIMessage):
-            # NOTE: AIMessage can contain tool calls
-            # tool calls message or assistant message
-            return AgentMessage(
-                type="assistant",
-                content=message.content,
-                tool_calls=message.tool_calls if hasattr(
-                    message, 'tool_calls') else None,
-                name=message.name if hasattr(message, 'name') else None,
-                tool_call_id=None,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-
-        elif isinstance(message, HumanMessage):
-            # human message
-            return AgentMessage(
-                type="user",
-                content=message.content,
-                tool_calls=None,
-                name=message.name if hasattr(message, 'name') else None,
-                tool_call_id=None,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-
-        elif isinstance(message, SystemMessage):
-            # system message
-            return AgentMessage(
-                type="system",
-                content=message.content,
-                tool_calls=None,
-                name=message.name if hasattr(message, 'name') else None,
-                tool_call_id=None,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-        else:
-            return AgentMessage(
-                type="unknown",
-                content=message.content if hasattr(message, 'content') else "",
-                tool_calls=None,
-                name=None,
-                tool_call_id=None,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
+    # SECTION: ignore message types
+    message_class = type(message)
+    if ignore_messages is not DEFAULT_IGNORE_MESSAGES:
+        ignore_messages = _ignore_set(tuple(ignore_messages))
+    if message_class in ignore_messages:
+        return None
+
+    # SECTION: analyze message
+    return _analyze_message(message, message_class)
+
+
+def agent_messages_analyzer(
+    messages: Iterable[Union[
+        ToolMessage,
+        AIMessage,
+        HumanMessage,
+        SystemMessage
+    ]],
+    ignore_messages: Iterable[Union[type, str]] = DEFAULT_IGNORE_MESSAGES
+) -> List[AgentMessage]:
+    """
+    Analyzes a list of messages, see `agent_message_analyzer`, the ignored
+    messages are skipped.
+
+    Parameters
+    ----------
+    messages : Iterable[Union[ToolMessage, AIMessage, HumanMessage, SystemMessage]]
+        The message objects from the LangChain library.
+    ignore_messages : Iterable[type | str], optional
+        The message classes (or class names) to ignore during analysis. Default is
+        `DEFAULT_IGNORE_MESSAGES` (HumanMessage and SystemMessage).
+
+    Returns
+    -------
+    List[AgentMessage]
+        The agent messages, in order.
+    """
+    if ignore_messages is not DEFAULT_IGNORE_MESSAGES:
+        ignore_messages = _ignore_set(tuple(ignore_messages))
+
+    agent_messages: List[AgentMessage] = []
+    for message in messages:
+        message_class = type(message)
+        if message_class in ignore_messages:
+            continue
+        agent_messages.append(_analyze_message(message, message_class))
+    return agent_messages
 
-    except Exception as e:
-        logger.error(f"Error analyzing messages: {e}")
-        raise HTTPException(
-            status_code=500, detail="Failed to analyze messages") from e
+
+# NOTE: token counts of messages without usage metadata (immutable, shared)
+DEFAULT_TOKEN_METADATA = TokenMetadata()
 
 
 def message_token_counter(
     message: Union[ToolMessage, AIMessage, HumanMessage, SystemMessage]
 ) -> TokenMetadata:
     """
-    Counts the tokens in a message and returns an AgentMessage with token counts.
+    Counts the tokens in a message and returns a TokenMetadata with token counts.
+
+    The counts are read from the provider-reported `usage_metadata`, no
+    tokenizer is run, so the call is cheap enough for the event loop.
 
     Parameters
     ----------
@@ -140,45 +300,21 @@ def message_token_counter(
 
     Returns
     -------
-    AgentMessage
-        An AgentMessage containing the token counts.
+    TokenMetadata
+        The token counts, -1 when the message has no usage metadata (e.g.,
+        tool, user and system messages).
     """
     try:
-        # SECTION: analyze message content
-        agent_message = agent_message_analyzer(message)
-
-        if agent_message is None:
-            raise HTTPException(
-                status_code=400, detail="Invalid message type or content"
-            )
+        # SECTION: usage metadata (AI messages only)
+        usage_metadata = getattr(message, 'usage_metadata', None)
+        if not usage_metadata:
+            return DEFAULT_TOKEN_METADATA
 
         # SECTION: create TokenMetadata
-        # NOTE: access to usage_metadata
-        if isinstance(message, AIMessage):
-            # get response metadata to check for usage metadata
-            if hasattr(message, 'usage_metadata'):
-                usage_metadata = message.usage_metadata
-            else:
-                usage_metadata = None
-
-        # check
-        if usage_metadata is not None:
-            input_tokens = usage_metadata.get('input_tokens', -1)
-            output_tokens = usage_metadata.get('output_tokens', -1)
-
-            # set token metadata
-            token_metadata = TokenMetadata(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-        else:
-            token_metadata = TokenMetadata(
-                input_tokens=-1,
-                output_tokens=-1
-            )
-
-        return token_metadata
+        return TokenMetadata(
+            input_tokens=usage_metadata.get('input_tokens', -1),
+            output_tokens=usage_metadata.get('output_tokens', -1)
+        )
     except Exception as e:
-        logger.error(f"Error counting tokens: {e}")
-        raise HTTPException(
-            status_code=500, detail="Failed to count tokens") from e
+        logger.error("Error counting tokens: %s", e)
+        raise MessageAnalysisError("Failed to count tokens") from e
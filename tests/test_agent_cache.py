@@ -0,0 +1,153 @@
+# import libs
+import asyncio
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+# locals
+import mozichem_ai.api.main as api_main
+from mozichem_ai.api import create_api
+from mozichem_ai.api.main import get_or_create_agent, rebind_agent_llm
+
+
+@pytest.fixture(autouse=True)
+def openai_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "x")
+
+
+def agent_settings(**kwargs) -> dict:
+    """Return agent settings with a unique prompt (agents are cached)."""
+    values = {
+        "model_provider": "openai",
+        "model_name": "gpt-4o-mini",
+        "agent_name": "MoziChem",
+        "agent_prompt": f"You are a chemistry assistant {uuid.uuid4()}.",
+        "memory_mode": False
+    }
+    values.update(kwargs)
+    return values
+
+
+# SECTION: get_or_create_agent
+def test_agent_options_in_cache_key():
+    settings = agent_settings()
+
+    async def create():
+        return (
+            await get_or_create_agent(**settings, arithmetic_shortcut=False),
+            await get_or_create_agent(**settings, arithmetic_shortcut=True),
+            await get_or_create_agent(**settings, arithmetic_shortcut=True)
+        )
+
+    plain, shortcut, cached = asyncio.run(create())
+
+    assert plain is not shortcut
+    assert shortcut is cached
+    assert shortcut._arithmetic_shortcut
+
+
+def test_memory_agents_scoped():
+    settings = agent_settings(memory_mode=True)
+
+    async def create():
+        return (
+            await get_or_create_agent(**settings, scope="app1"),
+            await get_or_create_agent(**settings, scope="app2"),
+            await get_or_create_agent(**settings, scope="app1")
+        )
+
+    first, other, cached = asyncio.run(create())
+
+    assert first is cached
+    assert first is not other
+    assert first._memory is not other._memory
+
+
+def test_rebind_copies_agent():
+    settings = agent_settings(memory_mode=True)
+
+    async def create():
+        agent = await get_or_create_agent(**settings)
+        rebound = await rebind_agent_llm(agent, temperature=0.5)
+        return agent, rebound, await get_or_create_agent(**settings)
+
+    agent, rebound, cached = asyncio.run(create())
+
+    # NOTE: the cached agent is left unchanged, the memory is kept
+    assert rebound is not agent
+    assert cached is agent
+    assert agent._temperature == 0.0
+    assert rebound._temperature == 0.5
+    assert rebound.agent is not agent.agent
+    assert rebound._memory is agent._memory
+
+
+# SECTION: config endpoints
+@pytest.fixture
+def client():
+    """Return a test client of an API with memory."""
+    app = asyncio.run(create_api(**agent_settings(memory_mode=True)))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def agent_updates(monkeypatch):
+    """Count the agent creations and LLM rebinds of the config endpoints."""
+    calls = {"create": 0, "rebind": 0}
+
+    async def counted_create(*args, **kwargs):
+        calls["create"] += 1
+        return await get_or_create_agent(*args, **kwargs)
+
+    async def counted_rebind(*args, **kwargs):
+        calls["rebind"] += 1
+        return await rebind_agent_llm(*args, **kwargs)
+
+    monkeypatch.setattr(api_main, "get_or_create_agent", counted_create)
+    monkeypatch.setattr(api_main, "rebind_agent_llm", counted_rebind)
+    return calls
+
+
+def test_unchanged_agent_config_no_rebuild(client, agent_updates):
+    app = client.app
+    agent = app.state.agent
+    settings = app.state.agent_settings
+
+    response = client.post("/agent-config", json={
+        "model_provider": settings.model_provider,
+        "model_name": settings.model_name,
+        "agent_name": settings.agent_name,
+        "agent_prompt": settings.agent_prompt,
+        "memory_mode": settings.memory_mode
+    })
+
+    assert response.status_code == 200
+    assert agent_updates == {"create": 0, "rebind": 0}
+    assert app.state.agent is agent
+    assert app.state.agent_settings is settings
+
+
+def test_unchanged_llm_config_no_rebuild(client, agent_updates):
+    app = client.app
+    agent = app.state.agent
+    settings = app.state.agent_settings
+    llm_config = {
+        "model_provider": settings.model_provider,
+        "model_name": settings.model_name,
+        "temperature": settings.temperature,
+        "max_tokens": settings.max_tokens
+    }
+
+    response = client.post("/llm-config", json=llm_config)
+
+    assert response.status_code == 200
+    assert agent_updates == {"create": 0, "rebind": 0}
+    assert app.state.agent is agent
+
+    # NOTE: a changed temperature swaps the LLM only
+    response = client.post("/llm-config", json={**llm_config, "temperature": 0.5})
+
+    assert response.status_code == 200
+    assert agent_updates == {"create": 0, "rebind": 1}
+    assert app.state.agent is not agent
+    assert app.state.mozichem_agent._temperature == 0.5
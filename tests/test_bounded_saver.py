@@ -0,0 +1,83 @@
+# import libs
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, MessagesState, StateGraph
+# locals
+from mozichem_ai.memory import BoundedMemorySaver
+
+
+def build_graph(checkpointer: BoundedMemorySaver):
+    """Build a graph replying once to each user message."""
+    def reply(state: MessagesState):
+        return {"messages": [AIMessage(content="ok")]}
+
+    graph = StateGraph(MessagesState)
+    graph.add_node("reply", reply)
+    graph.add_edge(START, "reply")
+    graph.add_edge("reply", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+def run_turns(graph, thread_id: str, turns: int) -> None:
+    """Send `turns` user messages to a thread."""
+    config = {"configurable": {"thread_id": thread_id}}
+    for i in range(turns):
+        graph.invoke({"messages": [HumanMessage(content=f"q{i}")]}, config)
+
+
+def test_checkpoints_capped_per_thread():
+    saver = BoundedMemorySaver(max_checkpoints=3)
+    graph = build_graph(saver)
+
+    run_turns(graph, "t1", 5)
+    run_turns(graph, "t2", 1)
+
+    assert len(saver.storage["t1"][""]) == 3
+    # NOTE: one turn writes 3 checkpoints (input, start, reply)
+    assert len(saver.storage["t2"][""]) == 3
+    # NOTE: the latest state is complete
+    state = graph.get_state({"configurable": {"thread_id": "t1"}})
+    assert len(state.values["messages"]) == 10
+
+
+def test_unreferenced_blobs_dropped():
+    saver = BoundedMemorySaver(max_checkpoints=2)
+    graph = build_graph(saver)
+
+    run_turns(graph, "t1", 5)
+
+    referenced = {
+        ("t1", "", channel, version)
+        for versions in saver._channel_versions.values()
+        for channel, version in versions.items()
+    }
+    blobs = {key for key in saver.blobs if key[0] == "t1"}
+    assert blobs <= referenced
+    assert all(key[:2] == ("t1", "") for key in saver._channel_versions)
+    assert len(saver._channel_versions) == 2
+
+    # NOTE: an unbounded saver keeps every version
+    unbounded = BoundedMemorySaver(max_checkpoints=1000)
+    run_turns(build_graph(unbounded), "t1", 5)
+    assert len(blobs) < len(unbounded.blobs)
+
+
+def test_delete_thread():
+    saver = BoundedMemorySaver(max_checkpoints=2)
+    graph = build_graph(saver)
+    run_turns(graph, "t1", 2)
+    run_turns(graph, "t2", 2)
+
+    saver.delete_thread("t1")
+
+    assert "t1" not in saver.storage
+    assert not any(key[0] == "t1" for key in saver.blobs)
+    assert not any(key[0] == "t1" for key in saver._channel_versions)
+    assert not any(key[0] == "t1" for key in saver._blob_keys)
+    assert len(saver.storage["t2"][""]) == 2
+
+
+def test_max_checkpoints_env(monkeypatch):
+    monkeypatch.setenv("MOZICHEM_MAX_CHECKPOINTS_PER_THREAD", "7")
+
+    assert BoundedMemorySaver().max_checkpoints == 7
+    assert BoundedMemorySaver(max_checkpoints=4).max_checkpoints == 4
@@ -0,0 +1,96 @@
+# import libs
+import asyncio
+import itertools
+import uuid
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import (
+    GenericFakeChatModel
+)
+from langchain_core.messages import AIMessage
+# locals
+from mozichem_ai.api import create_api
+
+REPLY = "Water is H2O"
+
+
+class FakeToolModel(GenericFakeChatModel):
+    '''
+    Fake chat model accepting tools, it always gives the same reply.
+    '''
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Return a test client of an API whose agent uses a fake model."""
+    monkeypatch.setenv("OPENAI_API_KEY", "x")
+    monkeypatch.setattr(
+        "mozichem_ai.agents.mozichem_agent.get_chat_model",
+        lambda *args, **kwargs: FakeToolModel(messages=(
+            AIMessage(content=REPLY) for _ in itertools.count()
+        ))
+    )
+    # NOTE: a unique prompt, agents are cached per settings
+    app = asyncio.run(create_api(
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        agent_name="MoziChem",
+        agent_prompt=f"You are a chemistry assistant {uuid.uuid4()}.",
+        memory_mode=False
+    ))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def parse_events(body: str) -> list:
+    """Split a server-sent event stream into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        event = "message"
+        for line in block.splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                events.append((event, orjson.loads(line[len("data: "):])))
+    return events
+
+
+def test_chat_json_by_default(client):
+    response = client.post(
+        "/chat",
+        json={"role": "user", "content": "What is water?"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    body = response.json()
+    assert body["role"] == "assistant"
+    assert body["content"] == REPLY
+    assert body["thread_id"]
+
+
+def test_chat_sse_with_accept_header(client):
+    response = client.post(
+        "/chat",
+        json={"role": "user", "content": "What is water?", "thread_id": "t1"},
+        headers={"Accept": "text/event-stream"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    tokens = [data["content"] for event, data in events if event == "message"]
+    assert "".join(tokens) == REPLY
+    event, data = events[-1]
+    assert event == "done"
+    assert data["thread_id"] == "t1"
+
+
+def test_chat_invalid_body(client):
+    response = client.post("/chat", json={"role": "user"})
+
+    assert response.status_code == 422
@@ -0,0 +1,96 @@
+# import libs
+from dataclasses import replace
+# locals
+from mozichem_ai.api.chat_cache import ChatResponseCache
+from mozichem_ai.api.state import AgentSettings
+
+REPLY = {"role": "assistant", "content": "H2O"}
+
+
+def make_settings(**kwargs) -> AgentSettings:
+    """Return deterministic agent settings the cache applies to."""
+    values = {
+        "model_provider": "openai",
+        "model_name": "gpt-4o-mini",
+        "agent_name": "MoziChem",
+        "agent_prompt": "You are a chemistry assistant.",
+        "memory_mode": False,
+        "temperature": 0.0
+    }
+    values.update(kwargs)
+    return AgentSettings(**values)
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("MOZICHEM_CHAT_CACHE_SIZE", raising=False)
+    cache = ChatResponseCache()
+    settings = make_settings()
+
+    cache.put(settings, "water?", REPLY)
+
+    assert cache.maxsize == 0
+    assert cache.get(settings, "water?") is None
+
+
+def test_hit(monkeypatch):
+    monkeypatch.setenv("MOZICHEM_CHAT_CACHE_SIZE", "8")
+    cache = ChatResponseCache()
+    settings = make_settings()
+
+    cache.put(settings, "water?", REPLY)
+
+    assert cache.get(settings, "water?") == REPLY
+    assert cache.get(settings, "ethanol?") is None
+
+
+def test_settings_change_invalidates():
+    cache = ChatResponseCache(maxsize=8)
+    settings = make_settings()
+    cache.put(settings, "water?", REPLY)
+
+    # NOTE: updates replace the snapshot
+    new_settings = replace(settings, agent_prompt="Answer briefly.")
+
+    assert cache.get(new_settings, "water?") is None
+    assert cache.get(settings, "water?") is None
+
+
+def test_not_deterministic_skipped():
+    cache = ChatResponseCache(maxsize=8)
+
+    for settings in (
+        make_settings(temperature=0.7),
+        make_settings(memory_mode=True),
+        make_settings(mcp_source={"tools": {"command": "python"}}),
+    ):
+        cache.put(settings, "water?", REPLY)
+        assert cache.get(settings, "water?") is None
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        "mozichem_ai.api.chat_cache.time.monotonic", lambda: now[0])
+    cache = ChatResponseCache(maxsize=8, ttl=10)
+    settings = make_settings()
+    cache.put(settings, "water?", REPLY)
+
+    now[0] += 5
+    assert cache.get(settings, "water?") == REPLY
+    now[0] += 10
+    assert cache.get(settings, "water?") is None
+
+
+def test_lru_bound():
+    cache = ChatResponseCache(maxsize=2)
+    settings = make_settings()
+    cache.put(settings, "q1", REPLY)
+    cache.put(settings, "q2", REPLY)
+
+    # NOTE: a hit makes q1 the most recent entry
+    assert cache.get(settings, "q1") == REPLY
+    cache.put(settings, "q3", REPLY)
+
+    assert cache.get(settings, "q2") is None
+    assert cache.get(settings, "q1") == REPLY
+    assert cache.get(settings, "q3") == REPLY
@@ -0,0 +1,74 @@
+# import libs
+import asyncio
+import pytest
+# locals
+from mozichem_ai.agents.mozichem_agent import MoziChemAgent
+
+
+def make_agent(**kwargs) -> MoziChemAgent:
+    """Return an agent without MCP source."""
+    values = {
+        "model_provider": "openai",
+        "model_name": "gpt-4o-mini",
+        "agent_name": "MoziChem",
+        "agent_prompt": "You are a chemistry assistant."
+    }
+    values.update(kwargs)
+    return MoziChemAgent(**values)
+
+
+@pytest.fixture(autouse=True)
+def openai_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "x")
+
+
+def test_build_failure_collects_llm_setup():
+    agent = make_agent(lazy_llm=True)
+
+    async def get_client_tools():
+        raise RuntimeError("mcp server down")
+
+    # NOTE: a client whose tool discovery fails
+    agent.client = object()
+    agent.get_client_tools = get_client_tools
+
+    async def build():
+        with pytest.raises(RuntimeError):
+            await agent.build_agent()
+        # NOTE: no pending LLM setup is left behind
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        assert not pending
+
+    asyncio.run(build())
+    assert agent.llm is None
+    assert agent.agent is None
+
+
+def test_graph_reused_for_same_settings():
+    async def build():
+        first, second = make_agent(), make_agent()
+        await first.build_agent()
+        await second.build_agent()
+        return first, second
+
+    first, second = asyncio.run(build())
+
+    assert first.llm is second.llm
+    assert first.graph_signature([]) == second.graph_signature([])
+
+
+def test_cache_backend_changes_graph():
+    async def build():
+        plain = make_agent()
+        cached = make_agent(cache_backend="memory")
+        await plain.build_agent()
+        await cached.build_agent()
+        return plain, cached
+
+    plain, cached = asyncio.run(build())
+
+    # NOTE: the cached agent runs its own model, with the llm cache
+    assert plain.llm.cache is None
+    assert cached.llm.cache is not None
+    assert plain.graph_signature([]) != cached.graph_signature([])
+    assert plain.agent.nodes["agent"] is not cached.agent.nodes["agent"]
@@ -0,0 +1,143 @@
+# import libs
+import asyncio
+import itertools
+from langchain_core.language_models.fake_chat_models import (
+    GenericFakeChatModel
+)
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    ToolMessage
+)
+from langchain_core.tools import tool
+# locals
+from mozichem_ai.agents.react_graph import (
+    TOOL_LOOP_ERROR,
+    build_react_graph,
+    evaluate_arithmetic,
+    is_tool_loop,
+    window_messages
+)
+
+
+class FakeToolModel(GenericFakeChatModel):
+    '''
+    Fake chat model accepting tools, it replies with its messages in turn.
+    '''
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+@tool
+def lookup(name: str) -> str:
+    """Look up a compound."""
+    return f"{name}: found"
+
+
+def tool_call_message(name: str, call_id: str) -> AIMessage:
+    """Return an assistant message calling the `lookup` tool."""
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": "lookup", "args": {"name": name}, "id": call_id}]
+    )
+
+
+# SECTION: window_messages
+def test_window_messages_keeps_last_turns():
+    messages = [
+        HumanMessage(content="q1"),
+        AIMessage(content="a1"),
+        HumanMessage(content="q2"),
+        tool_call_message("water", "c1"),
+        ToolMessage(content="water: found", tool_call_id="c1"),
+        AIMessage(content="a2"),
+        HumanMessage(content="q3"),
+    ]
+
+    window = window_messages(messages, 2)
+
+    # NOTE: the tool call stays with its reply
+    assert window == messages[2:]
+    assert window_messages(messages, 1) == messages[-1:]
+
+
+def test_window_messages_keeps_all():
+    messages = [HumanMessage(content="q1"), AIMessage(content="a1")]
+
+    assert window_messages(messages, 0) == messages
+    assert window_messages(messages, 5) == messages
+
+
+# SECTION: is_tool_loop
+def test_is_tool_loop_same_calls():
+    messages = [HumanMessage(content="q")]
+    for i in range(3):
+        messages.append(tool_call_message("water", f"c{i}"))
+        messages.append(ToolMessage(content="water: found", tool_call_id=f"c{i}"))
+
+    assert is_tool_loop(messages)
+    assert not is_tool_loop(messages, window=4)
+
+
+def test_is_tool_loop_different_calls():
+    messages = [HumanMessage(content="q")]
+    for i, name in enumerate(["water", "water", "ethanol"]):
+        messages.append(tool_call_message(name, f"c{i}"))
+        messages.append(ToolMessage(content="found", tool_call_id=f"c{i}"))
+
+    assert not is_tool_loop(messages)
+
+
+def test_is_tool_loop_current_turn_only():
+    # NOTE: calls of a previous turn are not counted
+    messages = [
+        HumanMessage(content="q1"),
+        tool_call_message("water", "c0"),
+        ToolMessage(content="water: found", tool_call_id="c0"),
+        tool_call_message("water", "c1"),
+        ToolMessage(content="water: found", tool_call_id="c1"),
+        HumanMessage(content="q2"),
+        tool_call_message("water", "c2"),
+        ToolMessage(content="water: found", tool_call_id="c2"),
+    ]
+
+    assert not is_tool_loop(messages)
+
+
+# SECTION: evaluate_arithmetic
+def test_evaluate_arithmetic():
+    assert evaluate_arithmetic("2 + 3") == 5
+    assert evaluate_arithmetic("4 * 5") == 20
+    assert evaluate_arithmetic("what is water?") is None
+    # NOTE: oversized operands are left to the LLM
+    assert evaluate_arithmetic("9" * 18 + " * " + "9" * 18) == (10**18 - 1) ** 2
+    assert evaluate_arithmetic("9" * 5000 + " + 1") is None
+
+
+# SECTION: graph
+def test_graph_stops_tool_loop():
+    llm = FakeToolModel(messages=(
+        tool_call_message("water", f"c{i}") for i in itertools.count()
+    ))
+    graph = build_react_graph(llm, [lookup])
+
+    result = asyncio.run(graph.ainvoke(
+        {"messages": [HumanMessage(content="find water")]},
+        config={"recursion_limit": 50}
+    ))
+
+    last_message = result["messages"][-1]
+    assert isinstance(last_message, ToolMessage)
+    assert last_message.content == TOOL_LOOP_ERROR
+
+
+def test_graph_arithmetic_shortcut():
+    llm = FakeToolModel(messages=iter([AIMessage(content="unused")]))
+    graph = build_react_graph(llm, [lookup], arithmetic_shortcut=True)
+
+    result = asyncio.run(graph.ainvoke(
+        {"messages": [HumanMessage(content="2 + 3")]}
+    ))
+
+    assert result["messages"][-1].content == "5"